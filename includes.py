@@ -1,17 +1,344 @@
 #!/usr/bin/env python3
 """Script to use UTL parser to print out include file trees for a given source file."""
 
-from pathlib import Path
+import json
+import os
+import sys
+from pathlib import Path, PurePosixPath
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import argparse
 # for docs only
 from argparse import Namespace  # pylint: disable=W0611
 
 from utl_lib.utl_yacc import UTLParser
 from utl_lib.handler_ast import UTLParseHandlerAST, UTLParseError
+from utl_lib.macro_index import MacroIndex, include_target
+from utl_lib.include_scan import IncludeScanner
 # for docs only
 from utl_lib.ast_node import ASTNode  # pylint: disable=W0611
 
+_WORKER = {}
+"The scanner and parser of a worker process started by :py:meth:`IncludeRegistry.expand`."
+
+
+def _start_worker(verbose, debug):
+    """Initializes a worker process with its own scanner and parser."""
+    _WORKER['scanner'] = IncludeScanner()
+    _WORKER['parser'] = None
+    _WORKER['verbose'] = verbose
+    _WORKER['debug'] = debug
+
+
+def _find_includes(disk_path, name):
+    """Finds the includes of one file, in a worker process.
+
+    :param str disk_path: The path of the file.
+
+    :param str name: The file name, for error messages.
+
+    :returns list: The included names, as from :py:meth:`FileWithIncludes.get_includes`; or
+        ``None`` if the file could not be parsed.
+
+    """
+    with open(disk_path, 'r') as textin:
+        program_text = textin.read()
+    included = _WORKER['scanner'].scan(program_text)
+    if included is not None:
+        return included
+    handlers = [UTLParseHandlerAST()]
+    if _WORKER['parser'] is None:
+        _WORKER['parser'] = UTLParser(handlers, _WORKER['verbose'])
+    else:
+        _WORKER['parser'].restart(handlers)
+    results = _WORKER['parser'].parse(program_text, debug=_WORKER['debug'], print_tokens=False,
+                                      filename=name)
+    if not results:
+        return None
+    return list(FileWithIncludes.get_includes(results))
+
+
+class IncludeDirectoryIndex(object):
+    """The files in the skin ``includes`` directories an include name can refer to, scanned
+    once so that finding an include file is a dictionary lookup, not a series of ``exists()``
+    calls.
+
+    The modification time of every directory scanned is kept; :py:meth:`refresh` rescans if
+    any of them has changed (or a missing directory has appeared). It is called at the start of
+    each report and each :py:meth:`IncludeRegistry.expand`, so lookups in between cost no
+    system calls.
+
+    :param list directories: ``(directory, source)`` pairs, highest precedence first. A name
+        found in more than one directory resolves to the first.
+
+    """
+    def __init__(self, directories):
+        self.directories = [(Path(directory), source) for directory, source in directories]
+        self._files = {}
+        self._mtimes = {}
+        self._scan()
+
+    @classmethod
+    def for_args(cls, args):
+        """Creates an index of the directories searched for the skins in `args`: the global
+        skin, then the custom application skin, then the certified application skin.
+
+        :param Namespace args: The command-line arguments collected by the
+            :py:mod:`argparse` parser.
+
+        """
+        directories = []
+        site_dir = Path(args.utl_path) / args.site_name
+        if args.global_skin:
+            directories.append((site_dir / "global_skins" / args.global_skin / "includes",
+                                "global"))
+        if args.skin:
+            directories.append((site_dir / "skins" / args.skin / "includes",
+                                "application (custom)"))
+            directories.append((Path(args.utl_path) / "certified/skins" / args.skin / "includes",
+                                "application (certified)"))
+        return cls(directories)
+
+    def _scan(self):
+        """Walks each directory with :py:func:`os.scandir`, recording files and mtimes.
+
+        Symbolic links are followed, as they would be by ``exists()``, except a link to a
+        directory the walk is already inside, so a link back to a parent doesn't loop. A
+        directory that can't be read, or disappears during the scan, is skipped.
+
+        """
+        self._files = {}
+        self._mtimes = {}
+        for directory, source in reversed(self.directories):
+            # lower precedence first, so higher precedence entries replace them
+            pending = [(str(directory), PurePosixPath(), frozenset())]
+            while pending:
+                dir_name, rel_dir, parents = pending.pop()
+                try:
+                    info = os.stat(dir_name)
+                except OSError:
+                    self._mtimes[dir_name] = None
+                    continue
+                self._mtimes[dir_name] = info.st_mtime_ns
+                dir_id = (info.st_dev, info.st_ino)
+                if dir_id in parents:
+                    continue
+                parents = parents | {dir_id}
+                try:
+                    with os.scandir(dir_name) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                pending.append((entry.path, rel_dir / entry.name, parents))
+                            else:
+                                self._files[str(rel_dir / entry.name)] = (Path(entry.path),
+                                                                          source)
+                except OSError:
+                    continue
+
+    def refresh(self):
+        """Rescans the directories if any has changed since the last scan.
+
+        :returns bool: ``True`` if the directories were rescanned.
+
+        """
+        for dir_name, mtime in self._mtimes.items():
+            try:
+                current = os.stat(dir_name).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                self._scan()
+                return True
+        return False
+
+    def lookup(self, name):
+        """Finds an include file.
+
+        :param str name: The file name, as in an include statement.
+
+        :returns tuple: The path of the file and where it was found (``'global'``,
+            ``'application (custom)'``, or ``'application (certified)'``); or ``(None, '')``
+            if it isn't in any of the directories.
+
+        """
+        return self._files.get(str(PurePosixPath(name)), (None, ''))
+
+    def __len__(self):
+        return len(self._files)
+
+
+class IncludeRegistry(object):
+    """All the files seen in one run, so that a file included from many places is parsed only
+    once, and the includes form a shared graph rather than a tree of copies.
+
+    Files are keyed by the resolved path they were found at; files that weren't found are
+    keyed by name. Includes are found with an :py:class:`~utl_lib.include_scan.IncludeScanner`
+    where possible; a single parser is reused for every file that has to be parsed. Include
+    files are found with one :py:class:`IncludeDirectoryIndex`.
+
+    If `args.db` names a :py:class:`~utl_lib.macro_index.MacroIndex` database, the includes of
+    files under `args.utl_path` are kept there, so later runs only parse files that changed.
+
+    :param Namespace args: The command-line arguments collected by the
+        :py:mod:`argparse` parser.
+
+    """
+    def __init__(self, args):
+        self.args = args
+        self._by_name = {}
+        self._by_path = {}
+        self._parser = None
+        self._scanner = IncludeScanner()
+        self.directory_index = IncludeDirectoryIndex.for_args(args)
+        db_file = getattr(args, 'db', None)
+        self.index = MacroIndex(db_file) if db_file else None
+
+    def cached_includes(self, disk_path):
+        """Looks up the names included by the file at `disk_path` in :py:attr:`index`, without
+        parsing it.
+
+        :returns tuple: A key for the file, to pass to :py:meth:`store_includes`; and the
+            included names, as from :py:meth:`FileWithIncludes.get_includes`, or ``None`` if
+            the index doesn't have them for the file's current contents. Both are ``None`` if
+            there is no index, or the file is not in the indexed tree.
+
+        """
+        if self.index is None:
+            return None, None
+        root = Path(self.args.utl_path).resolve()
+        try:
+            rel_path = disk_path.resolve().relative_to(root)
+        except ValueError:
+            return None, None
+        digest, included = self.index.current_includes(root, rel_path)
+        return (rel_path, digest), included
+
+    def store_includes(self, found):
+        """Stores includes found by scanning or parsing in :py:attr:`index`, if there is one,
+        so the next run doesn't have to find them again.
+
+        :param list found: ``(key, included)`` pairs: the key as from
+            :py:meth:`cached_includes` (pairs with a key of ``None`` are skipped), and the
+            included names.
+
+        """
+        found = [key + (included, ) for key, included in found if key is not None]
+        if found:
+            self.index.store_includes(Path(self.args.utl_path).resolve(), found)
+
+    def __len__(self):
+        return len(self._by_path)
+
+    def register(self, utl_file):
+        """Adds `utl_file` to the registry, unless a file at the same path is already there.
+
+        :param FileWithIncludes utl_file: A file.
+
+        :returns FileWithIncludes: The registered file for `utl_file`'s path.
+
+        """
+        disk_path = utl_file.disk_path
+        if disk_path is not None:
+            utl_file = self._by_path.setdefault(disk_path.resolve(), utl_file)
+        self._by_name.setdefault(str(utl_file.fname), utl_file)
+        return utl_file
+
+    def get(self, filename):
+        """Returns the file `filename`, creating it the first time it is asked for.
+
+        :param str filename: The file name, as in an include statement.
+
+        :returns FileWithIncludes: The file.
+
+        """
+        try:
+            return self._by_name[str(filename)]
+        except KeyError:
+            pass
+        utl_file = self.register(FileWithIncludes(filename, self.args, self))
+        # a different name may have resolved to the same file
+        self._by_name[str(filename)] = utl_file
+        return utl_file
+
+    def scan(self, program_text):
+        """Finds the literal includes in `program_text` without parsing it.
+
+        :returns list: The included names; or ``None`` if the file must be parsed.
+
+        """
+        return self._scanner.scan(program_text)
+
+    def expand(self, top_file, jobs=None, max_depth=None):
+        """Finds the includes of every file reachable from `top_file`, breadth first. Each
+        level of files not yet parsed is scanned or parsed by a pool of worker processes, and
+        the results added to the registry's files here.
+
+        Files that can't be parsed are left unparsed, so the error is raised where it would
+        have been without this, when their includes are asked for.
+
+        With an :py:attr:`index`, only files whose includes it has for their current contents
+        are taken from it; the rest go to the workers like any other file, and what they find
+        is stored in the index from this process.
+
+        :param FileWithIncludes top_file: The file to start from.
+
+        :param int jobs: The number of worker processes; ``None`` for one per CPU.
+
+        :param int max_depth: The deepest level of includes to find; ``None`` for no limit.
+
+        """
+        self.directory_index.refresh()
+        frontier = [top_file]
+        seen = {top_file}
+        depth = 0
+        with ProcessPoolExecutor(jobs, initializer=_start_worker,
+                                 initargs=(self.args.verbose, self.args.debug)) as executor:
+            while frontier and (max_depth is None or depth < max_depth):
+                to_parse = []
+                keys = []
+                for utl_file in frontier:
+                    if utl_file.is_parsed or not utl_file.disk_path:
+                        continue
+                    key, included = self.cached_includes(utl_file.disk_path)
+                    if included is None:
+                        to_parse.append(utl_file)
+                        keys.append(key)
+                    else:
+                        utl_file.set_included(included)
+                chunk_size = max(1, len(to_parse) // (4 * (jobs or os.cpu_count() or 1)))
+                results = executor.map(_find_includes,
+                                       [str(utl_file.disk_path) for utl_file in to_parse],
+                                       [utl_file.fname.name for utl_file in to_parse],
+                                       chunksize=chunk_size)
+                found = []
+                for utl_file, key, included in zip(to_parse, keys, results):
+                    if included is not None:
+                        utl_file.set_included(included)
+                        found.append((key, included))
+                self.store_includes(found)
+                next_frontier = []
+                for utl_file in frontier:
+                    for include in utl_file._included:  # pylint: disable=protected-access
+                        if include not in seen:
+                            seen.add(include)
+                            next_frontier.append(include)
+                frontier = next_frontier
+                depth += 1
+
+    def parse(self, program_text, filename):
+        """Parses `program_text`, reusing the parser from earlier files.
+
+        :returns ASTNode: The root of the parse tree, or ``None`` if the parse failed.
+
+        """
+        handlers = [UTLParseHandlerAST()]
+        if self._parser is None:
+            self._parser = UTLParser(handlers, self.args.verbose)
+        else:
+            self._parser.restart(handlers)
+        return self._parser.parse(program_text, debug=self.args.debug, print_tokens=False,
+                                  filename=filename)
+
 
 class FileWithIncludes(object):
     """A .utl file, which may include other UTL files.
@@ -24,8 +351,12 @@ class FileWithIncludes(object):
     :param Namespace args: The command-line arguments collected by the
         :py:mod:`argparse` parser.
 
+    :param IncludeRegistry registry: The files already seen in this run. If ``None``, a new
+        registry is started with this file, and this file is the top-level file: it may also
+        be found relative to the current directory.
+
     """
-    def __init__(self, filename, args):
+    def __init__(self, filename, args, registry=None):
         if hasattr(filename, "name"):
             self.fname = filename
         else:
@@ -35,6 +366,12 @@ class FileWithIncludes(object):
         self.is_parsed = False
         self._disk_path = None
         self._source = ""  # will get set by disk_path() if found
+        self.is_top_level = registry is None
+        if registry is None:
+            self.registry = IncludeRegistry(args)
+            self.registry.register(self)
+        else:
+            self.registry = registry
 
     @property
     def included(self):
@@ -63,11 +400,12 @@ class FileWithIncludes(object):
     def add(self, new_include):  # pylint: disable=W9003,W9004
         """Adds `new_include` to our list of included files.
 
-        :param (str or FileWithIncludes) new_include: the include file to add.
+        :param (str or FileWithIncludes) new_include: the include file to add. A name is
+            looked up in :py:attr:`registry`, so each file has one instance per run.
 
         """
         if not hasattr(new_include, 'included'):
-            new_include = FileWithIncludes(new_include, self.args)
+            new_include = self.registry.get(new_include)
         self._included.append(new_include)
 
     @classmethod
@@ -80,16 +418,10 @@ class FileWithIncludes(object):
             found. Files included more than once will occur in the sequence more than once.
 
         """
-        # it would, of course, be faster to do this as a loop.
-        if ast_node.symbol == 'include':
-            if ast_node.attributes["file"] != '<expr>':
-                yield ast_node.attributes["file"]
-            else:
-                # the include statement referenced a dynamic expression instead of a literal name
-                # we check for this string in is_expression(): if you change this, change that
-                yield 'expression: ' + str(ast_node.children[0])
-        for child_node in ast_node.children:
-            yield from cls.get_includes(child_node)
+        # an include of an expression is named 'expression: ...'; we check for this string in
+        # is_expression(): if you change this, change that
+        for include_node in ast_node.find_all('include'):
+            yield include_target(include_node)
 
     def do_parse(self, args, program_text=''):
         """Parse the file and get list of included files.
@@ -106,28 +438,39 @@ class FileWithIncludes(object):
         :raises UTLParseError: if the parse fails and returns nothing.
 
         """
-        # build AST tree for later processing
-        handlers = [UTLParseHandlerAST()]
-        myparser = UTLParser(handlers, args.verbose)
+        key = included = None
         if not program_text:
             if not self.disk_path:
                 raise FileNotFoundError(self.disk_path)
-            with self.disk_path.open('r') as textin:
-                program_text = textin.read()
-        results = myparser.parse(program_text, debug=args.debug, print_tokens=False,
-                                 filename=self.fname.name)
-        if results:
-            self.is_parsed = True
-            included = self.get_includes(results)
-            if args.norepeat:
-                new_included = OrderedDict()
-                for fname in included:
-                    new_included[fname] = None
-                included = [key for key in new_included]
-            for include in included:
-                self.add(include)
-        else:
-            raise UTLParseError('Parse FAILED: {}'.format(self.fname))
+            key, included = self.registry.cached_includes(self.disk_path)
+            if included is None:
+                with self.disk_path.open('r') as textin:
+                    program_text = textin.read()
+        if included is None:
+            included = self.registry.scan(program_text)
+            if included is None:
+                # includes of expressions, or something the scanner can't handle: build AST tree
+                results = self.registry.parse(program_text, self.fname.name)
+                if not results:
+                    raise UTLParseError('Parse FAILED: {}'.format(self.fname))
+                included = list(self.get_includes(results))
+            self.registry.store_includes([(key, included)])
+        self.set_included(included)
+
+    def set_included(self, included):
+        """Records the files this file includes, once it has been parsed.
+
+        :param iterable included: The included file names, as from :py:meth:`get_includes`.
+
+        """
+        self.is_parsed = True
+        if self.args.norepeat:
+            new_included = OrderedDict()
+            for fname in included:
+                new_included[fname] = None
+            included = [key for key in new_included]
+        for include in included:
+            self.add(include)
 
     @property
     def disk_path(self):
@@ -140,34 +483,11 @@ class FileWithIncludes(object):
             if self.is_expression:
                 # whoops, we're up a creek
                 return None
-            if self.fname.exists():
-                # generally only true for top-level file
+            if self.is_top_level and self.fname.exists():
                 self._disk_path = self.fname
                 return self._disk_path
-            # check for override in global skin
-            if self.args.global_skin:
-                the_file = (Path(self.args.utl_path) / Path(self.args.site_name) /
-                            Path("global_skins") / Path(self.args.global_skin) / Path("includes") /
-                            Path(self.fname))
-                if the_file.exists():
-                    self._disk_path = the_file
-                    self._source = "global"
-                    return self._disk_path
-            # now try the application skin
-
-            if self.args.skin:
-                the_file = (Path(self.args.utl_path) / Path(self.args.site_name) / Path("skins") /
-                            Path(self.args.skin) / Path('includes') / Path(self.fname))
-                if the_file.exists():
-                    self._source = "application (custom)"
-                    self._disk_path = the_file
-                    return self._disk_path
-                the_file = (Path(self.args.utl_path) / Path("certified/skins") /
-                            Path(self.args.skin) / Path('includes') / Path(self.fname))
-                if the_file.exists():
-                    self._source = "application (certified)"
-                    self._disk_path = the_file
-                    return self._disk_path
+            # global skin, then application skin; no file system access needed
+            self._disk_path, self._source = self.registry.directory_index.lookup(self.fname)
         return self._disk_path
 
     @property
@@ -175,31 +495,140 @@ class FileWithIncludes(object):
         """Returns ``True`` if this include file is named by an expression, not a literal string."""
         return self.fname.name.startswith('expression: ')
 
-    def display(self, initial_indent='', top_level=True):
+    def walk(self, max_depth=None):
+        """Traverses the includes from this file, depth first, with an explicit stack rather
+        than recursion, so deep trees don't approach the recursion limit. Files are parsed as
+        the traversal reaches them.
+
+        :param int max_depth: The deepest level of includes to follow, the files this file
+            includes being level 1; ``None`` for no limit.
+
+        :returns generator: ``(depth, utl_file, parent, cycle)`` tuples: one for this file
+            (depth 0, parent ``None``), then one for each include in report order. If a file
+            includes one of the files whose includes led to it, its entry has `cycle` set to
+            ``True`` and its includes are not followed.
+
+        """
+        # include files may have been added or removed since the directories were scanned
+        self.registry.directory_index.refresh()
+        yield 0, self, None, False
+        if max_depth == 0:
+            return
+        path = [self]
+        on_path = {self}
+        pending = [iter(self.included)]
+        while pending:
+            include = next(pending[-1], None)
+            if include is None:
+                pending.pop()
+                on_path.discard(path.pop())
+                continue
+            depth = len(pending)
+            if include in on_path:
+                yield depth, include, path[-1], True
+                continue
+            yield depth, include, path[-1], False
+            if max_depth is None or depth < max_depth:
+                path.append(include)
+                on_path.add(include)
+                pending.append(iter(include.included))
+
+    def display(self, initial_indent='', max_depth=None, out=None):
         """Display this file's name followed by an indented list of files it includes.
 
         :param str initial_indent: String to prepend to each output line.
 
-        :param bool top_level: If ``True``, prints a top-level header.
+        :param int max_depth: The deepest level of includes to show; ``None`` for no limit.
+
+        :param file out: Where to write; default is standard output.
 
         """
-        if top_level:
-            print("{}Included by {}{}:".format(initial_indent, self.fname,
-                                               " (repeats omitted)" if self.args.norepeat
-                                               else ""))
+        write_text(self.walk(max_depth), self.args, out or sys.stdout, initial_indent)
+
+
+def write_text(entries, args, out, initial_indent=''):
+    """Writes an include report as an indented list, one line at a time.
+
+    :param iterable entries: Entries from :py:meth:`FileWithIncludes.walk`.
+
+    :param Namespace args: The command-line arguments.
+
+    :param file out: Where to write.
+
+    :param str initial_indent: String to prepend to each output line.
+
+    """
+    indents = [initial_indent]
+    for depth, utl_file, parent, cycle in entries:
+        while len(indents) <= depth:
+            indents.append(indents[-1] + ' ' * 4)
+        if parent is None:
+            print("{}Included by {}{}:".format(indents[depth], utl_file.fname,
+                                               " (repeats omitted)" if args.norepeat else ""),
+                  file=out)
+        elif cycle:
+            print("{}{} (include cycle)".format(indents[depth], utl_file.fname), file=out)
         else:
             suffix = ''
-            if not self.disk_path and not self.args.nofilecheck and not self.is_expression:
+            if not utl_file.disk_path and not args.nofilecheck and not utl_file.is_expression:
                 suffix = " (not found)"
-            elif self.source:
-                suffix = " ({})".format(self.source)
+            elif utl_file.source:
+                suffix = " ({})".format(utl_file.source)
+            print("{}{}{}".format(indents[depth], utl_file.fname, suffix), file=out)
 
-            print("{}{}{}".format(initial_indent, self.fname, suffix))
 
-        if top_level or not (self.args.norecurse or self.args.nofilecheck):
-            new_indent = initial_indent + ' ' * 4
-            for include in self.included:
-                include.display(new_indent, False)
+def write_jsonl(entries, args, out):  # pylint: disable=unused-argument
+    """Writes an include report as JSON Lines: one object per entry, with the keys
+    ``depth``, ``file``, ``parent``, ``path`` (``null`` if the file wasn't found), ``source``,
+    and ``cycle``.
+
+    :param iterable entries: Entries from :py:meth:`FileWithIncludes.walk`.
+
+    :param Namespace args: The command-line arguments.
+
+    :param file out: Where to write.
+
+    """
+    for depth, utl_file, parent, cycle in entries:
+        disk_path = utl_file.disk_path
+        out.write(json.dumps({"depth": depth, "file": str(utl_file.fname),
+                              "parent": None if parent is None else str(parent.fname),
+                              "path": None if disk_path is None else str(disk_path),
+                              "source": utl_file.source, "cycle": cycle}) + '\n')
+
+
+def write_dot(entries, args, out):  # pylint: disable=unused-argument
+    """Writes an include report as a Graphviz DOT graph. Each file is one node, and each
+    include one edge, however many times they occur in the report. Files that weren't found
+    are dashed, and includes that complete a cycle are red.
+
+    :param iterable entries: Entries from :py:meth:`FileWithIncludes.walk`.
+
+    :param Namespace args: The command-line arguments.
+
+    :param file out: Where to write.
+
+    """
+    nodes = set()
+    edges = set()
+    out.write('digraph includes {\n')
+    for _, utl_file, parent, cycle in entries:
+        node = json.dumps(str(utl_file.fname))
+        if node not in nodes:
+            nodes.add(node)
+            style = ' [style=dashed]' if utl_file.disk_path is None else ''
+            out.write('    {}{};\n'.format(node, style))
+        if parent is not None:
+            edge = (json.dumps(str(parent.fname)), node)
+            if edge not in edges:
+                edges.add(edge)
+                out.write('    {} -> {}{};\n'.format(edge[0], node,
+                                                     ' [color=red]' if cycle else ''))
+    out.write('}\n')
+
+
+WRITERS = {'text': write_text, 'jsonl': write_jsonl, 'dot': write_dot}
+"Functions to write an include report, by ``--format`` name."
 
 
 def get_args():
@@ -214,17 +643,30 @@ def get_args():
                         help="The site name under which to store customized packages.")
     parser.add_argument('utl_path', type=str,
                         help="The top-level directory of the collection of UTL files to be parsed.")
-    parser.add_argument('utl_file', type=argparse.FileType('r'),
+    parser.add_argument('utl_file', type=argparse.FileType('r'), nargs='?',
                         help="The UTL template file whose dependencies are reported.")
+    parser.add_argument('--db', type=str,
+                        help="A macro index database (see index_macros.py) in which to keep "
+                        "the includes of each file, so unchanged files aren't parsed again.")
+    parser.add_argument('--included_by', type=str, metavar='INCLUDE',
+                        help="Instead of reporting includes, list the templates of the site's "
+                        "global skin and application skin that include INCLUDE, directly or "
+                        "indirectly. Requires --db, and a tree indexed by index_macros.py.")
     parser.add_argument('--verbose', action='store_true',
                         help="Enable output about conflicts, and create parser.out file.")
     parser.add_argument('--norepeat', action='store_true',
                         help="Report each file only on the first include (otherwise reports all)")
     parser.add_argument('--norecurse', action='store_true',
-                        help="Report only files directly included into utl_file")
+                        help="Report only files directly included into utl_file (same as "
+                        "--max_depth 1)")
+    parser.add_argument('--max_depth', type=int, default=None,
+                        help="Report includes only to this many levels below utl_file.")
     parser.add_argument('--nofilecheck', action='store_true',
                         help=("Omit usual attempt to verify include file exists"
                               " (implies --norecurse)"))
+    parser.add_argument('--format', choices=sorted(WRITERS), default='text',
+                        help="Write the report as an indented list (the default), JSON Lines, "
+                        "or a Graphviz DOT graph.")
     parser.add_argument('--global_skin', type=str,
                         help="Name of the global skin (to check for site override)")
     parser.add_argument('--skin', type=str,
@@ -233,18 +675,46 @@ def get_args():
     # TODO: Fix --skin so it takes the skin name displayed in TN URL map
     parser.add_argument('--debug', action='store_true',
                         help="Print grungy parsing details.")
-    return parser.parse_args()
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="The number of processes to parse include files with (default: "
+                        "one per CPU). With 1, files are parsed one at a time as the report "
+                        "reaches them.")
+    parsed = parser.parse_args()
+    if parsed.included_by and not parsed.db:
+        parser.error("--included_by requires --db")
+    if parsed.max_depth is not None and parsed.max_depth < 0:
+        parser.error("--max_depth can't be negative")
+    if parsed.jobs is not None and parsed.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if not (parsed.utl_file or parsed.included_by):
+        parser.error("utl_file is required")
+    return parsed
 
 
 def main(args):
-    """Main function. Creates an instance of :py:class:`FileWithIncludes`, displays it.
+    """Main function. Creates an instance of :py:class:`FileWithIncludes`, displays it. Or,
+    lists the templates which include a file.
 
     :param Namespace args: parsed command-line arguments.
 
     """
+    if args.included_by:
+        with MacroIndex(args.db) as index:
+            templates = index.templates_including(args.included_by, args.site_name,
+                                                  args.global_skin, args.skin)
+        print("Templates including {}:".format(args.included_by))
+        for template in templates:
+            print("    {}".format(template))
+        return
+
+    max_depth = args.max_depth
+    if args.norecurse or args.nofilecheck:
+        max_depth = 1 if max_depth is None else min(max_depth, 1)
     utl = FileWithIncludes(args.utl_file.name, args)
+    if args.jobs != 1 and (max_depth is None or max_depth > 1):
+        utl.registry.expand(utl, args.jobs, max_depth)
 
-    utl.display()
+    WRITERS[args.format](utl.walk(max_depth), args, sys.stdout)
 
 
 if __name__ == '__main__':
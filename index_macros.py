@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to index the macros in a tree of UTL files (as written by
+:py:mod:`unpack_zip_files`), and look up where macros are defined and called.
+
+The index is kept in an SQLite database, by default ``macro_index.sqlite3`` at the top of the
+tree. Running the script again only re-parses files that have changed.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import sys
+import argparse
+from pathlib import Path
+
+from utl_lib.macro_index import TIERS, MacroIndex
+from utl_lib.macro_search import MacroNameIndex
+
+DEFAULT_DB_NAME = 'macro_index.sqlite3'
+
+
+def get_args():
+    """Parses command-line arguments, returns namespace with values."""
+    parser = argparse.ArgumentParser(
+        description="Indexes macro definitions and calls in a tree of UTL files.")
+    parser.add_argument('export_dir', type=str,
+                        help="The top-level directory of the exported UTL files.")
+    parser.add_argument('--db', type=str,
+                        help="The index database (default: {} in export_dir)"
+                        "".format(DEFAULT_DB_NAME))
+    parser.add_argument('--find', type=str, metavar='MACRO',
+                        help="Print definitions and calls of MACRO instead of indexing.")
+    parser.add_argument('--site', type=str,
+                        help="With --find, the site whose skins are used to pick the "
+                        "definition that wins.")
+    parser.add_argument('--global_skin', type=str, default='',
+                        help="With --site, the name of the site's global skin.")
+    parser.add_argument('--skin', type=str, default='',
+                        help="With --site, the name of the application skin (ex. "
+                        "'editorial/editorial-core-base_1.54.0.0')")
+    parser.add_argument('--search', type=str, metavar='TEXT',
+                        help="Print macro names starting with, or close to, TEXT.")
+    parser.add_argument('--export', type=str, metavar='PREFIX',
+                        help="Write all macros to PREFIX.macros.jsonl and all calls to "
+                        "PREFIX.calls.jsonl, as JSON Lines, instead of indexing.")
+    parser.add_argument('--verbose', action='store_true',
+                        help="Print the name of each file as it is indexed.")
+    parsed = parser.parse_args()
+    parsed.export_dir = Path(parsed.export_dir)
+    if not parsed.export_dir.is_dir():
+        sys.stderr.write("{} not found, or is not a directory.\n".format(parsed.export_dir))
+        sys.exit(1)
+    if parsed.db is None:
+        parsed.db = parsed.export_dir / DEFAULT_DB_NAME
+    return parsed
+
+
+def find(index, macro_name, skins=None):
+    """Prints the definitions and calls of a macro.
+
+    :param MacroIndex index: The macro index.
+
+    :param str macro_name: The name of the macro.
+
+    :param tuple skins: The site, global skin, and application skin used to pick the winning
+        definition; or ``None``.
+
+    """
+    defns = index.definitions(macro_name)
+    if defns:
+        print("-- DEFINED --")
+        for defn in defns:
+            print("    {}:{}  {}({})".format(
+                defn["path"], defn["line"], defn["name"], defn["params"] or ''))
+    else:
+        print("{}: no definition found.".format(macro_name))
+    if skins is not None:
+        winner = index.resolutions(*skins).get(macro_name)
+        if winner:
+            print("-- RESOLVES TO --")
+            print("    {}:{}  ({})".format(winner["path"], winner["line"],
+                                           TIERS[winner["tier"]]))
+        else:
+            print("{}: not defined in the skins of {}.".format(macro_name, skins[0]))
+    calls = index.calls(macro_name)
+    if calls:
+        print("-- CALLED --")
+        for call in calls:
+            print("    {}:{}".format(call["path"], call["line"]))
+
+
+def search(index, text):
+    """Prints the names of macros matching `text` by prefix or with typos.
+
+    :param MacroIndex index: The macro index.
+
+    :param str text: Part of a macro name.
+
+    """
+    names = MacroNameIndex(index.macro_names()).search(text)
+    if names:
+        for name in names:
+            print("    {}".format(name))
+    else:
+        print("{}: no matching macro names.".format(text))
+
+
+def export(index, prefix):
+    """Writes all macros and calls in the index as JSON Lines.
+
+    :param MacroIndex index: The macro index.
+
+    :param str prefix: The start of the output file names.
+
+    """
+    with open(prefix + '.macros.jsonl', 'w') as macro_out, \
+            open(prefix + '.calls.jsonl', 'w') as call_out:
+        macros, calls = index.write_jsonl(macro_out, call_out)
+    print("Wrote {:,} macros and {:,} calls.".format(macros, calls))
+
+
+def main(args):
+    """Main function. Updates the index, or looks up a macro.
+
+    :param argparse.Namespace args: The parsed command-line arguments.
+
+    """
+    with MacroIndex(args.db) as index:
+        if args.find:
+            find(index, args.find,
+                 (args.site, args.global_skin, args.skin) if args.site else None)
+        elif args.search:
+            search(index, args.search)
+        elif args.export:
+            export(index, args.export)
+        else:
+            parsed, unchanged, removed = index.index_tree(args.export_dir, args.verbose)
+            print("Indexed {:,} files ({:,} unchanged, {:,} removed).".format(parsed, unchanged,
+                                                                              removed))
+            for path in index.failed_files():
+                print("    could not parse {}".format(path))
+
+
+if __name__ == '__main__':
+    main(get_args())
@@ -22,6 +22,8 @@ def get_args():
                         help="Print debugging info of parse process.")
     parser.add_argument('--json', action='store_true',
                         help="Format output as JSON (default: human-readable)")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Indent JSON output (implies --json)")
     parser.add_argument('--ast', action='store_true',
                         help="Generate an Abstract Syntax Tree (default: parse tree)")
     parser.add_argument('--print', action='store_true',
@@ -51,7 +53,11 @@ def do_parse(program_file, args):
     results = myparser.parse(program_text, debug=args.debug, print_tokens=args.show_lex,
                              filename=os.path.basename(program_file.name))
     if results:
-        print(results.json_format() if args.json else results.format())
+        if args.json or args.pretty:
+            results.write_json(sys.stdout, args.pretty)
+        else:
+            results.write_format(sys.stdout)
+        sys.stdout.write('\n')
     elif not args.printonly:
         sys.stderr.write('Parse FAILED!\n')
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to run an HTTP service that looks up macro definitions and calls, using an index
+built by :py:mod:`index_macros`. See :py:mod:`utl_lib.macro_server` for the requests served.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import sys
+import argparse
+from pathlib import Path
+
+from utl_lib.macro_index import MacroIndex
+from utl_lib.macro_server import MacroLookupServer
+
+
+def get_args():
+    """Parses command-line arguments, returns namespace with values."""
+    parser = argparse.ArgumentParser(
+        description="Serves macro definitions and calls from a macro index.")
+    parser.add_argument('db', type=str,
+                        help="The index database written by index_macros.py.")
+    parser.add_argument('--host', type=str, default='localhost',
+                        help="The address to listen on (default: localhost)")
+    parser.add_argument('--port', type=int, default=8080,
+                        help="The port to listen on (default: 8080)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="Don't log each request.")
+    parsed = parser.parse_args()
+    if not Path(parsed.db).is_file():
+        sys.stderr.write("{} not found, or is not a file.\n".format(parsed.db))
+        sys.exit(1)
+    return parsed
+
+
+def main(args):
+    """Main function. Loads the index, serves requests until interrupted.
+
+    :param argparse.Namespace args: The parsed command-line arguments.
+
+    """
+    with MacroIndex(args.db) as index:
+        xref = index.load_xref()
+    print("Loaded {:,} macros and {:,} calls.".format(len(xref.macros), len(xref.references)))
+    server = MacroLookupServer((args.host, args.port), xref, args.quiet)
+    print("Serving on http://{}:{}/".format(*server.server_address[:2]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main(get_args())
@@ -14,8 +14,13 @@ section from the Design/Templates editor: global\\_, skin\\_, component\\_, bloc
 * component_(library_name).zip
 * block_(block_name).zip
 
-The version info, etc. is in within the .zip file so we unzip to a temporary location, then set
-up the destination directory, then unzip to there
+The version info, etc. is in within the .zip file, so we read the package's metadata files
+straight from the archive, set up the destination directory, then extract the archive to there.
+
+With ``--all_sites``, the exports of every site are unpacked in one run, and with ``--jobs``
+several archives are read and extracted at once (see :py:func:`unpack_sites`). Archives whose
+size and contents are as recorded in the site metadata when they were last unpacked are
+skipped, unless ``--force`` is given.
 
 #######################
 Destination Directories
@@ -71,14 +76,19 @@ Types And Functions
 ###################
 
 """
+import os
 import sys
 import warnings
 import argparse
-import subprocess
+import zipfile
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from shutil import rmtree
 
 from utl_lib.tn_package import TNPackage, PackageError
 from utl_lib.tn_site import TNSiteMeta
+from utl_lib.package_store import PackageStore
 
 try:
     from pathlib import Path
@@ -100,8 +110,9 @@ def get_args() -> argparse.Namespace:
     mydesc = ("Writes the contents of a group of ZIP files to a standard directory structure "
               "for Townnews template exports.")
     parser = argparse.ArgumentParser(description=mydesc)
-    parser.add_argument('site', type=str,
-                        help="The site name (or name of directory for custom packages)")
+    parser.add_argument('site', type=str, nargs='?',
+                        help="The site name (or name of directory for custom packages); "
+                        "omitted with --all_sites")
     parser.add_argument('source_dir', type=str,
                         help="The directory containing source ZIP files.")
     parser.add_argument('dest_dir', type=str,
@@ -109,7 +120,19 @@ def get_args() -> argparse.Namespace:
     parser.add_argument('--overwrite', action='store_true',
                         help="Replace contents if destination directory exists "
                         "(default: exit w/error)")
+    parser.add_argument('--all_sites', action='store_true',
+                        help="source_dir holds a subdirectory of ZIP files for each site, "
+                        "named for the site; unpack them all.")
+    parser.add_argument('--force', action='store_true',
+                        help="Unpack every ZIP file, even those unchanged since they were last "
+                        "unpacked.")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="The number of ZIP files to read and extract at once (default 1).")
     parsed = parser.parse_args()
+    if parsed.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if parsed.site is None and not parsed.all_sites:
+        parser.error("the site name is required unless --all_sites is given")
     parsed.source_dir = Path(parsed.source_dir)
     parsed.dest_dir = Path(parsed.dest_dir)
     if not parsed.source_dir.is_dir():
@@ -121,39 +144,15 @@ def get_args() -> argparse.Namespace:
     return parsed
 
 
+STORE_DIR = Path('.package_store')
+"Where the contents of certified packages are kept, relative to the destination directory."
+
+
 class BadPackageError(PackageError):
     """Raised when important package information is invalid or missing."""
     pass
 
 
-def mktmpdir() -> Path:
-    """Create an empty temporary directory.
-
-    :returns: Name of the created directory.
-    :rtype: Path
-
-    """
-    args = ['mktemp', '-d', 'utl_indexer_XXXXXX', '-t']
-    # run mktemp, get printed name, convert to Unicode and remove trailing '\n'
-    return Path(subprocess.check_output(args).decode()[:-1])
-
-
-def unzip_file(filename: Path, parent_dir: Path):
-    """Unzip file to a temporary directory.
-
-    :param pathlib.Path filename: The name of the ZIP file.
-
-    :param pathlib.Path parent_dir: The directory to receive the contents of `filename`.
-
-    """
-    # Usage: unzip [-Z] [-opts[modifiers]] file[.zip] [list] [-x xlist] [-d exdir]
-    # -d  extract files into exdir
-    # -q  quiet mode (-qq => quieter)
-    # -a  auto-convert any text files
-    args = ['unzip', '-d', str(parent_dir), '-q', str(filename)]
-    subprocess.check_call(args)
-
-
 # pylint: disable=W0613, R0913
 def showwarning(message, category, filename, lineno, file=None, line=None):
     """Hook to write a warning to a file; override of :py:func:`warnings.showwarning`
@@ -185,44 +184,216 @@ def showwarning(message, category, filename, lineno, file=None, line=None):
 warnings.showwarning = showwarning
 
 
-def main(args: argparse.Namespace):
-    """Unzip each file, placing contents in desired directory structure.
+def zip_fingerprint(archive: zipfile.ZipFile, zip_stat: os.stat_result) -> dict:
+    """Identifies the contents of an export file cheaply: by its size and modification time,
+    and a CRC of the names, CRCs and sizes in its central directory (so no file in it is
+    decompressed).
 
-    :param argparse.Namespace args: The parsed command-line arguments.
+    :param zipfile.ZipFile archive: The export file, open.
+
+    :param os.stat_result zip_stat: The result of ``stat()`` on the file.
+
+    :returns dict: The ``size``, ``mtime`` (in nanoseconds), and ``crc``.
 
     """
-    site_meta = TNSiteMeta(args.site, args.dest_dir / args.site)
+    crc = 0
+    for info in archive.infolist():
+        entry = '{}\0{}\0{}\n'.format(info.filename, info.CRC, info.file_size)
+        crc = zlib.crc32(entry.encode('utf-8'), crc)
+    return {"size": zip_stat.st_size, "mtime": zip_stat.st_mtime_ns, "crc": crc}
+
+
+def read_package(zip_file: Path, site: str, recorded: dict = None,
+                 dest_dir: Path = None):
+    """Reads the package information from an export file, unless the file is unchanged since
+    it was last unpacked. Run in a worker thread.
+
+    The file is unchanged if the package directory recorded for it still exists, and either
+    its size and modification time, or its size and the CRC of its central directory, are as
+    recorded (see :py:func:`zip_fingerprint`).
+
+    :param pathlib.Path zip_file: The export file.
+
+    :param str site: The site the file was exported from.
+
+    :param dict recorded: What the site metadata recorded about the file when it was last
+        unpacked, if anything.
+
+    :param pathlib.Path dest_dir: The directory the package was unpacked under.
+
+    :returns tuple: The package and the file's fingerprint. The package is ``None`` if the
+        file is unchanged, or if it couldn't be read (and then so is the fingerprint).
+
+    """
+    zip_stat = zip_file.stat()
+    previous = None
+    if recorded is not None and (dest_dir / recorded["install_dir"]).is_dir():
+        previous = recorded["fingerprint"]
+        if (previous["size"], previous["mtime"]) == (zip_stat.st_size, zip_stat.st_mtime_ns):
+            return None, previous
     try:
-        for zip_file in Path(args.source_dir).glob('*.zip'):
-            tmp_dir = mktmpdir()
-            try:
-                unzip_file(zip_file, tmp_dir)
-                try:
-                    tmp_pkg = TNPackage.load_from(tmp_dir, zip_file, args.site)
-                except PackageError:
-                    warnings.warn("Unable to load '{}'.".format(zip_file))
-                else:
-                    new_parent = args.dest_dir / tmp_pkg.install_dir
-                    if new_parent.exists():
-                        if args.overwrite:
-                            rmtree(str(new_parent))
-                        else:
-                            sys.stderr.write("Won't overwrite existing directory '{}'.\n"
-                                             "".format(new_parent))
-                            continue
+        with zipfile.ZipFile(str(zip_file)) as archive:
+            fingerprint = zip_fingerprint(archive, zip_stat)
+            if previous is not None and \
+               (previous["size"], previous["crc"]) == (fingerprint["size"], fingerprint["crc"]):
+                return None, fingerprint
+            return TNPackage.load_from_zip(archive, site), fingerprint
+    except (zipfile.BadZipFile, PackageError):
+        warnings.warn("Unable to load '{}'.".format(zip_file))
+        return None, None
+
+
+def extract_package(zip_file: Path, new_parent: Path, install_dir: Path, store=None):
+    """Extracts an export file into its (existing, empty) directory. Run in a worker thread.
+
+    :param pathlib.Path zip_file: The export file.
+
+    :param pathlib.Path new_parent: The package directory.
+
+    :param pathlib.Path install_dir: The package directory, relative to the destination.
+
+    :param PackageStore store: If given, the package's files are linked from the store
+        (storing them first if need be) instead of being extracted.
+
+    """
+    with zipfile.ZipFile(str(zip_file)) as archive:
+        if store is None:
+            archive.extractall(str(new_parent))
+        else:
+            store.install(archive, install_dir, new_parent)
+
+
+def package_meta(pkg: TNPackage, zip_file: Path, fingerprint: dict) -> dict:
+    """:returns dict: The information about a package recorded in the site metadata."""
+    return {"version": pkg.version,
+            "certified": "Y" if pkg.is_certified else "N",
+            "last_download": zip_file.stat().st_ctime,
+            "zip_name": zip_file.name,
+            "install_dir": pkg.install_dir.as_posix(),
+            "fingerprint": fingerprint, }
+
+
+def recorded_zips(site_meta: TNSiteMeta) -> dict:
+    """:returns dict: ``(package name, metadata)`` for the packages in `site_meta` which have
+    fingerprints, keyed by ZIP file name.
+
+    """
+    return {meta["zip_name"]: (name, meta) for name, meta in site_meta.data.items()
+            if isinstance(meta, dict) and "fingerprint" in meta and "install_dir" in meta}
+
+
+def unpack_sites(site_sources: list, dest_dir: Path, overwrite=False, jobs=1, force=False):
+    """Unpack the export files of one or more sites, placing contents in the desired directory
+    structure.
+
+    A pool of `jobs` threads reads the package information from every file, then, once the
+    destination of each package is settled here, extracts them. Worker threads only return
+    results; everything else, including the site metadata, is done here in the order of the
+    sites and (sorted) file names, so the results don't depend on which thread finishes first.
+    A package in more than one export file (a certified package used by several sites, say) is
+    extracted once, from the first, and recorded for every site.
+
+    Certified packages are built from a :py:class:`~utl_lib.package_store.PackageStore` in
+    `dest_dir`/:py:data:`STORE_DIR`, so their files are written once however many sites and
+    versions share them. A certified package directory which already exists, and which the
+    store has a manifest for, is left alone and recorded for the site even without
+    `overwrite`.
+
+    Export files which haven't changed since they were last unpacked (see
+    :py:func:`read_package`) are skipped.
+
+    :param list site_sources: ``(site name, directory of ZIP files)`` pairs.
+
+    :param pathlib.Path dest_dir: The directory under which the new directories are created.
+
+    :param bool overwrite: If ``True``, replace package directories which already exist;
+        otherwise skip those packages.
+
+    :param int jobs: The number of worker threads.
+
+    :param bool force: If ``True``, unpack every file, changed or not.
+
+    """
+    work = [(site, zip_file) for site, source_dir in site_sources
+            for zip_file in sorted(Path(source_dir).glob('*.zip'))]
+    site_metas = OrderedDict((site, TNSiteMeta(site, dest_dir / site))
+                             for site, _ in site_sources)
+    previous = [None if force else recorded_zips(site_metas[site]).get(zip_file.name)
+                for site, zip_file in work]
+    extracted = OrderedDict()
+    "Extraction futures, by package directory."
+    store = PackageStore(dest_dir / STORE_DIR)
+    already_there = Future()
+    already_there.set_result(None)
+    try:
+        with ThreadPoolExecutor(jobs) as executor:
+            results = executor.map(read_package, [zip_file for _, zip_file in work],
+                                   [site for site, _ in work],
+                                   [entry and entry[1] for entry in previous],
+                                   [dest_dir] * len(work))
+            unpacked = []
+            unchanged = 0
+            for (site, zip_file), (pkg, fingerprint), entry in zip(work, results, previous):
+                if pkg is None:
+                    if fingerprint is not None:
+                        unchanged += 1
+                        name, meta = entry
+                        if fingerprint != meta["fingerprint"]:
+                            # touched, but the same contents
+                            site_metas[site].add(name, dict(meta, fingerprint=fingerprint))
+                    continue
+                new_parent = dest_dir / pkg.install_dir
+                if new_parent not in extracted and new_parent.exists():
+                    if pkg.is_certified and not overwrite and \
+                       store.load_manifest(pkg.install_dir) is not None:
+                        # certified, so the same as the package already there
+                        extracted[new_parent] = already_there
+                    elif overwrite:
+                        rmtree(str(new_parent))
+                    else:
+                        sys.stderr.write("Won't overwrite existing directory '{}'.\n"
+                                         "".format(new_parent))
+                        continue
+                if new_parent not in extracted:
                     print("Creating {}".format(new_parent))
                     new_parent.mkdir(parents=True)
-                    unzip_file(zip_file, new_parent)
-                    zip_file_time = zip_file.stat().st_ctime
-                    site_meta.add(tmp_pkg.name, {"version": tmp_pkg.version,
-                                                 "certified": "Y" if tmp_pkg.is_certified else "N",
-                                                 "last_download": zip_file_time,
-                                                 "zip_name": zip_file.name, })
-            finally:
-                rmtree(str(tmp_dir))
+                    extracted[new_parent] = executor.submit(
+                        extract_package, zip_file, new_parent, pkg.install_dir,
+                        store if pkg.is_certified else None)
+                unpacked.append((site, zip_file, pkg, fingerprint, extracted[new_parent]))
+            if unchanged:
+                print("Skipped {} unchanged ZIP file{}.".format(
+                    unchanged, '' if unchanged == 1 else 's'))
+            failure = None
+            for site, zip_file, pkg, fingerprint, future in unpacked:
+                try:
+                    future.result()
+                except Exception as err:  # pylint: disable=broad-except
+                    failure = failure or err
+                else:
+                    site_metas[site].add(pkg.name, package_meta(pkg, zip_file, fingerprint))
+            if failure is not None:
+                raise failure
     finally:
         # we want to record versions for those ZIPs successfully unpacked, even if one failed
-        site_meta.save()
+        for site_meta in site_metas.values():
+            # a site with only certified packages has no directory of its own yet
+            site_meta.parent.mkdir(parents=True, exist_ok=True)
+            site_meta.save()
+
+
+def main(args: argparse.Namespace):
+    """Unzip each file, placing contents in desired directory structure.
+
+    :param argparse.Namespace args: The parsed command-line arguments.
+
+    """
+    if args.all_sites:
+        site_sources = [(site_dir.name, site_dir)
+                        for site_dir in sorted(args.source_dir.iterdir()) if site_dir.is_dir()]
+    else:
+        site_sources = [(args.site, args.source_dir)]
+    unpack_sites(site_sources, args.dest_dir, args.overwrite, args.jobs, args.force)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A compact binary file format for :py:class:`~utl_lib.ast_node.ASTNode` trees.
+
+Saving a parse lets it be re-opened later without running the parser again. The file holds a
+table of all the strings in the tree (symbols, attribute names and string values, each stored
+once), followed by the nodes in :py:meth:`~utl_lib.ast_node.ASTNode.walk` order, followed by an
+index of node positions by symbol.
+
+Each node record stores the offset of the end of its subtree, so a reader can skip over
+subtrees it doesn't need. :py:func:`load` only reads the string table and the index; nodes are
+decoded into :py:class:`~utl_lib.ast_node.ASTNode` objects on request, either the whole tree
+(:py:attr:`BinaryAST.root`) or just the subtrees for one symbol
+(:py:meth:`BinaryAST.find_all`).
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import struct
+from typing import Any, BinaryIO, List, Mapping, Optional, Sequence, Tuple, Union
+
+from utl_lib.ast_node import ASTNode
+
+MAGIC = b'UTLAST\x00\x01'
+"Identifies a binary AST file, and the version of the format."
+
+# string count, offset of nodes, offset of symbol index
+_HEADER = struct.Struct('<III')
+# symbol string id, end of subtree, attribute count, child count
+_NODE = struct.Struct('<IIHI')
+_UINT = struct.Struct('<I')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+
+# attribute value type tags
+_STR, _INT_TAG, _BIGINT, _FLOAT_TAG, _TRUE, _FALSE, _NONE, _NODE_TAG = b'sibfTFNn'
+
+
+class ASTBinaryError(Exception):
+    """Raised when a file is not a valid binary AST file, or a tree can't be saved."""
+    pass
+
+
+class _Writer(object):
+    """Helper to build the binary form of a tree in memory.
+
+    :param (ASTNode or FrozenASTNode) root: The root of the tree to be written.
+
+    """
+
+    def __init__(self, root: Any) -> None:
+        self.strings = {}
+        self.nodes = bytearray()
+        self.index = {}
+        self._write_nodes(root)
+
+    def _string_id(self, value: str) -> int:
+        try:
+            return self.strings[value]
+        except KeyError:
+            self.strings[value] = len(self.strings)
+            return self.strings[value]
+
+    def _attribute(self, key: str, value: Any) -> Tuple[bytes, Optional[Any]]:
+        """Encodes an attribute.
+
+        :returns tuple: The encoded `key` and `value`, and ``None``; or, if `value` is a node,
+            the encoded key and `value` itself, which is written next.
+
+        """
+        prefix = _UINT.pack(self._string_id(key))
+        if isinstance(value, bool):
+            return prefix + bytes((_TRUE if value else _FALSE, )), None
+        if isinstance(value, int):
+            if -2**63 <= value < 2**63:
+                return prefix + bytes((_INT_TAG, )) + _INT.pack(value), None
+            return prefix + bytes((_BIGINT, )) + _UINT.pack(self._string_id(str(value))), None
+        if isinstance(value, float):
+            return prefix + bytes((_FLOAT_TAG, )) + _FLOAT.pack(value), None
+        if isinstance(value, str):
+            return prefix + bytes((_STR, )) + _UINT.pack(self._string_id(value)), None
+        if value is None:
+            return prefix + bytes((_NONE, )), None
+        if hasattr(value, 'symbol') and hasattr(value, 'children'):
+            return prefix + bytes((_NODE_TAG, )), value
+        raise ASTBinaryError("Can't save attribute {} of type {}".format(key, type(value)))
+
+    def _write_nodes(self, root: Any) -> None:
+        """Writes the tree rooted at `root`. An explicit stack is used so deep trees don't hit
+        the recursion limit. Stack items are bytes to be written, ``(node, indexed)`` pairs, or
+        the offset of a node whose subtree end needs to be filled in.
+
+        """
+        out = self.nodes
+        stack = [(root, True)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, bytes):
+                out += item
+            elif isinstance(item, int):
+                # offsets are relative to the start of the nodes
+                _UINT.pack_into(out, item + 4, len(out))
+            else:
+                node, indexed = item
+                offset = len(out)
+                if indexed:
+                    # nodes in attributes aren't part of walk() order, so don't index them
+                    self.index.setdefault(self._string_id(node.symbol), []).append(offset)
+                out += _NODE.pack(self._string_id(node.symbol), 0, len(node.attributes),
+                                  len(node.children))
+                pending = []
+                for key, value in node.attributes.items():
+                    encoded, value_node = self._attribute(key, value)
+                    pending.append(encoded)
+                    if value_node is not None:
+                        pending.append((value_node, False))
+                pending.extend((child, indexed) for child in node.children)
+                pending.append(offset)
+                stack.extend(reversed(pending))
+
+    def save(self, stream: BinaryIO) -> None:
+        """Writes the file to `stream`."""
+        string_table = bytearray()
+        for value in self.strings:  # dict preserves order of ids
+            encoded = value.encode('utf-8')
+            string_table += _UINT.pack(len(encoded))
+            string_table += encoded
+        nodes_offset = len(MAGIC) + _HEADER.size + len(string_table)
+        index = bytearray(_UINT.pack(len(self.index)))
+        for symbol_id, offsets in self.index.items():
+            index += _UINT.pack(symbol_id) + _UINT.pack(len(offsets))
+            for offset in offsets:
+                index += _UINT.pack(offset)
+        stream.write(MAGIC)
+        stream.write(_HEADER.pack(len(self.strings), nodes_offset,
+                                  nodes_offset + len(self.nodes)))
+        stream.write(string_table)
+        stream.write(self.nodes)
+        stream.write(index)
+
+
+class BinaryAST(object):
+    """A tree read from a binary AST file. Nodes are decoded only when asked for.
+
+    Usually created by :py:func:`load`.
+
+    :param bytes data: The contents of a file written by :py:func:`save`.
+
+    :raises ASTBinaryError: if `data` is not in the expected format.
+
+    """
+
+    def __init__(self, data: bytes) -> None:
+        if data[:len(MAGIC)] != MAGIC:
+            raise ASTBinaryError('Not a binary AST file.')
+        try:
+            count, nodes_offset, index_offset = _HEADER.unpack_from(data, len(MAGIC))
+            pos = len(MAGIC) + _HEADER.size
+            self.strings = []
+            for _ in range(count):
+                length = _UINT.unpack_from(data, pos)[0]
+                pos += 4
+                self.strings.append(data[pos:pos + length].decode('utf-8'))
+                pos += length
+            self._index = {}
+            pos = index_offset
+            for _ in range(_UINT.unpack_from(data, pos)[0]):
+                symbol_id, length = struct.unpack_from('<II', data, pos + 4)
+                pos += 8
+                self._index[self.strings[symbol_id]] = struct.unpack_from(
+                    '<{}I'.format(length), data, pos + 4)
+                pos += 4 * length
+        except (struct.error, IndexError, UnicodeDecodeError) as err:
+            raise ASTBinaryError('Binary AST file is damaged.') from err
+        # all node offsets are relative to the start of the nodes
+        self._nodes = memoryview(data)[nodes_offset:index_offset]
+
+    @property
+    def symbols(self) -> Mapping[str, int]:
+        """The symbols of nodes in the tree, with the number of nodes for each."""
+        return {symbol: len(offsets) for symbol, offsets in self._index.items()}
+
+    @property
+    def root(self) -> ASTNode:
+        """The whole tree, decoded into :py:class:`~utl_lib.ast_node.ASTNode` objects."""
+        return self.decode(0)
+
+    def offsets(self, symbol: str) -> Sequence[int]:
+        """The offsets of the nodes whose symbol is `symbol`, in
+        :py:meth:`~utl_lib.ast_node.ASTNode.walk` order.
+
+        """
+        return self._index.get(symbol, ())
+
+    def find_all(self, symbol: str) -> List[ASTNode]:
+        """Decodes only the subtrees rooted at nodes whose symbol is `symbol`.
+
+        Like :py:meth:`~utl_lib.ast_node.ASTNode.find_all`, but only the matching subtrees are
+        read. Each returned node is the root of a new tree (has no parent).
+
+        :param str symbol: The symbol of the nodes to be found.
+
+        :returns list: The decoded nodes.
+
+        """
+        return [self.decode(offset) for offset in self.offsets(symbol)]
+
+    def _read_node(self, pos: int) -> Tuple[str, dict, int, int]:
+        """Reads the node record at `pos`.
+
+        :returns tuple: symbol, attribute dict, child count, and offset of the first child.
+
+        """
+        data, strings = self._nodes, self.strings
+        symbol_id, _, attr_count, child_count = _NODE.unpack_from(data, pos)
+        pos += _NODE.size
+        attrs = {}
+        for _ in range(attr_count):
+            key = strings[_UINT.unpack_from(data, pos)[0]]
+            tag = data[pos + 4]
+            pos += 5
+            if tag == _STR:
+                attrs[key] = strings[_UINT.unpack_from(data, pos)[0]]
+                pos += 4
+            elif tag == _INT_TAG:
+                attrs[key] = _INT.unpack_from(data, pos)[0]
+                pos += 8
+            elif tag == _FLOAT_TAG:
+                attrs[key] = _FLOAT.unpack_from(data, pos)[0]
+                pos += 8
+            elif tag == _TRUE or tag == _FALSE:
+                attrs[key] = tag == _TRUE
+            elif tag == _NONE:
+                attrs[key] = None
+            elif tag == _BIGINT:
+                attrs[key] = int(strings[_UINT.unpack_from(data, pos)[0]])
+                pos += 4
+            elif tag == _NODE_TAG:
+                attrs[key] = self.decode(pos)
+                pos = _NODE.unpack_from(data, pos)[1]
+            else:
+                raise ASTBinaryError('Unknown attribute type {!r} at {}.'.format(tag, pos - 1))
+        return strings[symbol_id], attrs, child_count, pos
+
+    def decode(self, offset: int) -> ASTNode:
+        """Decodes the subtree whose root node record is at `offset`.
+
+        :param int offset: The offset of a node, as returned by :py:meth:`offsets`.
+
+        :returns ASTNode: The root of the decoded subtree.
+
+        """
+        # node records are in walk() order, so the next record read is always the next child
+        # of the node on top of the stack
+        stack = []
+        pos = offset
+        while True:
+            symbol, attrs, child_count, pos = self._read_node(pos)
+            stack.append((symbol, attrs, child_count, []))
+            while len(stack[-1][3]) == stack[-1][2]:
+                symbol, attrs, _, children = stack.pop()
+                node = ASTNode(symbol, attrs, children)
+                if not stack:
+                    return node
+                stack[-1][3].append(node)
+
+
+def save(root: Any, file: Union[str, BinaryIO]) -> None:
+    """Writes the tree rooted at `root` to `file` in binary AST format.
+
+    :param (ASTNode or FrozenASTNode) root: The root of the tree to be saved.
+
+    :param (str or BinaryIO) file: A file name, or a file object opened for binary writing.
+
+    :raises ASTBinaryError: if a node has an attribute value that can't be saved.
+
+    """
+    writer = _Writer(root)
+    if hasattr(file, 'write'):
+        writer.save(file)
+    else:
+        with open(str(file), 'wb') as binout:
+            writer.save(binout)
+
+
+def load(file: Union[str, BinaryIO]) -> BinaryAST:
+    """Reads a file written by :py:func:`save`.
+
+    :param (str or BinaryIO) file: A file name, or a file object opened for binary reading.
+
+    :returns BinaryAST: An object from which the tree, or parts of it, can be decoded.
+
+    :raises ASTBinaryError: if the file is not a valid binary AST file.
+
+    """
+    if hasattr(file, 'read'):
+        return BinaryAST(file.read())
+    with open(str(file), 'rb') as binin:
+        return BinaryAST(binin.read())
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -11,8 +11,9 @@ to implement parse tree as well, name is historical accident.
 
 
 """
-from typing import Mapping, Any, Iterable, MutableMapping, Sequence, Optional, Iterator
-from utl_lib.immutable import FrozenDict
+import io
+from typing import Mapping, Any, Iterable, MutableMapping, Sequence, Optional, Iterator, TextIO
+from utl_lib.immutable import FrozenDict, freeze
 
 
 class ASTNodeError(Exception):
@@ -41,11 +42,12 @@ class ASTNode(object):
             raise ASTNodeError('ASTNode must have a valid name')
         if attrs is not None:
             assert hasattr(attrs, 'keys')
+        self.parent = None  # set by parent in add_child
+        self._symbol_index = None  # built by index_symbols()
         self.children = []
         if children:
             for child in children:
                 self.add_child(child)
-        self.parent = None  # set by parent in add_child
         self.symbol = symbol_name
         self._attributes = None
         self.attributes = attrs
@@ -61,16 +63,15 @@ class ASTNode(object):
     @attributes.setter
     def attributes(self, new_attrs: Mapping[str, Any]) -> None:  # pylint: disable=C0111
         if new_attrs is None:
-            self._attributes = FrozenDict()
+            self._attributes = freeze({})
         elif not isinstance(new_attrs, FrozenDict):
-            # self._attributes = FrozenDict(new_attrs)
             attr_copy = {}
             for key in new_attrs:
                 if isinstance(new_attrs[key], ASTNode):
                     attr_copy[key] = FrozenASTNode(new_attrs[key])
                 else:
                     attr_copy[key] = new_attrs[key]
-            self._attributes = FrozenDict(attr_copy)
+            self._attributes = freeze(attr_copy, False)
         else:
             self._attributes = new_attrs
 
@@ -123,6 +124,7 @@ class ASTNode(object):
             child = child.copy()
         child.parent = self
         self.children.append(child)
+        self._tree_changed()
 
     def copy(self) -> "ASTNode":
         """Returns a new instance of :py:class:`utl_lib.ast_node.ASTNode` whose attributes have
@@ -141,6 +143,17 @@ class ASTNode(object):
         self.children = list(self.children)
         child.parent = self
         self.children.insert(0, child)
+        self._tree_changed()
+
+    def _tree_changed(self) -> None:
+        """Discards the symbol indexes of this node and its ancestors, since they no longer
+        reflect the tree.
+
+        """
+        node = self
+        while node is not None:
+            node._symbol_index = None  # pylint: disable=protected-access
+            node = node.parent
 
     def add_children(self, iterator: Iterable["ASTNode"]) -> None:
         """Add each item in iterator to the list of children. Items should be nodes. Note that
@@ -194,12 +207,17 @@ class ASTNode(object):
         :returns: str
 
         """
-        result = str(self)
-        for child in self.children:
-            lines = child.format().split('\n')
-            for line in lines:
-                result += '\n    ' + line
-        return result
+        output = io.StringIO()
+        self.write_format(output)
+        return output.getvalue()
+
+    def write_format(self, stream: TextIO) -> None:
+        """Writes the output of :py:meth:`format` to `stream`, one line at a time.
+
+        :param TextIO stream: A writable text file object.
+
+        """
+        write_format(self, stream)
 
     def walk(self) -> Iterator["ASTNode"]:
         """
@@ -216,9 +234,11 @@ class ASTNode(object):
         ``node1.walk() ==> (node1, child1, grandchild1, child2, grandchild2, child3)``
 
         """
-        yield self
-        for child in self.children:
-            yield from child.walk()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
 
     # pylint: disable=W9003,W9004
     # appears to be no way to make pylint accept docstring
@@ -246,36 +266,29 @@ class ASTNode(object):
             my_repr = '"' + my_repr[1:-1] + '"'
         return my_repr
 
-    # TODO: Fix cases where we have to check for FrozenASTNode. I don't think
-    # ASTNode should have to care that FrozenASTNode exists.
     def json_format(self) -> str:
         """Walks the tree whose root is this node and returns a JSON representation of the tree.
 
         :returns: str
 
         """
-        result = '{"name": "' + str(self.symbol) + '"'
-        if self._attributes:
-            result += ',\n"attributes": {'
-            for key in self._attributes:
-                value = self._attributes[key]
-                if self.symbol == 'document':
-                    # special handling of HTML content
-                    if hasattr(value, 'replace'):  # don't try replace() on ints, etc
-                        value = value.replace('"', '&quot;')
-                if isinstance(value, (ASTNode, FrozenASTNode, )):
-                    result += '"{}": {},\n'.format(key, value.json_format())
-                else:
-                    result += '"{}": {},\n'.format(key, self._json_safe(value))
-            result = result[:-2]  # remove final ,\n
-            result += '}'
-        if self.children:
-            result += ',\n"children": [\n'
-            for child in self.children:
-                result += child.json_format() + ',\n'
-            result = result[:-2] + ']'
-        result += '}'
-        return result
+        output = io.StringIO()
+        self.write_json(output)
+        return output.getvalue()
+
+    def write_json(self, stream: TextIO, pretty: bool = False) -> None:
+        """Writes a JSON representation of the tree whose root is this node to `stream`.
+
+        The tree is walked iteratively and output is written as it is generated, so time is
+        linear in the size of the tree and no copy of the output is held in memory.
+
+        :param TextIO stream: A writable text file object.
+
+        :param bool pretty: If ``True``, indent nested objects; otherwise write one attribute or
+            child per line, as :py:meth:`json_format` does.
+
+        """
+        write_json(self, stream, pretty)
 
     @property
     def context(self) -> MutableMapping[str, Any]:
@@ -294,27 +307,46 @@ class ASTNode(object):
         :returns ASTNode, None: The found node, or ``None``.
 
         """
-        if self.symbol == symbol:
-            return self
-        for kid in self.children:
-            value = kid.find_first(symbol)
-            if value is not None:
-                return value
+        if self._symbol_index is not None:
+            matches = self._symbol_index.get(symbol)
+            return matches[0] if matches else None
+        for node in self.walk():
+            if node.symbol == symbol:
+                return node
+        return None
 
     def find_all(self, symbol: str) -> Sequence["ASTNode"]:
         """Conducts a depth-first search through the tree for nodes with symbol `symbol`.
 
+        If :py:meth:`index_symbols` has been called on this node, this is a lookup instead of a
+        search.
+
         :param str symbol: the node symbol to be matched.
 
         :returns list: The found nodes
 
         """
-        matches = []
-        if self.symbol == symbol:
-            matches.append(self)
-        for kid in self.children:
-            matches += kid.find_all(symbol)
-        return matches
+        if self._symbol_index is not None:
+            return list(self._symbol_index.get(symbol, ()))
+        return [node for node in self.walk() if node.symbol == symbol]
+
+    def index_symbols(self) -> Mapping[str, Sequence["ASTNode"]]:
+        """Builds an index of the nodes in the tree rooted at this node, keyed by symbol, so
+        that :py:meth:`find_all` and :py:meth:`find_first` are lookups instead of searches.
+
+        The index is discarded when nodes are added to the tree with :py:meth:`add_child` or
+        :py:meth:`add_first_child`. Changes made directly to :py:attr:`children` are not
+        detected; call this method again after making them.
+
+        :returns dict: A mapping from each symbol to the list of nodes with that symbol, in the
+            order of :py:meth:`walk`.
+
+        """
+        index = {}
+        for node in self.walk():
+            index.setdefault(node.symbol, []).append(node)
+        self._symbol_index = index
+        return index
 
 
 class FrozenASTNode(object):
@@ -323,22 +355,30 @@ class FrozenASTNode(object):
     Note equality is defined by children, attributes, and symbol -- but does
     not check parent.
 
+    The hash of a node is computed once, when it is created, from the (already computed) hashes
+    of its children, so hashing is O(1) and freezing a tree is O(n).
+
     :param ASTNode ast_node: A node whose data will be
         copied to this.
 
+    :param FrozenASTNodeTable table: If given, the children of the new node are interned in
+        `table`, so identical subtrees share a single object.
+
     """
 
-    def __init__(self, ast_node: ASTNode) -> None:
+    def __init__(self, ast_node: ASTNode, table: "FrozenASTNodeTable" = None) -> None:
         if not isinstance(ast_node, ASTNode):
             raise ValueError("FrozenASTNode() requires an ASTNode as input.")
 
-        self._children = []
-        for child in ast_node.children:
-            self._children.append(FrozenASTNode(child))
-        self._children = tuple(self._children)  # pylint: disable=R0204
+        if table is None:
+            self._children = tuple(FrozenASTNode(child) for child in ast_node.children)
+        else:
+            self._children = tuple(table.freeze(child) for child in ast_node.children)
         self._symbol = ast_node.symbol
         # pylint: disable=protected-access
         self._attributes = ast_node._attributes   # a FrozenDict
+        self._hash = hash((self._symbol, self._attributes,
+                           tuple(hash(child) for child in self._children)))
 
     def unfreeze(self) -> ASTNode:
         """Creates an :py:class:`utl_lib.ast_node.ASTNode` instance from the
@@ -369,16 +409,23 @@ class FrozenASTNode(object):
         return self._children
 
     def __hash__(self) -> int:
-        value = hash(self.symbol)
-        value ^= hash(self.attributes)
-        for child in self.children:
-            value ^= hash(child)
-        return value
+        return self._hash
+
+    def __deepcopy__(self, memo: dict) -> "FrozenASTNode":
+        # immutable, so a copy would be identical in every way
+        return self
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, FrozenASTNode):
-            return hash(self) == hash(other)
-        return False
+        # pylint: disable=protected-access
+        if self is other:  # always true for interned nodes
+            return True
+        if not isinstance(other, FrozenASTNode) or self._hash != other._hash:
+            return False
+        # hashes can collide, so confirm with a structural comparison. Tuple comparison checks
+        # identity first, so shared (interned) subtrees are not descended into.
+        return (self._symbol == other._symbol and
+                self._attributes == other._attributes and
+                self._children == other._children)
 
     def __str__(self):
         result = '{}: '.format(self.symbol)
@@ -410,7 +457,16 @@ class FrozenASTNode(object):
         :returns: str
 
         """
-        return self.unfreeze().json_format()
+        output = io.StringIO()
+        self.write_json(output)
+        return output.getvalue()
+
+    def write_json(self, stream: TextIO, pretty: bool = False) -> None:
+        """Writes a JSON representation of the tree whose root is this node to `stream`, without
+        unfreezing it. See :py:meth:`ASTNode.write_json`.
+
+        """
+        write_json(self, stream, pretty)
 
     def walk(self) -> Iterator["FrozenASTNode"]:
         """Walk the tree rooted at this node, yielding each node in turn.
@@ -426,9 +482,159 @@ class FrozenASTNode(object):
         ``node1.walk() ==> (node1, child1, grandchild1, child2, grandchild2, child3)``
 
         """
-        yield self
-        for child in self.children:
-            yield from child.walk()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+def write_format(root: Any, stream: TextIO) -> None:
+    """Writes the tree rooted at `root` to `stream`, one node per line, with each node indented
+    four spaces more than its parent.
+
+    Nodes are visited with an explicit stack, and each line is written as soon as it is built,
+    so the cost is linear in the size of the output regardless of the depth of the tree.
+
+    :param (ASTNode or FrozenASTNode) root: The root of the tree to be written.
+
+    :param TextIO stream: A writable text file object.
+
+    """
+    stack = [(root, '')]
+    first = True
+    while stack:
+        node, indent = stack.pop()
+        line = str(node)
+        if '\n' in line:
+            line = line.replace('\n', '\n' + indent)
+        if first:
+            first = False
+        else:
+            stream.write('\n')
+        stream.write(indent + line)
+        child_indent = indent + '    '
+        stack.extend((child, child_indent) for child in reversed(node.children))
+
+
+def _json_pieces(node: Any, depth: int, pretty: bool) -> Iterator[Any]:
+    """Yields the output for a single node of a tree: :py:class:`str` pieces to be written as
+    is, and ``(node, depth)`` tuples for nested nodes.
+
+    :param (ASTNode or FrozenASTNode) node: The node to be written.
+
+    :param int depth: The nesting depth of `node`, used for indentation if `pretty`.
+
+    :param bool pretty: If ``True``, indent output.
+
+    """
+    if pretty:
+        indent = '\n' + '  ' * depth
+        yield '{' + indent + '  "name": "' + str(node.symbol) + '"'
+        member_start = ',' + indent + '  '
+        item_start = indent + '    '
+        item_sep = ',' + item_start
+        list_end = indent + '  '
+        node_end = indent + '}'
+    else:
+        yield '{"name": "' + str(node.symbol) + '"'
+        member_start = ',\n'
+        item_start = ''
+        item_sep = ',\n'
+        list_end = ''
+        node_end = '}'
+
+    attributes = node.attributes
+    if attributes:
+        yield member_start + '"attributes": {' + item_start
+        sep = ''
+        for key in attributes:
+            value = attributes[key]
+            if node.symbol == 'document':
+                # special handling of HTML content
+                if hasattr(value, 'replace'):  # don't try replace() on ints, etc
+                    value = value.replace('"', '&quot;')
+            if isinstance(value, (ASTNode, FrozenASTNode, )):
+                yield '{}"{}": '.format(sep, key)
+                yield (value, depth + 2)
+            else:
+                # pylint: disable=protected-access
+                yield '{}"{}": {}'.format(sep, key, ASTNode._json_safe(value))
+            sep = item_sep
+        yield list_end + '}'
+    if node.children:
+        yield member_start + '"children": [' + (item_start if pretty else '\n')
+        sep = ''
+        for child in node.children:
+            if sep:
+                yield sep
+            yield (child, depth + 2)
+            sep = item_sep
+        yield list_end + ']'
+    yield node_end
+
+
+def write_json(root: Any, stream: TextIO, pretty: bool = False) -> None:
+    """Writes a JSON representation of the tree rooted at `root` to `stream`.
+
+    Works the same for :py:class:`ASTNode` and :py:class:`FrozenASTNode` trees. Nodes are
+    visited with an explicit stack, so very deep trees don't hit the recursion limit.
+
+    :param (ASTNode or FrozenASTNode) root: The root of the tree to be written.
+
+    :param TextIO stream: A writable text file object.
+
+    :param bool pretty: If ``True``, indent nested objects.
+
+    """
+    stack = [_json_pieces(root, 0, pretty)]
+    while stack:
+        for piece in stack[-1]:
+            if isinstance(piece, str):
+                stream.write(piece)
+            else:
+                stack.append(_json_pieces(piece[0], piece[1], pretty))
+                break
+        else:
+            stack.pop()
+
+
+class FrozenASTNodeTable(object):
+    """An intern table for :py:class:`FrozenASTNode` instances ("hash-consing").
+
+    Nodes frozen through the same table share one object for every distinct subtree, so
+    identical code (e.g. the same macro copied into several packages) is only stored once.
+
+    """
+
+    def __init__(self) -> None:
+        self._nodes = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self._nodes
+
+    def intern(self, node: FrozenASTNode) -> FrozenASTNode:
+        """Returns the node in this table equal to `node`, adding `node` if there is none.
+
+        :param FrozenASTNode node: A frozen node.
+
+        :returns FrozenASTNode: The canonical instance of `node`.
+
+        """
+        return self._nodes.setdefault(node, node)
+
+    def freeze(self, ast_node: ASTNode) -> FrozenASTNode:
+        """Creates an interned :py:class:`FrozenASTNode` from `ast_node` and its descendants.
+
+        :param ASTNode ast_node: The root of the tree to be frozen.
+
+        :returns FrozenASTNode: The canonical frozen copy of `ast_node`.
+
+        """
+        return self.intern(FrozenASTNode(ast_node, self))
 
 # Local Variables:
 # python-indent-offset: 4
@@ -10,6 +10,10 @@
 """
 import collections
 import copy
+import weakref
+
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), frozenset, range)
+"Types whose values can be shared instead of copied (see :py:meth:`FrozenDict.thaw`)."
 
 
 class FrozenDict(collections.Mapping):
@@ -18,17 +22,34 @@ class FrozenDict(collections.Mapping):
     This allows handlers to return context info in a form that has the goodness of immutability,
     and is hashable.
 
+    The hash is computed the first time it's needed, so creating a FrozenDict whose values are
+    not hashable succeeds, but hashing it raises :py:exc:`TypeError`.
+
     :param collections.Mapping somedict: A mapping whose values will be used to initialize the
         FrozenDict. Note this is the only way to add values!
 
     """
+    __slots__ = ('_dict', '_hash')
 
     def __init__(self, somedict=None):
         if somedict is None:
             somedict = {}
-        self._dict = dict(somedict)   # make a copy
-        # if values of self._dict are not hashable, we're not hashable. Fail now.
-        self._hash = hash(frozenset(self._dict.items()))
+        if isinstance(somedict, FrozenDict):
+            self._dict = somedict._dict  # immutable, so we can share it
+        else:
+            self._dict = dict(somedict)   # make a copy
+        self._hash = None
+
+    @classmethod
+    def _wrap(cls, newdict):
+        """Creates a FrozenDict which uses `newdict` without copying it. Only for use with dicts
+        that are not referenced anywhere else.
+
+        """
+        result = cls.__new__(cls)
+        result._dict = newdict  # pylint: disable=W0212
+        result._hash = None  # pylint: disable=W0212
+        return result
 
     def __getitem__(self, key):
         return self._dict[key]
@@ -39,11 +60,22 @@ class FrozenDict(collections.Mapping):
     def __iter__(self):
         return iter(self._dict)
 
+    def __contains__(self, key):
+        return key in self._dict
+
     def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._dict.items()))
         return self._hash
 
     def __eq__(self, other):
-        return self._dict == other._dict  # pylint: disable=W0212
+        if self is other:
+            return True
+        if isinstance(other, FrozenDict):
+            return self._dict == other._dict  # pylint: disable=W0212
+        if isinstance(other, collections.Mapping):
+            return self._dict == dict(other.items())
+        return NotImplemented
 
     def combine(self, *args, **keys):
         """D.combine([E, ]**F) -> D'.  Create FrozenSet D' from D and dict/iterable E and F.
@@ -66,7 +98,7 @@ class FrozenDict(collections.Mapping):
         # because it does not modify-in-place, it returns a new FrozenDict
         newdict = self._dict.copy()
         newdict.update(*args, **keys)
-        return FrozenDict(newdict)
+        return freeze(newdict, False)
 
     def delkey(self, *args):
         """D.delkey(key [, ...]) -> D' which contains {key:D[key] for key in D if key not in args}.
@@ -80,23 +112,184 @@ class FrozenDict(collections.Mapping):
         newdict = self._dict.copy()
         for arg in args:
             del newdict[arg]
-        return FrozenDict(newdict)
+        return freeze(newdict, False)
 
     def thaw(self):
         """Returns a dictionary with the same keys and values as this instance.
 
-        Be careful: uses :py:func:`copy.deepcopy`. Safer immutability, but may be a problem on
-        large objects.
+        Be careful: uses :py:func:`copy.deepcopy` on values that are not of one of the
+        :py:data:`IMMUTABLE_TYPES`. Safer immutability, but may be a problem on large objects.
 
         """
         newdict = {}
-        for key in self._dict:
+        for key, value in self._dict.items():
             # keys are immutable anyway
-            newdict[key] = copy.deepcopy(self._dict[key])
+            if type(value) in IMMUTABLE_TYPES or isinstance(value, FrozenDict):
+                newdict[key] = value
+            else:
+                newdict[key] = copy.deepcopy(value)
         return newdict
 
+    def __reduce__(self):
+        # so copy and pickle don't need to know about __slots__
+        return (self.__class__, (self._dict, ))
+
     def __str__(self):
         return "frozen: {}".format(self._dict)
 
     def __repr__(self):
         return "FrozenDict({})".format(repr(self._dict))
+
+
+class _KeyTable(dict):
+    """A key -> position table shared by :py:class:`SmallFrozenDict` instances; a dict that can
+    be weakly referenced.
+
+    """
+    __slots__ = ('__weakref__', )
+
+
+class SmallFrozenDict(FrozenDict):
+    """A :py:class:`FrozenDict` for a handful of keys, like the attributes of an
+    :py:class:`~utl_lib.ast_node.ASTNode`.
+
+    Instances with the same keys (in the same order) share a single key -> position table, so
+    each instance only stores a tuple of values. Lookups are as fast as a dict's.
+
+    Use :py:func:`freeze` to get a SmallFrozenDict or a FrozenDict as appropriate.
+
+    :param collections.Mapping somedict: A mapping whose values will be used to initialize the
+        SmallFrozenDict.
+
+    """
+    __slots__ = ('_positions', '_values')
+
+    MAX_SIZE = 8
+    "Largest mapping for which :py:func:`freeze` returns a SmallFrozenDict."
+
+    _key_tables = weakref.WeakValueDictionary()
+    # Shared key tables, keyed by tuple of keys. A table is dropped when no instance uses it,
+    # so freezing many different sets of keys doesn't keep them all alive.
+
+    def __init__(self, somedict=None):  # pylint: disable=W0231
+        if somedict is None:
+            somedict = {}
+        keys = tuple(somedict)
+        self._positions = self._key_table(keys)
+        self._values = tuple([somedict[key] for key in keys])
+        self._hash = None
+
+    @classmethod
+    def _key_table(cls, keys):
+        """Returns the shared key -> position table for the tuple `keys`."""
+        table = cls._key_tables.get(keys)
+        if table is None:
+            table = cls._key_tables.setdefault(
+                keys, _KeyTable((key, index) for index, key in enumerate(keys)))
+        return table
+
+    @classmethod
+    def _make(cls, keys, values):
+        """Creates a SmallFrozenDict from tuples of keys and values, without a dict."""
+        result = cls.__new__(cls)
+        result._positions = cls._key_table(keys)  # pylint: disable=W0212
+        result._values = values  # pylint: disable=W0212
+        result._hash = None  # pylint: disable=W0212
+        return result
+
+    @property
+    def _dict(self):
+        """A (new) dict with our keys and values."""
+        return dict(zip(self._positions, self._values))
+
+    def __getitem__(self, key):
+        return self._values[self._positions[key]]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        # pylint: disable=W0212
+        if isinstance(other, SmallFrozenDict) and self._positions is other._positions:
+            return self._values == other._values
+        if isinstance(other, collections.Mapping):
+            if len(other) != len(self._values):
+                return False
+            for key, value in zip(self._positions, self._values):
+                if key not in other or other[key] != value:
+                    return False
+            return True
+        return NotImplemented
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(zip(self._positions, self._values)))
+        return self._hash
+
+    def combine(self, *args, **keys):
+        """D.combine([E, ]**F) -> D'. See :py:meth:`FrozenDict.combine`."""
+        newdict = dict(zip(self._positions, self._values))
+        newdict.update(*args, **keys)
+        return freeze(newdict, False)
+
+    def delkey(self, *args):
+        """D.delkey(key [, ...]) -> D'. See :py:meth:`FrozenDict.delkey`."""
+        for arg in args:
+            if arg not in self._positions:
+                raise KeyError(arg)
+        kept = [(key, value) for key, value in zip(self._positions, self._values)
+                if key not in args]
+        return self._make(tuple(key for key, _ in kept), tuple(value for _, value in kept))
+
+    def thaw(self):
+        """Returns a dictionary with the same keys and values as this instance. See
+        :py:meth:`FrozenDict.thaw`.
+
+        """
+        newdict = {}
+        for key, value in zip(self._positions, self._values):
+            if type(value) in IMMUTABLE_TYPES or isinstance(value, FrozenDict):
+                newdict[key] = value
+            else:
+                newdict[key] = copy.deepcopy(value)
+        return newdict
+
+    def _format(self):
+        """Formats our keys and values as a dict would be formatted."""
+        return '{' + ', '.join('{!r}: {!r}'.format(key, value)
+                               for key, value in zip(self._positions, self._values)) + '}'
+
+    def __str__(self):
+        return "frozen: {}".format(self._format())
+
+    def __repr__(self):
+        return "FrozenDict({})".format(self._format())
+
+
+def freeze(mapping, copy_needed=True):
+    """Returns an immutable copy of `mapping`: a :py:class:`SmallFrozenDict` if it has no more
+    than :py:attr:`SmallFrozenDict.MAX_SIZE` keys, otherwise a :py:class:`FrozenDict`.
+
+    :param collections.Mapping mapping: The keys and values to be copied.
+
+    :param bool copy_needed: If ``False``, `mapping` is a dict that is not referenced
+        anywhere else, and may be used without copying it.
+
+    :rtype: FrozenDict
+
+    """
+    if isinstance(mapping, FrozenDict):
+        return mapping
+    if len(mapping) <= SmallFrozenDict.MAX_SIZE:
+        return SmallFrozenDict(mapping)
+    if copy_needed:
+        return FrozenDict(mapping)
+    return FrozenDict._wrap(mapping)  # pylint: disable=W0212
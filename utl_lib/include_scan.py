@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Finds the files a UTL document includes from the lexer's tokens, without parsing it.
+
+Most include statements name a file with a string literal (``include 'macros.inc';``), and
+those can be recognized in the token stream: an ``INCLUDE`` token, a ``STRING``, and the end of
+the statement. Building a full parse tree to find them takes many times longer. Anything else
+following ``include`` (a variable, a concatenation, parentheses) needs the parser to say what
+the expression is, so :py:meth:`IncludeScanner.scan` gives up on the whole document and the
+caller should parse it.
+
+Note the scanner does not check the syntax of the rest of the document; a document which
+doesn't parse may still have its includes found.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+from utl_lib.utl_lex import UTLLexer, UTLLexerError
+
+END_OF_STATEMENT = frozenset(['SEMI', 'END_UTL', 'EOF'])
+"The tokens which can end an include statement (see ``eostmt`` in the grammar)."
+
+
+class IncludeScanner(object):
+    """Scans documents for literal include statements. One lexer is reused for every
+    document.
+
+    """
+
+    def __init__(self):
+        self._lexer = UTLLexer()
+
+    def _tokens(self, program_text):
+        """Generates the tokens of `program_text`, ending with the ``EOF`` token."""
+        lexer = self._lexer
+        # a document with unbalanced [% %] can leave the lexer in the wrong state
+        lexer.lexer.begin('INITIAL')
+        lexer.lexer.lexstatestack = []
+        lexer.lexer.lineno = 1
+        lexer.input(program_text)
+        while True:
+            tok = lexer.token()
+            if tok is None:
+                return
+            yield tok
+
+    def scan(self, program_text):
+        """Finds the files included by a document.
+
+        :param str program_text: The text of the document.
+
+        :returns list: The names in the include statements, in the order found, as
+            ``FileWithIncludes.get_includes`` in ``includes.py`` would return them; or ``None``
+            if the document has an include statement that isn't a single string literal, or
+            can't be broken into tokens, and must be parsed instead.
+
+        """
+        included = []
+        previous = None
+        try:
+            tokens = self._tokens(program_text)
+            for tok in tokens:
+                if tok.type == 'INCLUDE':
+                    if previous == 'DOT':
+                        return None
+                    name = next(tokens, None)
+                    end = next(tokens, None)
+                    if name is None or name.type != 'STRING' or end is None or \
+                       end.type not in END_OF_STATEMENT:
+                        return None
+                    included.append(name.value)
+                    tok = end
+                previous = tok.type
+        except UTLLexerError:
+            return None
+        return included
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The graph of which macros call which macros, built from a cross-reference.
+
+A call belongs to the macro whose definition contains it (by file and offsets), so the graph can
+be built from a :py:class:`~utl_lib.macro_xref.UTLMacroXref` loaded from a
+:py:class:`~utl_lib.macro_index.MacroIndex` as well as from parsed documents. Calls outside any
+macro are not part of the graph. Nodes are macro names; macros defined more than once (in
+different packages, say) are merged, and names which are called but never defined (like built-in
+functions) are included as nodes with no calls.
+
+When the graph is built its strongly connected components are found, and for each component the
+set of components it can reach, and the set that can reach it, are stored as bit sets. That
+makes transitive queries a few integer operations plus the cost of listing the answer.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+from bisect import bisect_right
+from collections import defaultdict
+
+
+def enclosing_macros(macros, refs):
+    """Matches the calls in a document to the macros whose definitions contain them.
+
+    :param list macros: The :py:class:`~utl_lib.macro_xref.UTLMacro` instances defined in the
+        document.
+
+    :param list refs: The macro calls in the document.
+
+    :returns generator: ``(macro, ref)`` pairs, for each call inside a macro definition. If
+        definitions are nested, the innermost one is used.
+
+    """
+    ordered = sorted(macros, key=lambda macro: (macro.start, -macro.end))
+    starts = [macro.start for macro in ordered]
+    for ref in refs:
+        pos = bisect_right(starts, ref["start"]) - 1
+        # step back over definitions which end before the call
+        while pos >= 0 and ordered[pos].end <= ref["start"]:
+            pos -= 1
+        if pos >= 0:
+            yield ordered[pos], ref
+
+
+def _bits(bitset):
+    """:returns generator: The positions of the bits set in the integer `bitset`."""
+    while bitset:
+        low = bitset & -bitset
+        yield low.bit_length() - 1
+        bitset ^= low
+
+
+class MacroCallGraph(object):
+    """The calls between macros in a cross-reference, with precomputed reachability.
+
+    The graph is not updated if the cross-reference changes; build a new one.
+
+    :param UTLMacroXref xref: The macros and calls.
+
+    """
+
+    def __init__(self, xref):
+        self.edges = defaultdict(set)
+        "The names of the macros each macro calls directly, keyed by caller name."
+        self.names = set()
+        "All the macro names in the graph, defined or only called."
+        for macros, refs in xref.records():
+            self.names.update(macro.name for macro in macros)
+            for macro, ref in enclosing_macros(macros, refs):
+                self.edges[macro.name].add(ref["macro"])
+                self.names.add(ref["macro"])
+        self.components = []
+        "Lists of macro names, one per strongly connected component, callees before callers."
+        self._component_of = {}
+        self._find_components()
+        self._reaches = []
+        "For each component, the bit set of components it calls, directly or not."
+        self._reached_by = []
+        "For each component, the bit set of components which call it, directly or not."
+        self._find_reachability()
+
+    def _find_components(self):
+        """Finds the strongly connected components with Tarjan's algorithm. An explicit stack
+        is used, since call chains can be longer than the recursion limit.
+
+        """
+        order = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        for root in sorted(self.names):
+            if root in order:
+                continue
+            work = [(root, iter(sorted(self.edges.get(root, ()))))]
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                name, callees = work[-1]
+                for callee in callees:
+                    if callee not in order:
+                        order[callee] = low[callee] = len(order)
+                        stack.append(callee)
+                        on_stack.add(callee)
+                        work.append((callee, iter(sorted(self.edges.get(callee, ())))))
+                        break
+                    elif callee in on_stack:
+                        low[name] = min(low[name], order[callee])
+                else:
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        low[caller] = min(low[caller], low[name])
+                    if low[name] == order[name]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            self._component_of[member] = len(self.components)
+                            component.append(member)
+                            if member == name:
+                                break
+                        self.components.append(sorted(component))
+
+    def _find_reachability(self):
+        """Computes the bit sets of reachable components. Tarjan's algorithm finds components
+        callees first, so one pass forward handles calls, and one pass backward callers.
+
+        """
+        successors = [set() for _ in self.components]
+        for caller, callees in self.edges.items():
+            source = self._component_of[caller]
+            for callee in callees:
+                successors[source].add(self._component_of[callee])
+        self._reaches = [0] * len(self.components)
+        for index, targets in enumerate(successors):
+            bits = 0
+            for target in targets:
+                bits |= self._reaches[target] | (1 << target)
+            self._reaches[index] = bits
+        self._reached_by = [0] * len(self.components)
+        for index in range(len(self.components) - 1, -1, -1):
+            for target in successors[index]:
+                self._reached_by[target] |= self._reached_by[index] | (1 << index)
+
+    def _names(self, bitset):
+        """:returns set: The names in the components in `bitset`."""
+        return set(name for index in _bits(bitset) for name in self.components[index])
+
+    def calls(self, name):
+        """:returns set: The names of the macros `name` calls directly."""
+        return set(self.edges.get(name, ()))
+
+    def component(self, name):
+        """:returns list: The names of the macros in the same strongly connected component as
+        `name` (including `name`); that is, those which both call and are called by `name`,
+        directly or not.
+
+        :raises KeyError: if `name` is not in the graph.
+
+        """
+        return list(self.components[self._component_of[name]])
+
+    def is_recursive(self, name):
+        """:returns bool: ``True`` if `name` can end up calling itself."""
+        index = self._component_of[name]
+        return bool(self._reaches[index] & (1 << index))
+
+    def reachable_from(self, name):
+        """Everything a macro calls, directly or indirectly.
+
+        :param str name: A macro name.
+
+        :returns set: The names of all the macros `name` can end up calling. Includes `name`
+            only if it is recursive. Empty if `name` is not in the graph.
+
+        """
+        try:
+            return self._names(self._reaches[self._component_of[name]])
+        except KeyError:
+            return set()
+
+    def callers_of(self, name):
+        """Everything that calls a macro, directly or indirectly.
+
+        :param str name: A macro name.
+
+        :returns set: The names of all the macros which can end up calling `name`. Includes
+            `name` only if it is recursive. Empty if `name` is not in the graph.
+
+        """
+        try:
+            return self._names(self._reached_by[self._component_of[name]])
+        except KeyError:
+            return set()
+
+    def cycles(self):
+        """:returns list: The groups of mutually recursive macros (as lists of names),
+        including macros which call themselves.
+
+        """
+        return [list(self.components[index]) for index in range(len(self.components))
+                if self._reaches[index] & (1 << index)]
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
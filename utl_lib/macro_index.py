@@ -0,0 +1,667 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A persistent index of the macros in a tree of UTL files, stored in an SQLite database.
+
+The tree is normally the directory written by :py:mod:`unpack_zip_files`. For each ``.utl``
+file the index records the macros defined (with their parameters), the macros called, and the
+files included. Files are identified by their path relative to the top of the tree.
+
+Each file's SHA-1 content hash is stored with it, so re-indexing only parses files that were
+added or changed, and drops files that no longer exist.
+
+A macro name may be defined in several packages. Which definition a page uses depends on the
+site's global skin and the application skin, searched in the same order as
+:py:mod:`includes` searches for included files (see :py:data:`TIERS`).
+:py:meth:`MacroIndex.resolutions` builds, stores, and returns a table of the winning definition
+of every name for a combination of skins.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import hashlib
+import sqlite3
+from collections import defaultdict
+from pathlib import Path, PurePath
+from warnings import warn
+
+from utl_lib.handler_ast import UTLParseHandlerAST
+from utl_lib.macro_xref import (MacroRef, UTLMacro, UTLMacroXref, write_macros_jsonl,
+                                write_refs_jsonl)
+from utl_lib.source_store import SourceStore
+from utl_lib.utl_parse_handler import UTLParseError
+from utl_lib.utl_yacc import UTLParser
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    name TEXT PRIMARY KEY,
+    value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    site TEXT NOT NULL,
+    package TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    parsed INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS macros (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS macro_params (
+    macro_id INTEGER NOT NULL REFERENCES macros(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    has_default INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS calls (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    macro TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS includes (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    included TEXT NOT NULL,
+    line INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS resolution_tables (
+    id INTEGER PRIMARY KEY,
+    site TEXT NOT NULL,
+    global_skin TEXT NOT NULL,
+    skin TEXT NOT NULL,
+    UNIQUE (site, global_skin, skin));
+CREATE TABLE IF NOT EXISTS resolutions (
+    table_id INTEGER NOT NULL REFERENCES resolution_tables(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    macro_id INTEGER NOT NULL REFERENCES macros(id) ON DELETE CASCADE,
+    tier INTEGER NOT NULL,
+    PRIMARY KEY (table_id, name));
+CREATE INDEX IF NOT EXISTS macros_name ON macros(name);
+CREATE INDEX IF NOT EXISTS macros_file ON macros(file_id);
+CREATE INDEX IF NOT EXISTS macro_params_macro ON macro_params(macro_id);
+CREATE INDEX IF NOT EXISTS calls_macro ON calls(macro);
+CREATE INDEX IF NOT EXISTS calls_file ON calls(file_id);
+CREATE INDEX IF NOT EXISTS includes_included ON includes(included);
+CREATE INDEX IF NOT EXISTS includes_file ON includes(file_id);
+"""
+"SQL to create the index tables, if they don't already exist."
+
+INCLUDES_ONLY = 2
+"""Value of ``files.parsed`` for a file whose includes were stored by
+:py:meth:`MacroIndex.store_includes`; its macros and calls are not indexed until the next
+:py:meth:`MacroIndex.index_tree`."""
+
+TIERS = ('global skin', 'application skin (custom)', 'application skin (certified)')
+"Where macro definitions are looked for, highest precedence first."
+
+
+def skin_packages(site, global_skin, skin):
+    """Returns the packages searched for macro definitions, in the order of :py:data:`TIERS`.
+
+    :param str site: The site directory name, e.g. ``richmond``.
+
+    :param str global_skin: The site's global skin, e.g. ``global-richmond``. May be ``''``.
+
+    :param str skin: The application skin, e.g. ``editorial/editorial-core-base_1.54.0.0``.
+        May be ``''``.
+
+    :returns list: Package names, as from :py:func:`package_of`. ``None`` for a tier that
+        doesn't apply.
+
+    """
+    return ['{}/global_skins/{}'.format(site, global_skin) if global_skin else None,
+            '{}/skins/{}'.format(site, skin) if skin else None,
+            'certified/skins/{}'.format(skin) if skin else None]
+
+
+def include_name(rel_path):
+    """Returns the name by which a file is included: its path below the nearest ``includes``
+    directory.
+
+    :param PurePath rel_path: The path of a file relative to the top of the export tree.
+
+    :returns str: The include name, or ``None`` if the file is not in an ``includes``
+        directory (so it is a top-level template, or some other file that isn't included).
+
+    """
+    parts = rel_path.parts
+    for pos in range(len(parts) - 2, -1, -1):
+        if parts[pos] == 'includes':
+            return '/'.join(parts[pos + 1:])
+    return None
+
+
+def include_target(include_node):
+    """Returns what an include statement includes, as stored in the ``includes`` table.
+
+    :param ASTNode include_node: An ``include`` node.
+
+    :returns str: The file name, for an include of a string literal; otherwise
+        ``'expression: '`` followed by the text of the expression, as ``includes.py`` reports
+        it.
+
+    """
+    if include_node.attributes["file"] != '<expr>':
+        return include_node.attributes["file"]
+    return 'expression: ' + str(include_node.children[0])
+
+
+def package_of(rel_path):
+    """Splits the path of a file into the site and package directories it belongs to.
+
+    ``certified/skins/editorial/editorial-core-base_1.54.0.0/includes/x.utl`` is in site
+    ``certified``, package ``certified/skins/editorial/editorial-core-base_1.54.0.0``.
+
+    :param PurePath rel_path: The path of a file relative to the top of the export tree.
+
+    :returns tuple: (site, package) as :py:class:`str`. Either may be ``''`` if the path is not
+        in the standard layout.
+
+    """
+    parts = rel_path.parts
+    if len(parts) < 2:
+        return '', ''
+    # skins are grouped by application, so they're one level deeper
+    depth = 4 if parts[1] == 'skins' else 3
+    if len(parts) <= depth:
+        return parts[0], ''
+    return parts[0], '/'.join(parts[:depth])
+
+
+class MacroIndex(object):
+    """An SQLite database of macro definitions, macro calls, and includes.
+
+    :param str db_file: The database file name. Created if it doesn't exist.
+
+    """
+
+    BATCH_SIZE = 200
+    "Number of files indexed per transaction."
+
+    def __init__(self, db_file):
+        self.db_file = db_file
+        self.db = sqlite3.connect(str(db_file))
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA foreign_keys = ON')
+        with self.db:
+            self.db.executescript(SCHEMA)
+        self._parser = None
+        self._resolutions = {}
+        "Resolution tables already loaded, keyed by (site, global skin, skin)."
+
+    def close(self):
+        """Closes the database connection."""
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def root(self):
+        """The top directory of the tree that was indexed, or ``None``."""
+        row = self.db.execute("SELECT value FROM settings WHERE name = 'root'").fetchone()
+        return Path(row[0]) if row else None
+
+    def _parse(self, program_text, filename):
+        """Parses `program_text` to an AST, reusing one parser for all files.
+
+        :returns ASTNode: The parse result, or ``None`` if the parse failed.
+
+        """
+        if self._parser is None:
+            self._parser = UTLParser([UTLParseHandlerAST()])
+        else:
+            self._parser.restart([UTLParseHandlerAST()])
+        try:
+            return self._parser.parse(program_text, filename=filename)
+        except UTLParseError:
+            return None
+
+    def _add_file(self, rel_path, digest, program_text):
+        """Parses a file and inserts its rows. Must be called within a transaction.
+
+        :param PurePath rel_path: The path of the file relative to the top of the tree.
+
+        :param str digest: The hash of the file contents.
+
+        :param str program_text: The contents of the file.
+
+        """
+        site, package = package_of(rel_path)
+        utldoc = self._parse(program_text, rel_path.name)
+        cursor = self.db.execute('INSERT INTO files (path, site, package, hash, parsed) '
+                                 'VALUES (?, ?, ?, ?, ?)',
+                                 (rel_path.as_posix(), site, package, digest,
+                                  1 if utldoc else 0))
+        if not utldoc:
+            return
+        file_id = cursor.lastrowid
+        index = utldoc.index_symbols()
+        params = []
+        for defn in index.get('macro_defn', ()):
+            decl = defn.children[0]
+            attrs = defn.attributes
+            cursor.execute('INSERT INTO macros (file_id, name, line, start, end) '
+                           'VALUES (?, ?, ?, ?, ?)',
+                           (file_id, decl.attributes["name"], attrs["line"], attrs["start"],
+                            attrs["end"]))
+            if decl.children:  # the param_list
+                for position, param in enumerate(decl.children[0].children):
+                    params.append((cursor.lastrowid, position, param.attributes["name"],
+                                   1 if param.children else 0))
+        self.db.executemany('INSERT INTO macro_params (macro_id, position, name, has_default) '
+                            'VALUES (?, ?, ?, ?)', params)
+        self.db.executemany('INSERT INTO calls (file_id, macro, line, start, end) '
+                            'VALUES (?, ?, ?, ?, ?)',
+                            [(file_id, node.attributes["macro_expr"], node.attributes["line"],
+                              node.attributes["start"], node.attributes["end"])
+                             for node in index.get('macro_call', ())])
+        self.db.executemany('INSERT INTO includes (file_id, included, line) VALUES (?, ?, ?)',
+                            [(file_id, include_target(node), node.attributes["line"])
+                             for node in index.get('include', ())])
+
+    def index_tree(self, root, verbose=False):
+        """Brings the index up to date with the ``.utl`` files under `root`.
+
+        :param Path root: The top directory of an export tree.
+
+        :param bool verbose: If ``True``, print the name of each file parsed.
+
+        :returns tuple: The number of files parsed, unchanged, and removed.
+
+        """
+        root = Path(root)
+        # files with only their includes stored count as changed
+        known = {row["path"]: (row["id"], None if row["parsed"] == INCLUDES_ONLY else row["hash"])
+                 for row in self.db.execute('SELECT id, path, hash, parsed FROM files')}
+        parsed = unchanged = 0
+        pending = []
+        for utl_file in sorted(root.rglob('*.utl')):
+            rel_path = utl_file.relative_to(root)
+            with utl_file.open('rb') as utlin:
+                contents = utlin.read()
+            digest = hashlib.sha1(contents).hexdigest()
+            file_id, old_digest = known.pop(rel_path.as_posix(), (None, None))
+            if digest == old_digest:
+                unchanged += 1
+                continue
+            pending.append((rel_path, file_id, digest, contents))
+            if len(pending) >= self.BATCH_SIZE:
+                parsed += self._index_batch(pending, verbose)
+                pending = []
+        parsed += self._index_batch(pending, verbose)
+
+        with self.db:
+            # anything left in known is no longer on disk
+            self.db.executemany('DELETE FROM files WHERE id = ?',
+                                [(file_id, ) for file_id, _ in known.values()])
+            if parsed or known:
+                # any definition may have changed; tables are rebuilt when next asked for
+                self.db.execute('DELETE FROM resolution_tables')
+                self._resolutions = {}
+            self.db.execute("INSERT OR REPLACE INTO settings (name, value) VALUES ('root', ?)",
+                            (str(root.resolve()), ))
+        return parsed, unchanged, len(known)
+
+    def _set_root(self, root):
+        """Records the top directory of the tree, or checks it matches the one recorded.
+
+        :raises ValueError: if the index is for a different tree.
+
+        """
+        root = Path(root).resolve()
+        current = self.root
+        if current is None:
+            with self.db:
+                self.db.execute("INSERT INTO settings (name, value) VALUES ('root', ?)",
+                                (str(root), ))
+        elif current != root:
+            raise ValueError("The index is for {}, not {}.".format(current, root))
+
+    def current_includes(self, root, rel_path):
+        """Returns the names of the files one file includes if the index has them for the
+        file's current contents. The file is never parsed.
+
+        :param Path root: The top directory of the export tree.
+
+        :param PurePath rel_path: The path of the file relative to `root`.
+
+        :returns tuple: The file's content hash, and the included names (as from
+            :py:func:`include_target`), or ``None`` if the file has changed since it was
+            indexed, was never indexed, or could not be parsed.
+
+        :raises ValueError: if the index is for a different tree.
+
+        """
+        self._set_root(root)
+        with (Path(root) / rel_path).open('rb') as utlin:
+            digest = hashlib.sha1(utlin.read()).hexdigest()
+        row = self.db.execute('SELECT id, hash, parsed FROM files WHERE path = ?',
+                              (rel_path.as_posix(), )).fetchone()
+        if row is None or row["hash"] != digest or not row["parsed"]:
+            return digest, None
+        return digest, [include[0] for include in self.db.execute(
+            'SELECT included FROM includes WHERE file_id = ? ORDER BY rowid', (row["id"], ))]
+
+    def store_includes(self, root, files):
+        """Stores the includes of files whose includes were found without the index, in a
+        single transaction. A file already in the index with the same hash is left alone;
+        otherwise its entry is replaced by one marked :py:data:`INCLUDES_ONLY`. Lines of
+        the includes are not known, and are stored as 0.
+
+        :param Path root: The top directory of the export tree.
+
+        :param list files: tuples of relative path, content hash (as from
+            :py:meth:`current_includes`), and included names.
+
+        :raises ValueError: if the index is for a different tree.
+
+        """
+        self._set_root(root)
+        replaced = False
+        with self.db:
+            for rel_path, digest, included in files:
+                row = self.db.execute('SELECT id, hash FROM files WHERE path = ?',
+                                      (rel_path.as_posix(), )).fetchone()
+                if row is not None:
+                    if row["hash"] == digest:
+                        continue
+                    self.db.execute('DELETE FROM files WHERE id = ?', (row["id"], ))
+                    replaced = True
+                site, package = package_of(rel_path)
+                file_id = self.db.execute(
+                    'INSERT INTO files (path, site, package, hash, parsed) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (rel_path.as_posix(), site, package, digest, INCLUDES_ONLY)).lastrowid
+                self.db.executemany(
+                    'INSERT INTO includes (file_id, included, line) VALUES (?, ?, 0)',
+                    [(file_id, name) for name in included])
+            if replaced:
+                # the replaced files' macros are gone from the index
+                self.db.execute('DELETE FROM resolution_tables')
+        if replaced:
+            self._resolutions = {}
+
+    def templates_including(self, name, site, global_skin='', skin=''):
+        """Finds the files which include `name`, directly or through any chain of includes,
+        and are not themselves in an ``includes`` directory: the top-level templates that
+        would be affected by a change to `name`.
+
+        Only files in the packages searched for a combination of skins (see
+        :py:func:`skin_packages`) are followed, since an include of the same name elsewhere
+        may find a different file.
+
+        :param str name: An include name, as from :py:func:`include_name`.
+
+        :param str site: The site directory name.
+
+        :param str global_skin: The site's global skin.
+
+        :param str skin: The application skin.
+
+        :returns list: The paths of the templates, sorted.
+
+        """
+        packages = [package for package in skin_packages(site, global_skin, skin) if package]
+        query = ('SELECT DISTINCT files.path FROM includes '
+                 'JOIN files ON files.id = includes.file_id '
+                 'WHERE includes.included = ? AND files.package IN ({})'.format(
+                     ', '.join('?' * len(packages))))
+        templates = set()
+        seen = {name}
+        pending = [name] if packages else []
+        while pending:
+            for row in self.db.execute(query, [pending.pop()] + packages):
+                includer = include_name(PurePath(row["path"]))
+                if includer is None:
+                    templates.add(row["path"])
+                elif includer not in seen:
+                    seen.add(includer)
+                    pending.append(includer)
+        return sorted(templates)
+
+    def _index_batch(self, pending, verbose):
+        """(Re)indexes a list of files in a single transaction.
+
+        :param list pending: tuples of relative path, old file id (or ``None``), content hash,
+            and content (as :py:class:`bytes`).
+
+        :returns int: The number of files indexed.
+
+        """
+        with self.db:
+            for rel_path, file_id, digest, contents in pending:
+                if verbose:
+                    print(rel_path)
+                if file_id is not None:
+                    self.db.execute('DELETE FROM files WHERE id = ?', (file_id, ))
+                self._add_file(rel_path, digest, contents.decode('utf-8', errors='replace'))
+        return len(pending)
+
+    def definitions(self, name):
+        """Finds the definitions of a macro.
+
+        :param str name: The macro name.
+
+        :returns list: :py:class:`sqlite3.Row` objects with the fields ``id``, ``name``,
+            ``path``, ``line``, ``start``, ``end``, and ``params`` (a comma-separated list).
+
+        """
+        return self.db.execute(
+            'SELECT macros.id, macros.name, files.path, macros.line, macros.start, macros.end, '
+            '  (SELECT group_concat(name, ",") FROM '
+            '     (SELECT name FROM macro_params WHERE macro_id = macros.id ORDER BY position)'
+            '  ) AS params '
+            'FROM macros JOIN files ON files.id = macros.file_id '
+            'WHERE macros.name = ? ORDER BY files.path, macros.start', (name, )).fetchall()
+
+    def calls(self, name):
+        """Finds the calls of a macro.
+
+        :param str name: The macro name, as written in the call.
+
+        :returns list: :py:class:`sqlite3.Row` objects with the fields ``path``, ``line``,
+            ``start``, and ``end``.
+
+        """
+        return self.db.execute(
+            'SELECT files.path, calls.line, calls.start, calls.end '
+            'FROM calls JOIN files ON files.id = calls.file_id '
+            'WHERE calls.macro = ? ORDER BY files.path, calls.start', (name, )).fetchall()
+
+    def resolutions(self, site, global_skin='', skin=''):
+        """Returns the winning definition of every macro name for a combination of skins.
+
+        The table is built the first time it is asked for, and stored in the database until
+        the index changes.
+
+        :param str site: The site directory name.
+
+        :param str global_skin: The site's global skin.
+
+        :param str skin: The application skin.
+
+        :returns dict: For each macro name, an :py:class:`sqlite3.Row` with the fields
+            ``name``, ``id``, ``path``, ``line``, ``start``, ``end``, and ``tier`` (an index
+            into :py:data:`TIERS`).
+
+        """
+        key = (site, global_skin or '', skin or '')
+        try:
+            return self._resolutions[key]
+        except KeyError:
+            pass
+        row = self.db.execute('SELECT id FROM resolution_tables '
+                              'WHERE site = ? AND global_skin = ? AND skin = ?', key).fetchone()
+        table_id = row[0] if row else self._build_resolutions(*key)
+        table = {row["name"]: row for row in self.db.execute(
+            'SELECT macros.name, macros.id, files.path, macros.line, macros.start, macros.end, '
+            '  resolutions.tier '
+            'FROM resolutions JOIN macros ON macros.id = resolutions.macro_id '
+            '  JOIN files ON files.id = macros.file_id '
+            'WHERE resolutions.table_id = ?', (table_id, ))}
+        self._resolutions[key] = table
+        return table
+
+    def _build_resolutions(self, site, global_skin, skin):
+        """Finds the winning definitions for a combination of skins and stores them.
+
+        Within a tier, if a name is defined more than once, the first definition by path and
+        position wins.
+
+        :returns int: The id of the new row in ``resolution_tables``.
+
+        """
+        packages = skin_packages(site, global_skin, skin)
+        winners = {}
+        with self.db:
+            cursor = self.db.execute('INSERT INTO resolution_tables (site, global_skin, skin) '
+                                     'VALUES (?, ?, ?)', (site, global_skin, skin))
+            table_id = cursor.lastrowid
+            for tier, package in enumerate(packages):
+                if package is None:
+                    continue
+                for row in self.db.execute(
+                        'SELECT macros.name, macros.id '
+                        'FROM macros JOIN files ON files.id = macros.file_id '
+                        'WHERE files.package = ? ORDER BY files.path, macros.start',
+                        (package, )):
+                    if row["name"] not in winners:
+                        winners[row["name"]] = (table_id, row["name"], row["id"], tier)
+            self.db.executemany('INSERT INTO resolutions (table_id, name, macro_id, tier) '
+                                'VALUES (?, ?, ?, ?)', winners.values())
+        return table_id
+
+    def included_by(self, name):
+        """Finds the files that include `name`.
+
+        :param str name: The name of the included file, as written in the include statement.
+
+        :returns list: :py:class:`sqlite3.Row` objects with the fields ``path`` and ``line``
+            (0 if the includes were stored by :py:meth:`store_includes`).
+
+        """
+        return self.db.execute(
+            'SELECT files.path, includes.line '
+            'FROM includes JOIN files ON files.id = includes.file_id '
+            'WHERE includes.included = ? ORDER BY files.path, includes.line',
+            (name, )).fetchall()
+
+    _MACRO_ROWS = ('SELECT files.path, macros.name, macros.line, macros.start, macros.end '
+                   'FROM macros JOIN files ON files.id = macros.file_id '
+                   'ORDER BY files.path, macros.start')
+    _CALL_ROWS = ('SELECT files.path, calls.macro, calls.line, calls.start, calls.end '
+                  'FROM calls JOIN files ON files.id = calls.file_id '
+                  'ORDER BY files.path, calls.start')
+
+    def _source(self, store, sources, path):
+        """Returns the source of the text of file `path`, adding it to `store` the first time.
+
+        :param SourceStore store: The store the file's text will be read from.
+
+        :param dict sources: The sources already added, keyed by path.
+
+        :param str path: A path relative to :py:attr:`root`.
+
+        :returns tuple: The `store` and the file's id in it; or ``None``, with a warning, if the
+            file isn't on disk.
+
+        """
+        try:
+            return sources[path]
+        except KeyError:
+            pass
+        if (self.root / path).is_file():
+            # text is read from the file only when it's asked for
+            sources[path] = (store, store.add_file(path, self.root / path))
+        else:
+            warn("{} is in the index, but not on disk.".format(path))
+            sources[path] = None
+        return sources[path]
+
+    @staticmethod
+    def _macro(row, source):
+        """:returns UTLMacro: The macro in a row of :py:attr:`_MACRO_ROWS`."""
+        return UTLMacro({"name": row["name"], "file": row["path"], "line": row["line"],
+                         "start": row["start"], "end": row["end"]}, source=source)
+
+    @staticmethod
+    def _call(row, source):
+        """:returns MacroRef: The macro call in a row of :py:attr:`_CALL_ROWS`."""
+        return MacroRef(row["path"], row["line"], row["macro"], row["start"], row["end"],
+                        source)
+
+    def load_xref(self):
+        """Loads every macro definition and call in the index into memory.
+
+        Macro and call text is read from the files under :py:attr:`root` when needed; nothing
+        is parsed. Files are named by their path relative to :py:attr:`root`.
+
+        :returns UTLMacroXref: A cross-reference of all the indexed files.
+
+        """
+        xref = UTLMacroXref()
+        if self.root is None:
+            return xref
+        sources = {}
+        macros = defaultdict(list)
+        for row in self.db.execute(self._MACRO_ROWS):
+            source = self._source(xref.sources, sources, row["path"])
+            if source is not None:
+                macros[row["path"]].append(self._macro(row, source))
+        calls = defaultdict(list)
+        for row in self.db.execute(self._CALL_ROWS):
+            source = self._source(xref.sources, sources, row["path"])
+            if source is not None:
+                calls[row["path"]].append(self._call(row, source))
+        for path in sorted(set(macros) | set(calls)):
+            xref.add_records(path, macros[path], calls[path], sources[path][1])
+        return xref
+
+    def write_jsonl(self, macro_stream, ref_stream):
+        """Writes every macro definition and call in the index as JSON Lines (see
+        :py:func:`~utl_lib.macro_xref.write_macros_jsonl`). Rows are streamed from the
+        database, so memory use doesn't grow with the size of the index.
+
+        :param TextIO macro_stream: Where macro definitions are written.
+
+        :param TextIO ref_stream: Where macro calls are written.
+
+        :returns tuple: The number of macros and calls written.
+
+        """
+        if self.root is None:
+            return 0, 0
+        sources = {}
+        with SourceStore(max_open=4) as store:
+            macro_count = write_macros_jsonl(
+                (self._macro(row, source) for row in self.db.execute(self._MACRO_ROWS)
+                 for source in [self._source(store, sources, row["path"])] if source),
+                macro_stream)
+            ref_count = write_refs_jsonl(
+                (self._call(row, source) for row in self.db.execute(self._CALL_ROWS)
+                 for source in [self._source(store, sources, row["path"])] if source),
+                ref_stream)
+        return macro_count, ref_count
+
+    def macro_names(self):
+        """:returns list: The names of all defined macros, sorted."""
+        return [row[0] for row in
+                self.db.execute('SELECT DISTINCT name FROM macros ORDER BY name')]
+
+    def failed_files(self):
+        """:returns list: The paths of files that could not be parsed."""
+        return [row[0] for row in
+                self.db.execute('SELECT path FROM files WHERE parsed = 0 ORDER BY path')]
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
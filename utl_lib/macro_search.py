@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Search for macro names by prefix, by dotted segment, or allowing for typos.
+
+Macro names like ``core_base_library.asset_image_url`` are long, and people tend to remember
+only part of them. :py:class:`MacroNameIndex` keeps a sorted list of keys for prefix searches
+(each name is also keyed by each of its dotted tails, so ``asset_im`` finds the name above), and
+an index of character trigrams to find candidates for a fuzzy match quickly. Names can be added
+and removed one at a time, so the index can follow a
+:py:class:`~utl_lib.macro_xref.UTLMacroXref` as documents are replaced.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+
+def name_keys(name):
+    """Returns the search keys for a macro name: the name, and each of the tails starting after
+    a ``.``, in lower case.
+
+    >>> name_keys('core_base_library.Asset_Image_URL')
+    ['core_base_library.asset_image_url', 'asset_image_url']
+
+    """
+    name = name.lower()
+    keys = [name]
+    pos = name.find('.')
+    while pos != -1:
+        keys.append(name[pos + 1:])
+        pos = name.find('.', pos + 1)
+    return keys
+
+
+def trigrams(key):
+    """:returns set: The three-character substrings of `key`, with ``^`` and ``$`` marking the
+    start and end.
+
+    """
+    padded = '^' + key + '$'
+    return set(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def edit_distance(first, second, limit):
+    """Returns the Levenshtein distance between two strings, or ``limit + 1`` if it is more than
+    `limit` (the calculation stops as soon as that is certain).
+
+    :param str first: A string.
+
+    :param str second: Another string.
+
+    :param int limit: The largest distance of interest.
+
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for i, char1 in enumerate(first, 1):
+        current = [i]
+        for j, char2 in enumerate(second, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char1 != char2)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+class MacroNameIndex(object):
+    """An in-memory index of macro names for prefix and fuzzy searches. Searches ignore case.
+
+    :param iterable names: Names to be added to the index initially.
+
+    """
+
+    def __init__(self, names=()):
+        self._names = set()
+        self._keys = []
+        "Sorted list of (key, name) pairs, from :py:func:`name_keys`."
+        self._key_names = defaultdict(set)
+        "Names keyed by each of their keys."
+        self._grams = defaultdict(set)
+        "Keys by their trigrams."
+        self._lengths = defaultdict(set)
+        "Keys by their length."
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(sorted(self._names))
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def add(self, name):
+        """Adds `name` to the index. Adding a name that is already present has no effect.
+
+        :param str name: A macro name.
+
+        """
+        if name in self._names:
+            return
+        self._names.add(name)
+        for key in name_keys(name):
+            insort(self._keys, (key, name))
+            if not self._key_names[key]:
+                for gram in trigrams(key):
+                    self._grams[gram].add(key)
+                self._lengths[len(key)].add(key)
+            self._key_names[key].add(name)
+
+    def remove(self, name):
+        """Removes `name` from the index.
+
+        :param str name: A macro name.
+
+        :raises KeyError: if `name` is not in the index.
+
+        """
+        self._names.remove(name)
+        for key in name_keys(name):
+            del self._keys[bisect_left(self._keys, (key, name))]
+            names = self._key_names[key]
+            names.discard(name)
+            if names:
+                continue
+            del self._key_names[key]
+            for gram in trigrams(key):
+                self._discard(self._grams, gram, key)
+            self._discard(self._lengths, len(key), key)
+
+    @staticmethod
+    def _discard(index, item, key):
+        """Removes `key` from the set ``index[item]``, and the set if it is then empty."""
+        keys = index[item]
+        keys.discard(key)
+        if not keys:
+            del index[item]
+
+    def prefix(self, text, limit=None):
+        """Finds the names which start with `text`, or have a dotted segment which starts with
+        `text`.
+
+        :param str text: The start of a name or segment.
+
+        :param int limit: The most names to return; ``None`` for all of them.
+
+        :returns list: The matching names, sorted by the name or segment that matched.
+
+        """
+        text = text.lower()
+        found = []
+        seen = set()
+        pos = bisect_left(self._keys, (text, ''))
+        while pos < len(self._keys) and self._keys[pos][0].startswith(text):
+            if len(found) == limit:
+                break
+            name = self._keys[pos][1]
+            if name not in seen:
+                seen.add(name)
+                found.append(name)
+            pos += 1
+        return found
+
+    def fuzzy(self, text, max_distance=2, limit=10):
+        """Finds the names closest to `text`, allowing for typos.
+
+        A name matches if its full name, or one of its dotted tails, is within `max_distance`
+        edits (insertions, deletions or substitutions) of `text`. Short queries allow fewer
+        edits (one per four characters, rounded to nearest), since otherwise nearly every short
+        name would match.
+
+        :param str text: A (possibly misspelled) name.
+
+        :param int max_distance: The most edits allowed, for a long enough `text`.
+
+        :param int limit: The most names to return; ``None`` for all of them.
+
+        :returns list: The matching names, closest first, then in name order.
+
+        """
+        text = text.lower()
+        max_distance = min(max_distance, (len(text) + 1) // 4)
+        query_grams = trigrams(text)
+        # each edit changes at most 3 trigrams, so a match must share at least this many
+        needed = len(query_grams) - 3 * max_distance
+        if needed > 0:
+            counts = defaultdict(int)
+            for gram in query_grams:
+                for key in self._grams.get(gram, ()):
+                    counts[key] += 1
+            candidates = [key for key, count in counts.items()
+                          if count >= needed and abs(len(key) - len(text)) <= max_distance]
+        else:
+            candidates = [key for length in range(len(text) - max_distance,
+                                                  len(text) + max_distance + 1)
+                          for key in self._lengths.get(length, ())]
+        distances = {}
+        for key in candidates:
+            distance = edit_distance(text, key, max_distance)
+            if distance <= max_distance:
+                for name in self._key_names[key]:
+                    distances[name] = min(distance, distances.get(name, distance))
+        matches = sorted((distance, name) for name, distance in distances.items())
+        return [name for _, name in matches[:limit]]
+
+    def search(self, text, limit=20):
+        """Finds names by prefix, then adds the closest fuzzy matches if there's room.
+
+        :param str text: Part of a name, as typed by someone.
+
+        :param int limit: The most names to return.
+
+        :returns list: Prefix matches, followed by fuzzy matches closest first.
+
+        """
+        found = self.prefix(text, limit)
+        if len(found) < limit:
+            already = set(found)
+            found.extend(name for name in self.fuzzy(text, limit=limit)
+                         if name not in already)
+        return found[:limit]
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
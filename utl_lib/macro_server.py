@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A small HTTP service to look up macro definitions and calls.
+
+All macros are loaded into a :py:class:`~utl_lib.macro_xref.UTLMacroXref` when the server
+starts, so requests never touch the parser or the database. Each request is handled in its own
+thread. Responses are JSON:
+
+``GET /macro/<name>``
+    ``{"name": ..., "definitions": [...], "calls": [...]}``; 404 if the macro is neither defined
+    nor called.
+
+``GET /definitions/<name>``
+    A list of ``{"file": ..., "line": ..., "start": ..., "end": ..., "text": ...}``.
+
+``GET /calls/<name>``
+    A list of ``{"file": ..., "line": ..., "start": ..., "call_text": ...}``.
+
+``GET /search/<text>``
+    A list of macro names matching `text` by prefix or with typos (see
+    :py:meth:`~utl_lib.macro_search.MacroNameIndex.search`).
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import json
+import threading
+from collections import OrderedDict
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from urllib.parse import unquote, urlsplit
+
+
+def definition_info(macro):
+    """:returns dict: The JSON-ready form of a :py:class:`~utl_lib.macro_xref.UTLMacro`
+    definition.
+
+    """
+    return {"file": macro.file, "line": macro.line, "start": macro.start, "end": macro.end,
+            "text": macro.text}
+
+
+def call_info(ref):
+    """:returns dict: The JSON-ready form of a macro reference from
+    :py:meth:`~utl_lib.macro_xref.UTLMacroXref.callers`.
+
+    """
+    return {"file": ref["file"], "line": ref["line"], "start": ref["start"],
+            "call_text": ref["call_text"]}
+
+
+class MacroLookupServer(ThreadingMixIn, HTTPServer):
+    """A threaded HTTP server answering macro lookups from an in-memory cross-reference.
+
+    :param tuple server_address: The (host, port) to listen on.
+
+    :param UTLMacroXref xref: The macros to be served.
+
+    :param bool quiet: If ``True``, don't log each request to stderr.
+
+    :param int cache_size: The most encoded responses to keep.
+
+    """
+    daemon_threads = True
+
+    def __init__(self, server_address, xref, quiet=False, cache_size=1024):
+        super().__init__(server_address, MacroRequestHandler)
+        self.xref = xref
+        self.quiet = quiet
+        self.cache_size = cache_size
+        self._responses = OrderedDict()
+        "Encoded responses, keyed by (request type, macro name), least recently used first."
+        self._lock = threading.Lock()
+
+    def response(self, kind, name):
+        """Returns the encoded JSON body for a request, or ``None`` if there is nothing to
+        return. Bodies for macros which are defined or called, and for searches, are cached,
+        since the cross-reference doesn't change while serving; requests for unknown names
+        aren't, so clients can't fill the cache with them.
+
+        :param str kind: One of ``'macro'``, ``'definitions'``, ``'calls'``, or ``'search'``.
+
+        :param str name: A macro name, or the text to search for.
+
+        """
+        with self._lock:
+            try:
+                self._responses.move_to_end((kind, name))
+                return self._responses[kind, name]
+            except KeyError:
+                pass
+        if kind == 'search':
+            body = self.xref.names.search(name)
+        else:
+            definitions = [definition_info(macro) for macro in self.xref.lookup(name)]
+            calls = [call_info(ref) for ref in self.xref.callers(name)]
+            if not (definitions or calls):
+                return None if kind == 'macro' else b'[]'
+            if kind == 'definitions':
+                body = definitions
+            elif kind == 'calls':
+                body = calls
+            else:
+                body = {"name": name, "definitions": definitions, "calls": calls}
+        body = json.dumps(body).encode('utf-8')
+        # a race here just means the same value is computed twice
+        with self._lock:
+            self._responses[kind, name] = body
+            while len(self._responses) > self.cache_size:
+                self._responses.popitem(last=False)
+        return body
+
+
+class MacroRequestHandler(BaseHTTPRequestHandler):
+    """Handles one request to a :py:class:`MacroLookupServer`."""
+    server_version = 'UTLMacroLookup/1.0'
+    protocol_version = 'HTTP/1.1'  # keep connections open between requests
+    KINDS = ('macro', 'definitions', 'calls', 'search')
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Looks up a macro, sends the result."""
+        parts = urlsplit(self.path).path.strip('/').split('/', 1)
+        if len(parts) != 2 or parts[0] not in self.KINDS or not parts[1]:
+            self._send(400, {"error": "Expected /macro/<name>, /definitions/<name>, "
+                                      "/calls/<name>, or /search/<text>."})
+            return
+        name = unquote(parts[1])
+        body = self.server.response(parts[0], name)
+        if body is None:
+            self._send(404, {"error": "Macro {} not found.".format(name)})
+        else:
+            self._send(200, body)
+
+    def _send(self, status, body):
+        """Sends a JSON response.
+
+        :param int status: The HTTP status code.
+
+        :param (bytes or dict) body: Encoded JSON, or a value to be encoded.
+
+        """
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -11,22 +11,32 @@
 
 """
 from collections import defaultdict
+import collections
 import json
 
 from utl_lib.ast_node import ASTNode
+from utl_lib.macro_search import MacroNameIndex
+from utl_lib.source_store import SourceStore
 
 
 class UTLMacro(object):
     """A record of a specific UTL macro, including its definition and/or calls.
 
     :param object macro_defn: An instance of ASTNode whose type is 'macro_defn', OR a dictionary
-        containing the fields [name, file, start, end, line, references].
+        containing the fields [name, file, start, end, line, references]. references may be
+        left out.
 
-    :param str code_text: The source code text of the macro definition.
+    :param str code_text: The source code text of the macro definition. May be ``None`` if
+        `source` is given.
+
+    :param tuple source: A :py:class:`~utl_lib.source_store.SourceStore` and a file id in it;
+        the text of the macro is fetched from there when needed, instead of being kept.
 
     """
 
-    def __init__(self, macro_defn, code_text):
+    def __init__(self, macro_defn, code_text=None, source=None):
+        self._text = code_text
+        self._source = source
         if isinstance(macro_defn, ASTNode):
             self.file = macro_defn.attributes["file"]
             # first child of macro_defn is the declaration
@@ -34,7 +44,6 @@ class UTLMacro(object):
             self.start = macro_defn.attributes["start"]
             self.end = macro_defn.attributes["end"]
             self.line = macro_defn.attributes["line"]
-            self.text = code_text
             self.references = defaultdict(list)
             "A dictionary keyed by source file, of dictionaries keyed by line number"
         else:
@@ -43,12 +52,23 @@ class UTLMacro(object):
             self.start = macro_defn["start"]
             self.end = macro_defn["end"]
             self.line = macro_defn["line"]
-            self.text = code_text
             self.references = defaultdict(list)
-            for fname in macro_defn["references"]:
+            for fname in macro_defn.get("references", ()):
                 for item in macro_defn["references"][fname]:
                     self.add_call(item)
 
+    @property
+    def text(self):
+        """The source code text of the macro definition."""
+        if self._text is None and self._source is not None:
+            store, file_id = self._source
+            return store.snippet(file_id, self.start, self.end)
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+
     def __eq__(self, other):
         """Define functional equality for :py:class:`~utl_lib.macro_xref.UTLMacro` instances."""
         if self is other:
@@ -72,11 +92,22 @@ class UTLMacro(object):
     def __str__(self):
         return "{}() ({}:{:,})".format(self.name, self.file, self.line)
 
+    def as_dict(self, references=True):
+        """Returns a :py:class:`dict` of the fields of this macro, which can be passed to
+        :py:class:`UTLMacro` to create an equal instance.
+
+        :param bool references: If ``False``, leave out the calls to this macro.
+
+        """
+        result = {"name": self.name, "file": self.file, "start": self.start, "end": self.end,
+                  "line": self.line, "text": self.text, }
+        if references:
+            result["references"] = self.references
+        return result
+
     def json(self):
         """Returns a :py:class:`str` containing a JSON structure representing this object."""
-        return json.dumps({"name": self.name, "file": self.file, "start": self.start,
-                           "end": self.end, "line": self.line, "text": self.text,
-                           "references": self.references, })
+        return json.dumps(self.as_dict(), default=dict)
 
     @classmethod
     def from_json(cls, json_str):
@@ -89,73 +120,375 @@ class UTLMacro(object):
         return UTLMacro(data, data["text"])
 
 
+class MacroRef(collections.Mapping):
+    """A call of a macro, which acts like a read-only dictionary with the keys ``file``,
+    ``line``, ``macro``, ``start``, and ``call_text``. The call text is fetched from a
+    :py:class:`~utl_lib.source_store.SourceStore` when asked for, instead of being kept.
+
+    :param str file: The name of the file containing the call.
+
+    :param int line: The line number of the call.
+
+    :param str macro: The name of the macro called.
+
+    :param int start: The offset of the start of the call.
+
+    :param int end: The offset of the end of the call.
+
+    :param tuple source: A :py:class:`~utl_lib.source_store.SourceStore` and the id of the
+        file's text in it.
+
+    """
+    __slots__ = ('file', 'line', 'macro', 'start', 'end', '_source')
+    KEYS = ('file', 'line', 'call_text', 'macro', 'start')
+
+    def __init__(self, file, line, macro, start, end, source):
+        # pylint: disable=too-many-arguments
+        self.file = file
+        self.line = line
+        self.macro = macro
+        self.start = start
+        self.end = end
+        self._source = source
+
+    def __getitem__(self, key):
+        if key == 'call_text':
+            store, file_id = self._source
+            return store.snippet(file_id, self.start, self.end)
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class UTLMacroXref(object):
     """A cross-reference of macro calls and macro definitions from UTL source.
 
-    :param ASTNode utldoc_node: A node from an AST tree.
+    Documents can be added, removed, or replaced after the cross-reference is created; the
+    indexes are updated for just the document affected. The lists of all macros, references,
+    and top nodes are built from the documents' records when asked for.
+
+    :param ASTNode utldoc_node: A node from an AST tree. If ``None``, the cross-reference starts
+        out empty.
+
+    :param str program_text: The source code parsed into `utldoc_node`.
 
     """
 
-    def __init__(self, utldoc_node, program_text):
-        # make a list of top nodes, since we may have multiple
-        self.topnodes = [utldoc_node]
-        self.texts = {utldoc_node.attributes["file"]: program_text}
-        self.macros = self._find_macros(utldoc_node, program_text)
-        self.references = self._find_refs(utldoc_node, program_text)
-        for ref in self.references:
-            for macro in self.macros:
-                if ref["macro"] == macro.name:
-                    macro.add_call(ref)
+    def __init__(self, utldoc_node=None, program_text=None):
+        self.sources = SourceStore()
+        "The text of each document, from which macro and call text is fetched."
+        self._macro_index = defaultdict(list)
+        "Macros keyed by name. A list, since a name can be defined more than once."
+        self._ref_index = defaultdict(list)
+        "Macro references keyed by the name of the macro called."
+        self._documents = {}
+        "For each document, its top node, macros, and references."
+        self.names = MacroNameIndex()
+        "The names of all defined macros, for prefix and fuzzy searches."
+        if utldoc_node is not None:
+            self.add_document(utldoc_node.attributes["file"], utldoc_node, program_text)
+
+    @property
+    def topnodes(self):
+        """The top nodes of the documents added with one, in the order added."""
+        return [node for node, _, _, _ in self._documents.values() if node is not None]
+
+    @property
+    def macros(self):
+        """The :py:class:`UTLMacro` instances defined in every document, in the order the
+        documents were added.
+
+        """
+        return [macro for _, macros, _, _ in self._documents.values() for macro in macros]
+
+    @property
+    def references(self):
+        """The macro calls in every document, in the order the documents were added."""
+        return [ref for _, _, refs, _ in self._documents.values() for ref in refs]
+
+    @property
+    def texts(self):
+        """The source code of documents added with their text, keyed by document name."""
+        return self.sources.texts
+
+    @property
+    def files(self):
+        """The names of the documents in this cross-reference."""
+        return list(self._documents)
+
+    def records(self):
+        """:returns generator: A ``(macros, refs)`` pair for each document: the
+        :py:class:`UTLMacro` instances defined in it, and the macro calls in it.
+
+        """
+        for _, macros, refs, _ in self._documents.values():
+            yield macros, refs
+
+    def add_document(self, file, utldoc_node, program_text):
+        """Adds the macros and macro calls of a document to the cross-reference.
+
+        :param str file: A name for the document, used as the key for :py:attr:`texts`.
+
+        :param ASTNode utldoc_node: The top node of the parsed document.
+
+        :param str program_text: The source code parsed into `utldoc_node`.
+
+        :raises ValueError: if a document named `file` has already been added.
+
+        """
+        if file in self._documents:
+            raise ValueError("Document '{}' is already in the cross-reference.".format(file))
+        # one walk of the tree, then both searches below are lookups
+        utldoc_node.index_symbols()
+        source = (self.sources, self.sources.add_text(file, program_text))
+        self.add_records(file, self._find_macros(utldoc_node, source),
+                         self._find_refs(utldoc_node, source), source[1], utldoc_node)
+
+    def add_records(self, file, macros, refs, file_id=None, utldoc_node=None):
+        """Adds a document's macros and macro calls that have already been found; for example,
+        loaded from a :py:class:`~utl_lib.macro_index.MacroIndex`.
+
+        :param str file: A name for the document.
+
+        :param list macros: The :py:class:`UTLMacro` instances defined in the document.
+
+        :param list refs: The macro calls in the document, in the format of
+            :py:attr:`references`.
+
+        :param int file_id: The id of the document's text in :py:attr:`sources`, if it was
+            added there. It is removed along with the document.
+
+        :param ASTNode utldoc_node: The top node of the parsed document, if there is one.
+
+        :raises ValueError: if a document named `file` has already been added.
+
+        """
+        if file in self._documents:
+            raise ValueError("Document '{}' is already in the cross-reference.".format(file))
+        self._documents[file] = (utldoc_node, macros, refs, file_id)
+        # new macros get calls from documents already added...
+        for macro in macros:
+            if macro.name not in self._macro_index:
+                self.names.add(macro.name)
+            self._macro_index[macro.name].append(macro)
+            for ref in self._ref_index.get(macro.name, ()):
+                macro.add_call(ref)
+        # ...and new calls are added to all macros, old and new
+        for ref in refs:
+            self._ref_index[ref["macro"]].append(ref)
+            for macro in self._macro_index.get(ref["macro"], ()):
+                macro.add_call(ref)
+
+    def remove_document(self, file):
+        """Removes the macros and macro calls of a document from the cross-reference.
+
+        :param str file: The name given to :py:meth:`add_document`.
+
+        :raises KeyError: if there is no document named `file`.
+
+        """
+        _, macros, refs, file_id = self._documents.pop(file)
+        if file_id is not None:
+            self.sources.remove(file_id)
+
+        gone = set(id(macro) for macro in macros)
+        for name in set(macro.name for macro in macros):
+            self._drop(self._macro_index, name, gone)
+            if name not in self._macro_index:
+                self.names.remove(name)
+
+        gone = set(id(ref) for ref in refs)
+        for name in set(ref["macro"] for ref in refs):
+            self._drop(self._ref_index, name, gone)
+            for macro in self._macro_index.get(name, ()):
+                for ref_file in list(macro.references):
+                    calls = [ref for ref in macro.references[ref_file] if id(ref) not in gone]
+                    if calls:
+                        macro.references[ref_file] = calls
+                    else:
+                        del macro.references[ref_file]
+
+    @staticmethod
+    def _drop(index, name, gone):
+        """Removes items whose :py:func:`id` is in `gone` from ``index[name]``."""
+        items = [item for item in index[name] if id(item) not in gone]
+        if items:
+            index[name] = items
+        else:
+            del index[name]
+
+    def replace_document(self, file, utldoc_node, program_text):
+        """Replaces a document with a new version; for example, after the source file changes.
+
+        Same as :py:meth:`remove_document` followed by :py:meth:`add_document`, except it's not
+        an error if there was no document named `file`.
+
+        """
+        if file in self._documents:
+            self.remove_document(file)
+        self.add_document(file, utldoc_node, program_text)
+
+    def lookup(self, name):
+        """Returns the definitions of the macro `name`.
+
+        :param str name: The name of a macro.
+
+        :returns list: The :py:class:`~utl_lib.macro_xref.UTLMacro` instances named `name`, in
+            the order found. Empty if there are none.
+
+        """
+        return list(self._macro_index.get(name, ()))
+
+    def callers(self, name):
+        """Returns the calls of the macro `name`.
+
+        :param str name: The name of a macro.
+
+        :returns list: The references (as in :py:attr:`references`) to macro `name`, in the
+            order found. Empty if there are none.
+
+        """
+        return list(self._ref_index.get(name, ()))
 
     @staticmethod
-    def _find_macros(top_node, code_text):
+    def _find_macros(top_node, source):
         """Search the AST tree rooted at `top_node` and return a collection of
         :py:class:`~utl_lib.macro_xrf.utl_macro` instances, one for each macro-defn node in the
         tree.
 
         :param ASTNode top_node: The root of some AST tree representing parsed UTL code
 
-        :param str code_text: The actual text of the code parsed into `top_node`.
+        :param tuple source: The :py:class:`~utl_lib.source_store.SourceStore` and file id of
+            the text parsed into `top_node`.
 
         """
-        macros = []
-        if top_node.symbol == 'macro_defn':
-            macro_text = code_text[top_node.attributes["start"]:top_node.attributes["end"]]
-            new_macro = UTLMacro(top_node, macro_text)
-            macros.append(new_macro)
-        for kid in top_node.children:
-            macros += UTLMacroXref._find_macros(kid, code_text)
-        return macros
+        return [UTLMacro(node, source=source) for node in top_node.find_all('macro_defn')]
 
     @staticmethod
-    def _find_refs(top_node, code_text):
+    def _find_refs(top_node, source):
         """Find all macro calls in the tree rooted at `top_node`, return as list."""
         refs = []
-        if top_node.symbol == 'macro_call':
-            attrs = top_node.attributes
+        for node in top_node.find_all('macro_call'):
+            attrs = node.attributes
             assert isinstance(attrs["start"], int)
             assert isinstance(attrs["end"], int)
-            new_ref = {"file": attrs["file"],
-                       "line": attrs["line"],
-                       "call_text": code_text[attrs["start"]: attrs["end"]],
-                       "macro": attrs["macro_expr"],
-                       "start": attrs["start"]}
-            refs.append(new_ref)
-        for kid in top_node.children:
-            refs += UTLMacroXref._find_refs(kid, code_text)
+            refs.append(MacroRef(attrs["file"], attrs["line"], attrs["macro_expr"],
+                                 attrs["start"], attrs["end"], source))
         return refs
 
     def json(self):
         """Returns a :py:class:`str` containing the list of macros in a JSON format."""
-        json_str = '['
-        for macro in self.macros:
-            json_str += macro.json() + ',\n'
-        # remove final , becuase JSON is picky about that
-        if self.macros:
-            json_str = json_str[:-2]
-        json_str += ']'
-        return json_str
+        return '[' + ',\n'.join(macro.json() for macro in self.macros) + ']'
 
     def refs_json(self):
         """Returns a :py:class:`str` containing JSON of the list of macro references found."""
-        return json.dumps(self.references)
+        return json.dumps(self.references, default=dict)
+
+    def write_jsonl(self, macro_stream, ref_stream):
+        """Writes the macros and macro references as JSON Lines, with
+        :py:func:`write_macros_jsonl` and :py:func:`write_refs_jsonl`.
+
+        :param TextIO macro_stream: Where macro definitions are written.
+
+        :param TextIO ref_stream: Where macro calls are written.
+
+        """
+        write_macros_jsonl(self.macros, macro_stream)
+        write_refs_jsonl(self.references, ref_stream)
+
+    def load_jsonl(self, macro_stream, ref_stream):
+        """Adds the macros and references in JSON Lines written by :py:meth:`write_jsonl` (or
+        :py:meth:`~utl_lib.macro_index.MacroIndex.write_jsonl`). Each file named in the data
+        is added as a document, so exports from several sites can be loaded into one
+        cross-reference.
+
+        :param TextIO macro_stream: Lines of macro definitions.
+
+        :param TextIO ref_stream: Lines of macro calls.
+
+        :raises ValueError: if a file in the data is already in the cross-reference.
+
+        """
+        macros = defaultdict(list)
+        for macro in read_macros_jsonl(macro_stream):
+            macros[macro.file].append(macro)
+        refs = defaultdict(list)
+        for ref in read_refs_jsonl(ref_stream):
+            refs[ref["file"]].append(ref)
+        for file in sorted(set(macros) | set(refs)):
+            self.add_records(file, macros[file], refs[file])
+
+
+def write_macros_jsonl(macros, stream):
+    """Writes macro definitions as JSON Lines: one JSON object per line, as from
+    :py:meth:`UTLMacro.as_dict`, without the calls (see :py:func:`write_refs_jsonl`). Each
+    macro is written as it comes, so `macros` can be a generator of any length.
+
+    :param iterable macros: :py:class:`UTLMacro` instances.
+
+    :param TextIO stream: Where the lines are written.
+
+    :returns int: The number of macros written.
+
+    """
+    count = 0
+    for macro in macros:
+        stream.write(json.dumps(macro.as_dict(references=False)))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+def write_refs_jsonl(refs, stream):
+    """Writes macro calls as JSON Lines: one JSON object per line, with the keys of
+    :py:attr:`UTLMacroXref.references`.
+
+    :param iterable refs: Macro references, as :py:class:`MacroRef` instances or dicts.
+
+    :param TextIO stream: Where the lines are written.
+
+    :returns int: The number of references written.
+
+    """
+    count = 0
+    for ref in refs:
+        stream.write(json.dumps(dict(ref)))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+def read_macros_jsonl(stream):
+    """Reads macro definitions written by :py:func:`write_macros_jsonl`, one line at a time.
+
+    :param TextIO stream: The lines to read. Blank lines are skipped.
+
+    :returns generator: :py:class:`UTLMacro` instances.
+
+    """
+    for line in stream:
+        if line.strip():
+            data = json.loads(line)
+            yield UTLMacro(data, data["text"])
+
+
+def read_refs_jsonl(stream):
+    """Reads macro calls written by :py:func:`write_refs_jsonl`, one line at a time.
+
+    :param TextIO stream: The lines to read. Blank lines are skipped.
+
+    :returns generator: A :py:class:`dict` for each call.
+
+    """
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A content-addressed store for the files of certified packages.
+
+A certified package with a given name and version should be the same for every site, and most
+of its files don't change from one version to the next. So rather than extracting each export
+ZIP into ``certified/``, :py:class:`PackageStore` keeps the contents of each file once, named by
+its SHA-1 hash, and builds the package directory from hard links to them.
+
+A manifest for each package directory lists its files, with the hash of each and the CRC and
+size recorded in the ZIP. When the same package is imported again (from another site's export,
+say), comparing the ZIP's central directory to the manifest is enough to know nothing changed,
+so nothing is decompressed and only links are written.
+
+Stored files are made read-only, since a change to one would change every package linked to
+it. Where hard links can't be made (the store and the packages are on different file systems,
+say), files are copied.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path, PurePosixPath
+
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+"Permissions of stored files."
+
+
+def zip_entries(archive):
+    """Lists the files in a ZIP file from its central directory, without reading them.
+
+    :param zipfile.ZipFile archive: An open ZIP file.
+
+    :returns dict: ``[crc, size]`` for each file, keyed by name. Directories are omitted.
+
+    :raises ValueError: if a name is absolute or contains ``..``, so extracting it would write
+        outside the package directory.
+
+    """
+    entries = {}
+    for info in archive.infolist():
+        if info.filename.endswith('/'):
+            continue
+        name = PurePosixPath(info.filename)
+        if name.is_absolute() or '..' in name.parts:
+            raise ValueError("Unsafe file name '{}' in {}".format(info.filename,
+                                                                  archive.filename))
+        entries[info.filename] = [info.CRC, info.file_size]
+    return entries
+
+
+class PackageStore(object):
+    """File contents shared between package directories, with a manifest for each directory.
+
+    The store is safe to use from several threads at once, as long as each package directory
+    is installed by only one of them.
+
+    :param Path root: The store's directory; created if needed. Contents are kept in
+        ``objects/``, and manifests in ``manifests/``.
+
+    """
+
+    def __init__(self, root):
+        self.root = Path(str(root))
+        self.objects = self.root / 'objects'
+        self.manifests = self.root / 'manifests'
+
+    def object_path(self, digest):
+        """:returns Path: Where the contents with SHA-1 hash `digest` are stored."""
+        return self.objects / digest[:2] / digest[2:]
+
+    def manifest_path(self, package_dir):
+        """:returns Path: Where the manifest for `package_dir` (a path relative to the top of the
+        exported tree, like ``certified/blocks/some-block_1.0``) is stored.
+
+        """
+        return self.manifests / (str(package_dir) + '.json')
+
+    def load_manifest(self, package_dir):
+        """Reads the manifest for a package directory.
+
+        :param Path package_dir: The package directory, relative to the top of the tree.
+
+        :returns dict: ``{"hash": ..., "crc": ..., "size": ...}`` for each file, keyed by name;
+            or ``None`` if the package has not been stored.
+
+        """
+        try:
+            with self.manifest_path(package_dir).open('r') as manin:
+                return json.load(manin)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def matches(manifest, archive):
+        """:returns bool: ``True`` if the files in `archive` have the names, CRCs and sizes in
+        `manifest`.
+
+        """
+        entries = zip_entries(archive)
+        return entries.keys() == manifest.keys() and all(
+            [manifest[name]["crc"], manifest[name]["size"]] == entry
+            for name, entry in entries.items())
+
+    def _write_atomic(self, path, data, mode=None):
+        """Writes `data` to `path` by way of a temporary file, so that no reader (or other
+        writer) sees a partial file.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as tmpout:
+                tmpout.write(data)
+            if mode is not None:
+                os.chmod(tmp_name, mode)
+            os.replace(tmp_name, str(path))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def add_archive(self, archive, package_dir):
+        """Stores the contents of every file in `archive` which isn't already stored, and
+        writes the manifest for `package_dir`.
+
+        :param zipfile.ZipFile archive: The package's export file, open.
+
+        :param Path package_dir: The package directory, relative to the top of the tree.
+
+        :returns dict: The new manifest.
+
+        """
+        manifest = {}
+        for name, (crc, size) in zip_entries(archive).items():
+            data = archive.read(name)
+            digest = hashlib.sha1(data).hexdigest()
+            path = self.object_path(digest)
+            if not path.exists():
+                self._write_atomic(path, data, READ_ONLY)
+            manifest[name] = {"hash": digest, "crc": crc, "size": size}
+        self._write_atomic(self.manifest_path(package_dir),
+                           json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8'))
+        return manifest
+
+    def link(self, manifest, target_dir):
+        """Builds a package directory from stored files.
+
+        :param dict manifest: The package's manifest.
+
+        :param Path target_dir: The directory to hold the package's files. Files in it with
+            the same names as files in the package must not exist.
+
+        """
+        target_dir = Path(str(target_dir))
+        for name, entry in sorted(manifest.items()):
+            path = target_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            source = self.object_path(entry["hash"])
+            try:
+                os.link(str(source), str(path))
+            except OSError:
+                # different file system, too many links, or no hard links at all
+                shutil.copyfile(str(source), str(path))
+
+    def install(self, archive, package_dir, target_dir):
+        """Builds a package directory from an export file, storing its contents first unless
+        the stored manifest shows they're already there.
+
+        :param zipfile.ZipFile archive: The package's export file, open.
+
+        :param Path package_dir: The package directory, relative to the top of the tree.
+
+        :param Path target_dir: Where to build it.
+
+        :returns bool: ``True`` if the contents of `archive` had to be read and stored.
+
+        """
+        manifest = self.load_manifest(package_dir)
+        stored = manifest is None or not self.matches(manifest, archive)
+        if stored:
+            manifest = self.add_archive(archive, package_dir)
+        self.link(manifest, target_dir)
+        return stored
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -0,0 +1,142 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.8'
+
+_lr_method = 'LALR'
+
+_lr_signature = '87279BA393394FE197FF47083E422550'
+    
+_lr_action_items = {'$end':([0,1,2,3,4,7,9,20,21,22,52,53,54,55,56,81,82,83,84,85,86,87,88,89,164,],[-2,0,-1,-2,-5,-8,-10,-54,-55,-56,-4,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,]),'DOCUMENT':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[9,9,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,9,9,9,9,9,-21,9,9,9,]),'BREAK':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[17,17,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,17,17,17,17,17,-21,17,17,17,]),'CONTINUE':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[18,18,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,18,18,18,18,18,-21,18,18,18,]),'EXIT':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[19,19,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,19,19,19,19,19,-21,19,19,19,]),'SEMI':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,30,31,32,33,34,36,39,41,42,43,44,45,46,50,51,53,54,55,56,81,82,83,84,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,103,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,136,142,144,145,146,148,149,151,154,156,161,162,163,164,166,168,173,178,182,183,188,189,192,194,197,198,199,200,],[20,20,-5,20,20,-8,20,-10,20,20,20,20,20,20,20,20,20,20,-54,-55,-56,-47,-67,-68,-69,-70,-71,-111,20,-92,-93,-94,-95,-96,-97,-112,-103,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-48,-40,20,-57,-58,-61,-62,-44,-110,-91,-43,20,20,-36,-100,-45,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-98,20,-40,20,20,20,-37,-109,-39,-99,20,-41,20,-21,-102,-38,-46,20,-113,-101,-88,-42,20,20,-89,-90,20,20,]),'EOF':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,30,31,32,33,34,36,39,41,42,43,44,45,46,50,51,53,54,55,56,81,82,83,84,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,103,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,136,142,144,145,146,148,149,151,154,156,161,162,163,164,166,168,173,178,182,183,188,189,192,194,197,198,199,200,],[21,21,-5,21,21,-8,21,-10,21,21,21,21,21,21,21,21,21,21,-54,-55,-56,-47,-67,-68,-69,-70,-71,-111,21,-92,-93,-94,-95,-96,-97,-112,-103,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-48,-40,21,-57,-58,-61,-62,-44,-110,-91,-43,21,21,-36,-100,-45,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-98,21,-40,21,21,21,-37,-109,-39,-99,21,-41,21,-21,-102,-38,-46,21,-113,-101,-88,-42,21,21,-89,-90,21,21,]),'END_UTL':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,30,31,32,33,34,36,39,41,42,43,44,45,46,50,51,53,54,55,56,81,82,83,84,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,103,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,136,142,144,145,146,148,149,151,154,156,161,162,163,164,166,168,173,178,182,183,188,189,192,194,197,198,199,200,],[22,22,-5,22,22,-8,22,-10,22,22,22,22,22,22,22,22,22,22,-54,-55,-56,-47,-67,-68,-69,-70,-71,-111,22,-92,-93,-94,-95,-96,-97,-112,-103,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-48,-40,22,-57,-58,-61,-62,-44,-110,-91,-43,22,22,-36,-100,-45,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-98,22,-40,22,22,22,-37,-109,-39,-99,22,-41,22,-21,-102,-38,-46,22,-113,-101,-88,-42,22,22,-89,-90,22,22,]),'ECHO':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[23,23,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,23,23,23,23,23,-21,23,23,23,]),'FOR':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[24,24,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,24,24,24,24,24,-21,24,24,24,]),'IF':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[25,25,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,25,25,25,25,25,-21,25,25,25,]),'NOT':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,174,175,178,181,185,186,187,199,200,],[26,26,-5,-8,-10,-54,-55,-56,26,26,26,26,26,26,26,-67,-68,-69,-70,-71,26,26,26,26,26,-92,-93,-94,-95,-96,-97,26,26,-112,-103,-6,-7,-9,-11,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-12,-13,-14,-15,-16,-17,-18,-19,-20,26,-57,-58,-61,-62,26,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,26,-28,-29,-112,-68,26,26,26,-37,26,-109,-39,-22,-99,-30,-31,26,26,26,-21,-38,-26,-27,26,26,26,-23,-24,26,26,]),'EXCLAMATION':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,174,175,178,181,185,186,187,199,200,],[27,27,-5,-8,-10,-54,-55,-56,27,27,27,27,27,27,27,-67,-68,-69,-70,-71,27,27,27,27,27,-92,-93,-94,-95,-96,-97,27,27,-112,-103,-6,-7,-9,-11,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-12,-13,-14,-15,-16,-17,-18,-19,-20,27,-57,-58,-61,-62,27,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,27,-28,-29,-112,-68,27,27,27,-37,27,-109,-39,-22,-99,-30,-31,27,27,27,-21,-38,-26,-27,27,27,27,-23,-24,27,27,]),'PLUS':([0,3,4,7,9,10,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,169,174,175,178,181,185,186,187,194,196,199,200,],[28,28,-5,-8,-10,57,-54,-55,-56,28,28,28,28,28,28,28,-67,-68,-69,-70,-71,28,28,28,28,28,-92,-93,-94,-95,-96,-97,28,28,-112,-103,-6,-7,-9,-11,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-12,-13,-14,-15,-16,-17,-18,-19,-20,57,57,28,57,57,-58,-61,-62,57,57,57,-70,57,28,57,-36,57,57,-59,-60,-63,-64,-65,-66,57,-73,57,57,57,57,57,57,57,57,57,57,-84,57,57,-87,57,57,-98,28,-28,-29,-112,-68,57,28,28,28,-37,28,-109,-39,-22,-99,-30,-31,28,28,28,-21,-38,57,-26,-27,28,28,28,-23,-24,57,57,28,28,]),'MINUS':([0,3,4,7,9,10,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,169,174,175,178,181,185,186,187,194,196,199,200,],[29,29,-5,-8,-10,58,-54,-55,-56,29,29,29,29,29,29,29,-67,-68,-69,-70,-71,29,29,29,29,29,-92,-93,-94,-95,-96,-97,29,29,-112,-103,-6,-7,-9,-11,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-12,-13,-14,-15,-16,-17,-18,-19,-20,58,58,29,58,58,-58,-61,-62,58,58,58,-70,58,29,58,-36,58,58,-59,-60,-63,-64,-65,-66,58,-73,58,58,58,58,58,58,58,58,58,58,-84,58,58,-87,58,58,-98,29,-28,-29,-112,-68,58,29,29,29,-37,29,-109,-39,-22,-99,-30,-31,29,29,29,-21,-38,58,-26,-27,29,29,29,-23,-24,58,58,29,29,]),'ID':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,143,145,146,148,149,150,151,152,153,154,155,156,157,158,159,160,161,164,168,174,175,177,178,181,184,185,186,187,199,200,],[31,31,-5,-8,-10,-54,-55,-56,31,31,31,31,31,31,31,-67,-68,-69,-70,-71,31,31,31,31,31,-92,-93,-94,-95,-96,-97,31,31,111,-112,-103,-6,-7,-9,-11,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,141,-12,-13,-14,-15,-16,-17,-18,-19,-20,31,-57,-58,-61,-62,31,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,141,-28,-29,-112,-68,162,31,31,31,-37,31,-109,172,111,-39,-22,-99,-30,-31,31,31,31,-21,-38,-26,-27,189,31,31,172,31,-23,-24,31,31,]),'DEFAULT':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[35,35,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,35,35,35,35,35,-21,35,35,35,]),'RETURN':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[36,36,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,36,36,36,36,36,-21,36,36,36,]),'INCLUDE':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[37,37,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,37,37,37,37,37,-21,37,37,37,]),'CALL':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[38,38,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,38,38,38,38,38,-21,38,38,38,]),'WHILE':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[40,40,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,40,40,40,40,40,-21,40,40,40,]),'FALSE':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,174,175,178,181,185,186,187,199,200,],[42,42,-5,-8,-10,-54,-55,-56,42,42,42,42,42,42,42,-67,-68,-69,-70,-71,42,42,42,42,42,-92,-93,-94,-95,-96,-97,42,42,-112,-103,-6,-7,-9,-11,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-12,-13,-14,-15,-16,-17,-18,-19,-20,42,-57,-58,-61,-62,42,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,42,-28,-29,-112,-68,42,42,42,-37,42,-109,-39,-22,-99,-30,-31,42,42,42,-21,-38,-26,-27,42,42,42,-23,-24,42,42,]),'TRUE':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,174,175,178,181,185,186,187,199,200,],[43,43,-5,-8,-10,-54,-55,-56,43,43,43,43,43,43,43,-67,-68,-69,-70,-71,43,43,43,43,43,-92,-93,-94,-95,-96,-97,43,43,-112,-103,-6,-7,-9,-11,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-12,-13,-14,-15,-16,-17,-18,-19,-20,43,-57,-58,-61,-62,43,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,43,-28,-29,-112,-68,43,43,43,-37,43,-109,-39,-22,-99,-30,-31,43,43,43,-21,-38,-26,-27,43,43,43,-23,-24,43,43,]),'NULL':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,174,175,178,181,185,186,187,199,200,],[44,44,-5,-8,-10,-54,-55,-56,44,44,44,44,44,44,44,-67,-68,-69,-70,-71,44,44,44,44,44,-92,-93,-94,-95,-96,-97,44,44,-112,-103,-6,-7,-9,-11,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-12,-13,-14,-15,-16,-17,-18,-19,-20,44,-57,-58,-61,-62,44,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,44,-28,-29,-112,-68,44,44,44,-37,44,-109,-39,-22,-99,-30,-31,44,44,44,-21,-38,-26,-27,44,44,44,-23,-24,44,44,]),'LPAREN':([0,3,4,7,9,10,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,169,173,174,175,178,181,185,186,187,194,196,199,200,],[48,48,-5,-8,-10,80,-54,-55,-56,48,48,48,48,48,48,48,-67,-68,-69,-70,-71,48,48,48,48,48,-92,-93,-94,-95,-96,-97,48,48,-112,-103,-6,-7,-9,-11,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-12,-13,-14,-15,-16,-17,-18,-19,-20,80,80,48,80,80,80,80,80,80,80,80,-70,80,48,80,-36,80,80,152,-45,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-84,80,80,80,80,80,-98,48,-28,-29,-112,-68,80,48,48,48,-37,48,-109,-39,-22,-99,-30,-31,48,48,48,-21,-38,80,-46,80,80,48,48,48,-23,-24,80,80,48,48,]),'MACRO':([0,3,4,7,9,20,21,22,53,54,55,56,81,82,83,84,85,86,87,88,89,103,145,146,148,161,164,178,199,200,],[49,49,-5,-8,-10,-54,-55,-56,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,49,49,49,49,49,-21,49,49,49,]),'STRING':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,174,175,178,181,185,186,187,199,200,],[50,50,-5,-8,-10,-54,-55,-56,50,50,50,50,50,50,50,-67,-68,-69,-70,-71,50,50,50,50,50,-92,-93,-94,-95,-96,-97,50,50,-112,-103,-6,-7,-9,-11,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,140,-12,-13,-14,-15,-16,-17,-18,-19,-20,50,-57,-58,-61,-62,50,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,140,-28,-29,-112,-68,50,50,50,-37,50,-109,-39,-22,-99,-30,-31,50,50,50,-21,-38,-26,-27,50,50,50,-23,-24,50,50,]),'NUMBER':([0,3,4,7,9,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,94,95,96,97,103,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,174,175,178,181,185,186,187,199,200,],[51,51,-5,-8,-10,-54,-55,-56,51,51,51,51,51,51,51,-67,-68,-69,-70,-71,51,51,51,51,51,-92,-93,-94,-95,-96,-97,51,51,-112,-103,-6,-7,-9,-11,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-12,-13,-14,-15,-16,-17,-18,-19,-20,51,-57,-58,-61,-62,51,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,51,-28,-29,-112,-68,51,51,51,-37,51,-109,-39,-22,-99,-30,-31,51,51,51,-21,-38,-26,-27,51,51,51,-23,-24,51,51,]),'LBRACKET':([0,3,4,7,9,10,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,145,146,148,149,150,151,154,155,156,157,158,159,160,161,164,168,169,174,175,178,181,185,186,187,194,196,199,200,],[47,47,-5,-8,-10,79,-54,-55,-56,47,47,47,47,47,47,47,-67,-68,-69,-70,-71,47,47,47,47,47,-92,-93,-94,-95,-96,-97,47,47,-112,-103,-6,-7,-9,-11,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-12,-13,-14,-15,-16,-17,-18,-19,-20,79,79,47,79,79,79,79,79,79,79,79,-70,79,47,79,-36,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-84,79,79,79,79,79,-98,47,-28,-29,-112,-68,79,47,47,47,-37,47,-109,-39,-22,-99,-30,-31,47,47,47,-21,-38,79,79,79,47,47,47,-23,-24,79,79,47,47,]),'END':([3,4,7,9,20,21,22,52,53,54,55,56,81,82,83,84,85,86,87,88,89,103,146,147,148,161,164,165,167,176,178,179,180,190,191,193,199,200,201,202,],[-2,-5,-8,-10,-54,-55,-56,-4,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-2,-2,166,-2,-2,-21,-51,182,188,-2,-49,-51,197,198,-52,-2,-2,-50,-53,]),'ELSEIF':([3,4,7,9,20,21,22,52,53,54,55,56,81,82,83,84,85,86,87,88,89,146,164,165,180,200,202,],[-2,-5,-8,-10,-54,-55,-56,-4,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-2,-21,181,181,-2,-53,]),'ELSE':([3,4,7,9,20,21,22,52,53,54,55,56,81,82,83,84,85,86,87,88,89,146,164,165,179,180,193,200,202,],[-2,-5,-8,-10,-54,-55,-56,-4,-6,-7,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-2,-21,-51,192,-51,-52,-2,-53,]),'TIMES':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[59,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,59,59,59,59,-58,-61,-62,59,59,59,-70,59,59,-36,59,59,59,59,-63,-64,-65,-66,59,-73,59,59,59,59,59,59,59,59,59,59,-84,59,59,-87,59,59,-98,-112,-68,59,-37,-109,-39,-99,-38,59,59,59,59,59,]),'DIV':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[60,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,60,60,60,60,-58,-61,-62,60,60,60,-70,60,60,-36,60,60,60,60,-63,-64,-65,-66,60,-73,60,60,60,60,60,60,60,60,60,60,-84,60,60,-87,60,60,-98,-112,-68,60,-37,-109,-39,-99,-38,60,60,60,60,60,]),'MODULUS':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[61,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,61,61,61,61,-58,-61,-62,61,61,61,-70,61,61,-36,61,61,61,61,-63,-64,-65,-66,61,-73,61,61,61,61,61,61,61,61,61,61,-84,61,61,-87,61,61,-98,-112,-68,61,-37,-109,-39,-99,-38,61,61,61,61,61,]),'FILTER':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[62,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,62,62,62,62,62,-61,-62,62,62,62,-70,62,62,-36,62,62,62,62,62,62,62,-66,62,62,62,62,62,62,62,62,62,62,62,62,-84,62,62,62,62,62,-98,-112,-68,62,-37,-109,-39,-99,-38,62,62,62,62,62,]),'DOUBLEBAR':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[63,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,63,63,63,-57,-58,-61,-62,63,63,63,-70,63,63,-36,63,63,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,63,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,63,63,-98,-112,-68,63,-37,-109,-39,-99,-38,63,63,63,63,63,]),'RANGE':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[64,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,64,64,64,64,64,-61,-62,64,64,64,-70,64,64,-36,64,64,64,64,64,64,64,-66,64,None,64,64,64,64,64,64,64,64,64,64,-84,64,64,None,64,64,-98,-112,-68,64,-37,-109,-39,-99,-38,64,64,64,64,64,]),'NEQ':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[65,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,65,65,65,None,-58,-61,-62,65,65,65,-70,65,65,-36,65,65,-59,-60,-63,-64,-65,-66,65,-73,None,-75,65,-77,None,None,-80,65,-82,65,-84,65,65,-87,65,65,-98,-112,-68,65,-37,-109,-39,-99,-38,65,65,65,65,65,]),'LTE':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[66,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,66,66,66,66,-58,-61,-62,66,66,66,-70,66,66,-36,66,66,-59,-60,-63,-64,-65,-66,66,-73,66,None,66,None,66,66,None,66,None,66,-84,66,66,-87,66,66,-98,-112,-68,66,-37,-109,-39,-99,-38,66,66,66,66,66,]),'OR':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[67,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,67,67,67,-57,-58,-61,-62,67,67,67,-70,67,67,-36,67,67,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,67,67,-98,-112,-68,67,-37,-109,-39,-99,-38,67,67,67,67,67,]),'LT':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[68,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,68,68,68,68,-58,-61,-62,68,68,68,-70,68,68,-36,68,68,-59,-60,-63,-64,-65,-66,68,-73,68,None,68,None,68,68,None,68,None,68,-84,68,68,-87,68,68,-98,-112,-68,68,-37,-109,-39,-99,-38,68,68,68,68,68,]),'EQ':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[69,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,69,69,69,None,-58,-61,-62,69,69,69,-70,69,69,-36,69,69,-59,-60,-63,-64,-65,-66,69,-73,None,-75,69,-77,None,None,-80,69,-82,69,-84,69,69,-87,69,69,-98,-112,-68,69,-37,-109,-39,-99,-38,69,69,69,69,69,]),'IS':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[70,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,70,70,70,None,-58,-61,-62,70,70,70,-70,70,70,-36,70,70,-59,-60,-63,-64,-65,-66,70,-73,None,-75,70,-77,None,None,-80,70,-82,70,-84,70,70,-87,70,70,-98,-112,-68,70,-37,-109,-39,-99,-38,70,70,70,70,70,]),'GT':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[71,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,71,71,71,71,-58,-61,-62,71,71,71,-70,71,71,-36,71,71,-59,-60,-63,-64,-65,-66,71,-73,71,None,71,None,71,71,None,71,None,71,-84,71,71,-87,71,71,-98,-112,-68,71,-37,-109,-39,-99,-38,71,71,71,71,71,]),'AND':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[72,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,72,72,72,-57,-58,-61,-62,72,72,72,-70,72,72,-36,72,72,-59,-60,-63,-64,-65,-66,72,-73,-74,-75,72,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,72,72,-98,-112,-68,72,-37,-109,-39,-99,-38,72,72,72,72,72,]),'GTE':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[73,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,73,73,73,73,-58,-61,-62,73,73,73,-70,73,73,-36,73,73,-59,-60,-63,-64,-65,-66,73,-73,73,None,73,None,73,73,None,73,None,73,-84,73,73,-87,73,73,-98,-112,-68,73,-37,-109,-39,-99,-38,73,73,73,73,73,]),'DOUBLEAMP':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[74,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,74,74,74,-57,-58,-61,-62,74,74,74,-70,74,74,-36,74,74,-59,-60,-63,-64,-65,-66,74,-73,-74,-75,74,-77,-78,-79,-80,74,-82,-83,-84,-85,-86,-87,74,74,-98,-112,-68,74,-37,-109,-39,-99,-38,74,74,74,74,74,]),'DOT':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[75,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,75,75,75,75,75,75,75,75,75,75,-70,75,75,-36,75,75,153,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-98,-112,-68,75,-37,-109,-39,-99,-38,75,75,75,75,75,]),'ASSIGN':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,172,174,175,194,196,],[76,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,76,76,76,-57,-58,-61,-62,76,76,76,-70,76,76,-36,76,76,-59,-60,-63,-64,-65,-66,76,-73,-74,-75,76,-77,-78,-79,-80,76,-82,76,-84,76,-86,-87,76,76,-98,-112,-68,76,-37,-109,-39,-99,-38,76,185,76,76,76,76,]),'ASSIGNOP':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[77,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,77,77,77,-57,-58,-61,-62,77,77,77,-70,77,77,-36,77,77,-59,-60,-63,-64,-65,-66,77,-73,-74,-75,77,-77,-78,-79,-80,77,-82,77,-84,77,None,-87,77,77,-98,-112,-68,77,-37,-109,-39,-99,-38,77,77,77,77,77,]),'COLON':([10,30,31,32,33,34,41,42,43,44,45,46,50,51,90,91,93,94,95,96,97,98,99,100,101,102,104,105,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,140,141,144,149,151,154,156,168,169,174,175,194,196,],[78,-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,78,78,78,78,78,-61,-62,78,78,78,-70,78,78,-36,78,78,78,78,78,78,78,-66,78,None,78,78,78,78,78,78,78,78,78,78,-84,78,78,None,78,78,-98,159,160,78,-37,-109,-39,-99,-38,78,78,78,78,78,]),'EACH':([24,],[92,]),'AS':([30,31,32,33,34,41,42,43,44,45,46,50,51,91,94,95,96,97,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,136,144,149,151,154,156,168,],[-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,143,-57,-58,-61,-62,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-98,143,-37,-109,-39,-99,-38,]),'THEN':([30,31,32,33,34,41,42,43,44,45,46,50,51,93,94,95,96,97,105,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,136,149,151,154,156,168,],[-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,145,-57,-58,-61,-62,-36,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-98,-37,-109,-39,-99,-38,]),'RBRACKET':([30,31,32,33,34,41,42,43,44,45,46,47,50,51,94,95,96,97,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,149,150,151,154,156,168,169,],[-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,105,-112,-103,-57,-58,-61,-62,-36,149,-33,-32,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,154,-98,-37,-34,-109,-39,-99,-38,-35,]),'COMMA':([30,31,32,33,34,41,42,43,44,45,46,47,50,51,80,94,95,96,97,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,149,150,151,154,155,156,157,158,162,168,169,171,172,174,175,186,187,196,],[-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,107,-112,-103,139,-57,-58,-61,-62,-36,150,-33,-32,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,155,-98,158,-28,-29,-112,-68,-37,-34,-109,-39,-22,-99,-30,-31,177,-38,-35,184,-104,186,187,-23,-24,-105,]),'RPAREN':([30,31,32,33,34,41,42,43,44,45,46,50,51,80,94,95,96,97,105,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,149,151,152,154,155,156,157,158,168,170,171,172,174,175,184,186,187,195,196,],[-67,-68,-69,-70,-71,-92,-93,-94,-95,-96,-97,-112,-103,136,-57,-58,-61,-62,-36,151,-59,-60,-63,-64,-65,-66,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-25,-98,156,-28,-29,-112,-68,-37,-109,-106,-39,-22,-99,-30,-31,-38,183,-108,-104,-26,-27,-106,-23,-24,-107,-105,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'utldoc':([0,],[1,]),'statement_list':([0,3,103,146,148,161,178,199,200,],[2,52,147,165,167,176,190,201,202,]),'statement':([0,3,103,145,146,148,161,178,199,200,],[3,3,3,164,3,3,3,3,3,3,]),'eostmt':([0,3,5,6,8,10,11,12,13,14,15,16,17,18,19,39,93,103,104,142,145,146,148,161,163,178,192,194,199,200,],[4,4,53,54,55,56,81,82,83,84,85,86,87,88,89,103,146,4,148,161,4,4,4,4,178,4,199,200,4,4,]),'echo_stmt':([0,3,103,145,146,148,161,178,199,200,],[5,5,5,5,5,5,5,5,5,5,]),'for_stmt':([0,3,103,145,146,148,161,178,199,200,],[6,6,6,6,6,6,6,6,6,6,]),'abbrev_if_stmt':([0,3,103,145,146,148,161,178,199,200,],[7,7,7,7,7,7,7,7,7,7,]),'if_stmt':([0,3,103,145,146,148,161,178,199,200,],[8,8,8,8,8,8,8,8,8,8,]),'expr':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[10,10,90,91,93,94,95,96,97,98,99,100,102,104,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,144,10,135,10,10,10,169,174,175,10,10,194,196,10,10,]),'default_assignment':([0,3,103,145,146,148,161,178,199,200,],[11,11,11,11,11,11,11,11,11,11,]),'return_stmt':([0,3,103,145,146,148,161,178,199,200,],[12,12,12,12,12,12,12,12,12,12,]),'include_stmt':([0,3,103,145,146,148,161,178,199,200,],[13,13,13,13,13,13,13,13,13,13,]),'call_stmt':([0,3,103,145,146,148,161,178,199,200,],[14,14,14,14,14,14,14,14,14,14,]),'macro_defn':([0,3,103,145,146,148,161,178,199,200,],[15,15,15,15,15,15,15,15,15,15,]),'while_stmt':([0,3,103,145,146,148,161,178,199,200,],[16,16,16,16,16,16,16,16,16,16,]),'literal':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'array_ref':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'macro_call':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[33,33,33,33,33,33,33,33,33,33,33,33,101,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'paren_expr':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'macro_decl':([0,3,103,145,146,148,161,178,199,200,],[39,39,39,39,39,39,39,39,39,39,]),'string_literal':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'number_literal':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'array_literal':([0,3,23,24,25,26,27,28,29,35,36,37,38,40,47,48,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,92,103,137,145,146,148,150,159,160,161,178,181,185,199,200,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'array_elems':([47,],[106,]),'dotted_id':([49,153,],[110,173,]),'arg_list':([80,],[137,]),'arg':([80,137,],[138,157,]),'as_clause':([91,144,],[142,163,]),'param_list':([152,184,],[170,195,]),'param_decl':([152,184,],[171,171,]),'elseif_stmts':([165,180,],[179,193,]),'elseif_stmt':([165,180,],[180,180,]),'else_stmt':([179,],[191,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> utldoc","S'",1,None,None,None),
+  ('utldoc -> statement_list','utldoc',1,'p_utldoc','utl_yacc.py',265),
+  ('statement_list -> <empty>','statement_list',0,'p_statement_list','utl_yacc.py',273),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','utl_yacc.py',274),
+  ('statement_list -> statement statement_list','statement_list',2,'p_statement_list','utl_yacc.py',275),
+  ('statement -> eostmt','statement',1,'p_statement','utl_yacc.py',283),
+  ('statement -> echo_stmt eostmt','statement',2,'p_statement','utl_yacc.py',284),
+  ('statement -> for_stmt eostmt','statement',2,'p_statement','utl_yacc.py',285),
+  ('statement -> abbrev_if_stmt','statement',1,'p_statement','utl_yacc.py',286),
+  ('statement -> if_stmt eostmt','statement',2,'p_statement','utl_yacc.py',287),
+  ('statement -> DOCUMENT','statement',1,'p_statement','utl_yacc.py',288),
+  ('statement -> expr eostmt','statement',2,'p_statement','utl_yacc.py',289),
+  ('statement -> default_assignment eostmt','statement',2,'p_statement','utl_yacc.py',290),
+  ('statement -> return_stmt eostmt','statement',2,'p_statement','utl_yacc.py',291),
+  ('statement -> include_stmt eostmt','statement',2,'p_statement','utl_yacc.py',292),
+  ('statement -> call_stmt eostmt','statement',2,'p_statement','utl_yacc.py',293),
+  ('statement -> macro_defn eostmt','statement',2,'p_statement','utl_yacc.py',294),
+  ('statement -> while_stmt eostmt','statement',2,'p_statement','utl_yacc.py',295),
+  ('statement -> BREAK eostmt','statement',2,'p_statement','utl_yacc.py',296),
+  ('statement -> CONTINUE eostmt','statement',2,'p_statement','utl_yacc.py',297),
+  ('statement -> EXIT eostmt','statement',2,'p_statement','utl_yacc.py',298),
+  ('abbrev_if_stmt -> IF expr THEN statement','abbrev_if_stmt',4,'p_abbrev_if_stmt','utl_yacc.py',311),
+  ('arg -> expr COMMA','arg',2,'p_arg','utl_yacc.py',319),
+  ('arg -> STRING COLON expr COMMA','arg',4,'p_arg','utl_yacc.py',320),
+  ('arg -> ID COLON expr COMMA','arg',4,'p_arg','utl_yacc.py',321),
+  ('arg -> expr','arg',1,'p_arg','utl_yacc.py',322),
+  ('arg -> STRING COLON expr','arg',3,'p_arg','utl_yacc.py',323),
+  ('arg -> ID COLON expr','arg',3,'p_arg','utl_yacc.py',324),
+  ('arg_list -> arg','arg_list',1,'p_arg_list','utl_yacc.py',336),
+  ('arg_list -> COMMA','arg_list',1,'p_arg_list','utl_yacc.py',337),
+  ('arg_list -> arg_list arg','arg_list',2,'p_arg_list','utl_yacc.py',338),
+  ('arg_list -> arg_list COMMA','arg_list',2,'p_arg_list','utl_yacc.py',339),
+  ('array_elems -> expr','array_elems',1,'p_array_elems','utl_yacc.py',348),
+  ('array_elems -> COMMA','array_elems',1,'p_array_elems','utl_yacc.py',349),
+  ('array_elems -> array_elems COMMA','array_elems',2,'p_array_elems','utl_yacc.py',350),
+  ('array_elems -> array_elems COMMA expr','array_elems',3,'p_array_elems','utl_yacc.py',351),
+  ('array_literal -> LBRACKET RBRACKET','array_literal',2,'p_array_literal','utl_yacc.py',359),
+  ('array_literal -> LBRACKET array_elems RBRACKET','array_literal',3,'p_array_literal','utl_yacc.py',360),
+  ('array_literal -> LBRACKET array_elems COMMA RBRACKET','array_literal',4,'p_array_literal','utl_yacc.py',361),
+  ('array_ref -> expr LBRACKET expr RBRACKET','array_ref',4,'p_array_ref','utl_yacc.py',369),
+  ('as_clause -> <empty>','as_clause',0,'p_as_clause','utl_yacc.py',378),
+  ('as_clause -> AS ID','as_clause',2,'p_as_clause','utl_yacc.py',379),
+  ('as_clause -> AS ID COMMA ID','as_clause',4,'p_as_clause','utl_yacc.py',380),
+  ('call_stmt -> CALL macro_call','call_stmt',2,'p_call_stmt','utl_yacc.py',389),
+  ('default_assignment -> DEFAULT expr','default_assignment',2,'p_default_assignment','utl_yacc.py',397),
+  ('dotted_id -> ID','dotted_id',1,'p_dotted_id','utl_yacc.py',405),
+  ('dotted_id -> ID DOT dotted_id','dotted_id',3,'p_dotted_id','utl_yacc.py',406),
+  ('echo_stmt -> ECHO','echo_stmt',1,'p_echo_stmt','utl_yacc.py',414),
+  ('echo_stmt -> ECHO expr','echo_stmt',2,'p_echo_stmt','utl_yacc.py',415),
+  ('else_stmt -> <empty>','else_stmt',0,'p_else_stmt','utl_yacc.py',423),
+  ('else_stmt -> ELSE eostmt statement_list','else_stmt',3,'p_else_stmt','utl_yacc.py',424),
+  ('elseif_stmts -> <empty>','elseif_stmts',0,'p_elseif_stmts','utl_yacc.py',433),
+  ('elseif_stmts -> elseif_stmt elseif_stmts','elseif_stmts',2,'p_elseif_stmts','utl_yacc.py',434),
+  ('elseif_stmt -> ELSEIF expr eostmt statement_list','elseif_stmt',4,'p_elseif_stmt','utl_yacc.py',443),
+  ('eostmt -> SEMI','eostmt',1,'p_eostmt','utl_yacc.py',451),
+  ('eostmt -> EOF','eostmt',1,'p_eostmt','utl_yacc.py',452),
+  ('eostmt -> END_UTL','eostmt',1,'p_eostmt','utl_yacc.py',453),
+  ('expr -> NOT expr','expr',2,'p_expr','utl_yacc.py',461),
+  ('expr -> EXCLAMATION expr','expr',2,'p_expr','utl_yacc.py',462),
+  ('expr -> expr PLUS expr','expr',3,'p_expr','utl_yacc.py',463),
+  ('expr -> expr MINUS expr','expr',3,'p_expr','utl_yacc.py',464),
+  ('expr -> PLUS expr','expr',2,'p_expr','utl_yacc.py',465),
+  ('expr -> MINUS expr','expr',2,'p_expr','utl_yacc.py',466),
+  ('expr -> expr TIMES expr','expr',3,'p_expr','utl_yacc.py',467),
+  ('expr -> expr DIV expr','expr',3,'p_expr','utl_yacc.py',468),
+  ('expr -> expr MODULUS expr','expr',3,'p_expr','utl_yacc.py',469),
+  ('expr -> expr FILTER expr','expr',3,'p_expr','utl_yacc.py',470),
+  ('expr -> literal','expr',1,'p_expr','utl_yacc.py',471),
+  ('expr -> ID','expr',1,'p_expr','utl_yacc.py',472),
+  ('expr -> array_ref','expr',1,'p_expr','utl_yacc.py',473),
+  ('expr -> macro_call','expr',1,'p_expr','utl_yacc.py',474),
+  ('expr -> paren_expr','expr',1,'p_expr','utl_yacc.py',475),
+  ('expr -> expr DOUBLEBAR expr','expr',3,'p_expr','utl_yacc.py',476),
+  ('expr -> expr RANGE expr','expr',3,'p_expr','utl_yacc.py',477),
+  ('expr -> expr NEQ expr','expr',3,'p_expr','utl_yacc.py',478),
+  ('expr -> expr LTE expr','expr',3,'p_expr','utl_yacc.py',479),
+  ('expr -> expr OR expr','expr',3,'p_expr','utl_yacc.py',480),
+  ('expr -> expr LT expr','expr',3,'p_expr','utl_yacc.py',481),
+  ('expr -> expr EQ expr','expr',3,'p_expr','utl_yacc.py',482),
+  ('expr -> expr IS expr','expr',3,'p_expr','utl_yacc.py',483),
+  ('expr -> expr GT expr','expr',3,'p_expr','utl_yacc.py',484),
+  ('expr -> expr AND expr','expr',3,'p_expr','utl_yacc.py',485),
+  ('expr -> expr GTE expr','expr',3,'p_expr','utl_yacc.py',486),
+  ('expr -> expr DOUBLEAMP expr','expr',3,'p_expr','utl_yacc.py',487),
+  ('expr -> expr DOT expr','expr',3,'p_expr','utl_yacc.py',488),
+  ('expr -> expr ASSIGN expr','expr',3,'p_expr','utl_yacc.py',489),
+  ('expr -> expr ASSIGNOP expr','expr',3,'p_expr','utl_yacc.py',490),
+  ('expr -> expr COLON expr','expr',3,'p_expr','utl_yacc.py',491),
+  ('for_stmt -> FOR expr as_clause eostmt statement_list END','for_stmt',6,'p_for_stmt','utl_yacc.py',499),
+  ('for_stmt -> FOR EACH expr as_clause eostmt statement_list END','for_stmt',7,'p_for_stmt','utl_yacc.py',500),
+  ('if_stmt -> IF expr eostmt statement_list elseif_stmts else_stmt END','if_stmt',7,'p_if_stmt','utl_yacc.py',512),
+  ('include_stmt -> INCLUDE expr','include_stmt',2,'p_include_stmt','utl_yacc.py',520),
+  ('literal -> string_literal','literal',1,'p_literal','utl_yacc.py',528),
+  ('literal -> FALSE','literal',1,'p_literal','utl_yacc.py',529),
+  ('literal -> TRUE','literal',1,'p_literal','utl_yacc.py',530),
+  ('literal -> NULL','literal',1,'p_literal','utl_yacc.py',531),
+  ('literal -> number_literal','literal',1,'p_literal','utl_yacc.py',532),
+  ('literal -> array_literal','literal',1,'p_literal','utl_yacc.py',533),
+  ('macro_call -> expr LPAREN RPAREN','macro_call',3,'p_macro_call','utl_yacc.py',541),
+  ('macro_call -> expr LPAREN arg_list RPAREN','macro_call',4,'p_macro_call','utl_yacc.py',542),
+  ('macro_decl -> MACRO dotted_id','macro_decl',2,'p_macro_decl','utl_yacc.py',553),
+  ('macro_decl -> MACRO dotted_id LPAREN param_list RPAREN','macro_decl',5,'p_macro_decl','utl_yacc.py',554),
+  ('macro_defn -> macro_decl eostmt statement_list END','macro_defn',4,'p_macro_defn','utl_yacc.py',563),
+  ('number_literal -> NUMBER','number_literal',1,'p_number_literal','utl_yacc.py',571),
+  ('param_decl -> ID','param_decl',1,'p_param_decl','utl_yacc.py',580),
+  ('param_decl -> ID ASSIGN expr','param_decl',3,'p_param_decl','utl_yacc.py',581),
+  ('param_list -> <empty>','param_list',0,'p_param_list','utl_yacc.py',589),
+  ('param_list -> param_decl COMMA param_list','param_list',3,'p_param_list','utl_yacc.py',590),
+  ('param_list -> param_decl','param_list',1,'p_param_list','utl_yacc.py',591),
+  ('paren_expr -> LPAREN expr RPAREN','paren_expr',3,'p_paren_expr','utl_yacc.py',600),
+  ('return_stmt -> RETURN expr','return_stmt',2,'p_return_stmt','utl_yacc.py',609),
+  ('return_stmt -> RETURN','return_stmt',1,'p_return_stmt','utl_yacc.py',610),
+  ('string_literal -> STRING','string_literal',1,'p_string_literal','utl_yacc.py',618),
+  ('while_stmt -> WHILE expr eostmt statement_list END','while_stmt',5,'p_while_stmt','utl_yacc.py',630),
+]
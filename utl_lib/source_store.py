@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A store of UTL source text, from which snippets are fetched by offset.
+
+Macro definitions and calls only need their text now and then (to show a definition, or write
+JSON), so rather than each keeping a copy, they keep a file id and the start and end offsets
+from the parser, and ask a :py:class:`SourceStore` for the text. The store holds either the
+text a document was parsed from, or just the path of the file; files are memory-mapped when
+first needed, and only a limited number are kept open. Recently fetched snippets are cached.
+A store may be shared between threads.
+
+Offsets are character offsets into the decoded text, as the parser reports them. For files that
+are entirely ASCII these are also byte offsets into the file. For other files the store keeps a
+checkpoint of (character, byte) offsets every :py:data:`CHECKPOINT_SIZE` bytes, so only a little
+of the file is decoded to find a snippet.
+
+| © 2016 BH Media Group, Inc.
+| BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import codecs
+import mmap
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+CHECKPOINT_SIZE = 64 * 1024
+"Number of bytes between checkpoints in a file with non-ASCII characters."
+
+ENCODING = 'utf-8'
+"The encoding of source files. Undecodable bytes are replaced, as when files are parsed."
+
+
+class SourceStore(object):
+    """Source text for a set of documents, identified by integer file ids.
+
+    :param int cache_size: The number of snippets to keep in the cache.
+
+    :param int max_open: The largest number of files to keep memory-mapped at once.
+
+    """
+
+    def __init__(self, cache_size=1024, max_open=64):
+        self._next_id = 0
+        self._names = {}
+        "The name of each document, by file id."
+        self._texts = {}
+        "Text of documents added with :py:meth:`add_text`."
+        self._paths = {}
+        "Paths of documents added with :py:meth:`add_file`."
+        self._checkpoints = {}
+        "(character offsets, byte offsets) for mapped files; ``None`` if the file is ASCII."
+        self._maps = OrderedDict()
+        "Files currently memory-mapped, least recently used first."
+        self.max_open = max_open
+        self._lock = threading.Lock()
+        "Held while using or changing :py:attr:`_maps`, so no thread closes a map in use."
+        self.snippet = lru_cache(maxsize=cache_size)(self._snippet)
+        """``snippet(file_id, start, end)`` returns the text of document `file_id` from character
+        `start` up to `end`. Results are cached."""
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, file_id):
+        return file_id in self._names
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes all memory-mapped files. They are re-opened if needed."""
+        with self._lock:
+            while self._maps:
+                self._maps.popitem()[1].close()
+
+    def _new_id(self, name):
+        file_id = self._next_id
+        self._next_id += 1
+        self._names[file_id] = name
+        return file_id
+
+    def add_text(self, name, text):
+        """Adds a document whose text is already in memory. The store keeps a reference to
+        `text`, not a copy.
+
+        :param str name: The name of the document.
+
+        :param str text: The document's text.
+
+        :returns int: The new document's file id.
+
+        """
+        file_id = self._new_id(name)
+        self._texts[file_id] = text
+        return file_id
+
+    def add_file(self, name, path):
+        """Adds a document whose text is in a file. The file isn't read until text is needed.
+
+        :param str name: The name of the document.
+
+        :param (str or Path) path: The path of the file.
+
+        :returns int: The new document's file id.
+
+        """
+        file_id = self._new_id(name)
+        self._paths[file_id] = Path(path)
+        return file_id
+
+    def remove(self, file_id):
+        """Removes a document from the store.
+
+        :param int file_id: The id returned when the document was added.
+
+        :raises KeyError: if there is no document `file_id`.
+
+        """
+        del self._names[file_id]
+        self._texts.pop(file_id, None)
+        self._paths.pop(file_id, None)
+        with self._lock:
+            self._checkpoints.pop(file_id, None)
+            data = self._maps.pop(file_id, None)
+            if data is not None:
+                data.close()
+        self.snippet.cache_clear()
+
+    def name(self, file_id):
+        """:returns str: The name of document `file_id`."""
+        return self._names[file_id]
+
+    @property
+    def texts(self):
+        """A dictionary of the documents whose text is in memory, keyed by name."""
+        return {self._names[file_id]: text for file_id, text in self._texts.items()}
+
+    def text(self, file_id):
+        """:returns str: The whole text of document `file_id`."""
+        try:
+            return self._texts[file_id]
+        except KeyError:
+            pass
+        with self._lock:
+            data = self._data(file_id)[:]
+        return data.decode(ENCODING, errors='replace')
+
+    def _data(self, file_id):
+        """Returns the memory-mapped contents of file `file_id`, mapping it if needed. Must
+        be called with :py:attr:`_lock` held, and the result only used while it is held: the
+        map may be closed once it is released.
+
+        """
+        try:
+            self._maps.move_to_end(file_id)
+            return self._maps[file_id]
+        except KeyError:
+            pass
+        path = self._paths[file_id]
+        with path.open('rb') as utlin:
+            if path.stat().st_size == 0:
+                return b''  # can't map an empty file
+            data = mmap.mmap(utlin.fileno(), 0, access=mmap.ACCESS_READ)
+        if file_id not in self._checkpoints:
+            self._checkpoints[file_id] = self._find_checkpoints(data)
+        self._maps[file_id] = data
+        while len(self._maps) > self.max_open:
+            self._maps.popitem(last=False)[1].close()
+        return data
+
+    @staticmethod
+    def _find_checkpoints(data):
+        """Decodes `data` a piece at a time, noting character and byte offsets at the end of
+        each piece.
+
+        :returns tuple: Lists of character and byte offsets; or ``None`` if every byte is one
+            character.
+
+        """
+        decoder = codecs.getincrementaldecoder(ENCODING)(errors='replace')
+        char_offsets, byte_offsets = [0], [0]
+        chars = 0
+        for pos in range(0, len(data), CHECKPOINT_SIZE):
+            chunk = data[pos:pos + CHECKPOINT_SIZE]
+            chars += len(decoder.decode(chunk))
+            # bytes of an incomplete character are held in the decoder
+            char_offsets.append(chars)
+            byte_offsets.append(pos + len(chunk) - len(decoder.getstate()[0]))
+        if chars + len(decoder.decode(b'', True)) == len(data):
+            return None
+        return char_offsets, byte_offsets
+
+    def _snippet(self, file_id, start, end):
+        """Finds a snippet of text. Called through :py:attr:`snippet`, which caches the
+        results.
+
+        """
+        try:
+            return self._texts[file_id][start:end]
+        except KeyError:
+            pass
+        with self._lock:
+            data = self._data(file_id)
+            checkpoints = self._checkpoints.get(file_id)
+            if checkpoints is None:
+                piece = data[start:end]  # slicing copies the bytes
+            else:
+                char_offsets, byte_offsets = checkpoints
+                point = bisect_right(char_offsets, start) - 1
+                first_char, first_byte = char_offsets[point], byte_offsets[point]
+                # no character takes more than 4 bytes
+                piece = data[first_byte:first_byte + 4 * (end - first_char)]
+        if checkpoints is None:
+            return piece.decode(ENCODING, errors='replace')
+        return piece.decode(ENCODING, errors='replace')[start - first_char:end - first_char]
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -4,6 +4,7 @@
 
 from pathlib import Path
 import json
+import zipfile
 from warnings import warn
 import re
 
@@ -23,7 +24,8 @@ class TNPackage(object):
     portion of custom code.
 
     In most cases, you'll want to use the :py:meth:`Package.load_from` method to read package
-    information from a directory. You can specify the exact values to :py:meth:`Package` for
+    information from a directory, or :py:meth:`Package.load_from_zip` to read it from an export
+    file. You can specify the exact values to :py:meth:`Package` for
     debugging, etc.
 
     :see utl_lib.TNPackageZIP: for how an exported ZIP file is written to the directory.
@@ -112,25 +114,83 @@ class TNPackage(object):
         """
         if not isinstance(directory, Path):
             directory = Path(str(directory))
-        props = cls._read_properties(directory, zip_name)
 
-        certified = Path(directory, '.certification').exists()
+        def read(name):
+            """Returns the text of file `name` in `directory`, or ``None`` if it's missing."""
+            try:
+                with (directory / name).open('r') as textin:
+                    return textin.read()
+            except FileNotFoundError:
+                return None
+
+        return cls._load(read, zip_name, site_name)
+
+    @classmethod
+    def load_from_zip(cls, zip_file, site_name=None) -> "TNPackage":
+        """Read a Townnews package straight from its export ZIP file, without extracting
+        anything. Only the few metadata files are read.
+
+        :param (Path or zipfile.ZipFile) zip_file: The export file, or the file already opened
+            (so that it can be extracted afterward without opening it again).
+
+        :param str site_name: The name of the site the package was exported from.
+
+        :return: A new TNPackage instance.
+
+        :raises PackageError: if `zip_file` is not a ZIP file, or the package has no name.
+
+        """
+        if isinstance(zip_file, zipfile.ZipFile):
+            return cls._load_from_archive(zip_file, Path(zip_file.filename), site_name)
+        try:
+            with zipfile.ZipFile(str(zip_file)) as archive:
+                return cls._load_from_archive(archive, Path(str(zip_file)), site_name)
+        except zipfile.BadZipFile as err:
+            raise PackageError("'{}' is not a ZIP file.".format(zip_file)) from err
+
+    @classmethod
+    def _load_from_archive(cls, archive: zipfile.ZipFile, zip_name: Path, site_name):
+        """Helper method; load a package from an open ZIP file."""
+        names = set(archive.namelist())
+
+        def read(name):
+            """Returns the text of member `name`, or ``None`` if it's missing."""
+            if name not in names:
+                return None
+            return archive.read(name).decode('utf-8')
+
+        return cls._load(read, zip_name, site_name)
+
+    @classmethod
+    def _load(cls, read, zip_name, site_name):
+        """Helper method; builds a package from its metadata files, wherever they are.
+
+        :param callable read: Given the path of a file within the package, like
+            ``'package/config.ini'``, returns its text, or ``None`` if there is no such file.
+
+        :param str zip_name: The name of the export file.
+
+        :param str site_name: The name of the site the package was exported from.
+
+        """
+        props = cls._read_properties(read, zip_name)
+
+        certified = read('.certification') is not None
 
         deps = {}
-        dep_file = directory / 'package/dependencies.ini'
+        dep_text = read('package/dependencies.ini')
         # declaring dependencies is optional, not unusual for file to be missing
-        if dep_file.exists():
-            with dep_file.open('r') as depin:
-                for line in depin:
-                    key, value = line[:-1].split('=')
-                    deps[key] = value.replace('"', '')
-        return cls(props, certified, deps, Path(zip_name), site_name)
+        if dep_text is not None:
+            for line in dep_text.splitlines():
+                key, value = line.split('=')
+                deps[key] = value.replace('"', '')
+        return cls(props, certified, deps, Path(str(zip_name)), site_name)
 
     @classmethod
-    def _read_meta_config(cls, directory: Path, zip_name: str) -> dict:
-        """Read the .meta.json file in `directory`/.metadata/ (if present).
+    def _read_meta_config(cls, read, zip_name: str) -> dict:
+        """Read the .metadata/.meta.json file (if present).
 
-        :param str directory: Directory into which Townnews export ZIP was unzipped.
+        :param callable read: Returns the text of a file in the package (see :py:meth:`_load`).
 
         :param str zip_name: The name of the Townnews export ZIP file.
 
@@ -138,11 +198,10 @@ class TNPackage(object):
 
         """
         cap_const = 'capabilities'
-        meta_file = Path(directory) / ".metadata/.meta.json"
+        meta_text = read(".metadata/.meta.json")
 
-        if meta_file.exists():
-            with meta_file.open('r') as metain:
-                meta = json.load(metain)
+        if meta_text is not None:
+            meta = json.loads(meta_text)
             if cap_const in meta and meta[cap_const] == [""]:
                 meta[cap_const] = []
             return meta
@@ -151,23 +210,22 @@ class TNPackage(object):
         return {}
 
     @classmethod
-    def _read_config_ini(cls, directory):
-        """Read the config.ini file in `directory`/package/ (if present).
+    def _read_config_ini(cls, read):
+        """Read the package/config.ini file (if present).
 
-        :param str directory: Directory into which Townnews export ZIP was unzipped.
+        :param callable read: Returns the text of a file in the package (see :py:meth:`_load`).
 
         :returns dict: the key-value pairs from the config file.
 
         """
         cap_const = 'capabilities'  # protect against misspelling frequently used string :)
-        config_file = directory / 'package/config.ini'
+        config_text = read('package/config.ini')
         config = {}
 
-        if config_file.exists():
-            with config_file.open('r') as propin:
-                for line in propin:
-                    key, value = line[:-1].split('=')
-                    config[key] = value[1:-1]  # drop outer quotes
+        if config_text is not None:
+            for line in config_text.splitlines():
+                key, value = line.split('=')
+                config[key] = value[1:-1]  # drop outer quotes
             if cap_const in config:
                 # change to list to match JSON files
                 if config[cap_const]:
@@ -178,10 +236,10 @@ class TNPackage(object):
         return config
 
     @classmethod
-    def _read_properties(cls, directory, zip_name):
-        """Helper method; load package properties from `directory`.
+    def _read_properties(cls, read, zip_name):
+        """Helper method; load package properties.
 
-        :param Path directory: The directory containing the unzipped export file.
+        :param callable read: Returns the text of a file in the package (see :py:meth:`_load`).
 
         :param str zip_name: The name of the export file (for error messages).
 
@@ -190,14 +248,11 @@ class TNPackage(object):
         """
 
         # ------ Read the 3 possible config files ----------------
-        try:
-            with (directory / "info.json").open('r') as infoin:
-                info = json.load(infoin)
-        except FileNotFoundError:
-            info = {}
+        info_text = read("info.json")
+        info = {} if info_text is None else json.loads(info_text)
 
-        meta = cls._read_meta_config(directory, zip_name)
-        config = cls._read_config_ini(directory)
+        meta = cls._read_meta_config(read, zip_name)
+        config = cls._read_config_ini(read)
 
         # ------ Consolidate values ----------------------
 
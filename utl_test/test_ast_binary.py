@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.ast_binary`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+# pylint: disable=too-few-public-methods
+import io
+
+from utl_test import utl_parse_test
+from utl_lib import ast_binary
+from utl_lib.ast_binary import ASTBinaryError
+from utl_lib.ast_node import ASTNode, FrozenASTNode
+from utl_lib.utl_yacc import UTLParser
+from utl_lib.handler_ast import UTLParseHandlerAST
+
+
+class BinaryASTTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:func:`~utl_lib.ast_binary.save` and
+    :py:func:`~utl_lib.ast_binary.load`.
+
+    """
+
+    @staticmethod
+    def round_trip(node):
+        """Saves `node` to memory and loads it back.
+
+        :returns BinaryAST: the loaded tree.
+
+        """
+        output = io.BytesIO()
+        ast_binary.save(node, output)
+        return ast_binary.load(io.BytesIO(output.getvalue()))
+
+    def test_round_trip(self):
+        """Test that a saved tree loads as an equal tree."""
+        item1 = ASTNode("fred", {"wife": "wilma", "age": 35, "height": 5.5, "friend": True,
+                                 "pet": None, "big": 2**70},
+                        [ASTNode("pebbles", {"hobby": "tormenting bam-bam"}, []),
+                         ASTNode("literal",
+                                 {"value": ASTNode("array_literal", {},
+                                                   [ASTNode("literal", {"value": 1.0}, [])])},
+                                 [])])
+        loaded = self.round_trip(item1)
+        self.assertEqual(loaded.root, item1)
+        self.assertIsInstance(loaded.root.children[1].attributes["value"], FrozenASTNode)
+        # frozen nodes are saved the same way
+        self.assertEqual(self.round_trip(FrozenASTNode(item1)).root, item1)
+
+    def test_parsed(self):
+        """Test saving and loading a parsed UTL document."""
+        parser = UTLParser([UTLParseHandlerAST()])
+        with open(self.data_file('macros.utl'), 'r') as utlin:
+            parsed = parser.parse(utlin.read(), filename='macros.utl')
+        loaded = self.round_trip(parsed)
+        self.assertEqual(loaded.root, parsed)
+        self.assertEqual(loaded.symbols["macro_defn"], len(parsed.find_all("macro_defn")))
+        self.assertListEqual(loaded.find_all("macro_defn"),
+                             parsed.find_all("macro_defn"))
+        for node in loaded.find_all("macro_defn"):
+            self.assertIsNone(node.parent)
+        self.assertListEqual(loaded.find_all("no_such_symbol"), [])
+
+    def test_deep(self):
+        """Test that trees deeper than the recursion limit can be saved and loaded."""
+        item1 = ASTNode('leaf', {}, [])
+        for _ in range(5000):
+            item1 = ASTNode('branch', {}, [item1])
+        loaded = self.round_trip(item1)
+        self.assertEqual(loaded.symbols, {"branch": 5000, "leaf": 1})
+        self.assertEqual(loaded.find_all("leaf"), [ASTNode('leaf', {}, [])])
+
+    def test_bad_data(self):
+        """Test errors for data that can't be saved or loaded."""
+        self.assertRaises(ASTBinaryError, ast_binary.save,
+                          ASTNode("fred", {"wife": ("wilma", )}, []), io.BytesIO())
+        self.assertRaises(ASTBinaryError, ast_binary.load, io.BytesIO(b'{"name": "fred"}'))
+        output = io.BytesIO()
+        ast_binary.save(ASTNode("fred", {}, []), output)
+        self.assertRaises(ASTBinaryError, ast_binary.load, io.BytesIO(output.getvalue()[:14]))
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
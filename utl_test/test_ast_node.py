@@ -10,10 +10,11 @@
 """
 # pylint: disable=too-few-public-methods
 
+import io
 import json
 from testplus import unittest_plus
 
-from utl_lib.ast_node import ASTNode, FrozenASTNode, ASTNodeError
+from utl_lib.ast_node import ASTNode, FrozenASTNode, FrozenASTNodeTable, ASTNodeError
 from utl_lib.immutable import FrozenDict
 
 
@@ -192,6 +193,18 @@ class ASTNodeTestCase(unittest_plus.TestCasePlus):
         test_out = anode.format()
         self.assertRegex(test_out, r'top:\s+first_kid')
 
+    def test_write_format(self):
+        """Unit tests for :py:meth:`~utl_lib.ast_node.ASTNode.write_format`."""
+        output = io.StringIO()
+        self.test_nodes.write_format(output)
+        self.assertEqual(output.getvalue(),
+                         "fred:  {wilma: 'betty'}\n"
+                         "    barney:  {hobby: 'rock-throwing'}\n"
+                         "        bam-bam:  {hobby: 'plotting revenge'}\n"
+                         "    wilma:  {hobby: 's&m'}\n"
+                         "        pebbles:  {hobby: 'tormenting bam-bam'}")
+        self.assertEqual(self.test_nodes.format(), output.getvalue())
+
     def test_json_format(self):
         """Unit tests for :py:meth:`~utl_lib.ast_node.ASTNode.json_format`."""
         anode = ASTNode('top', {}, [])
@@ -257,6 +270,40 @@ class ASTNodeTestCase(unittest_plus.TestCasePlus):
         document = ASTNode('document', {"text": 2}, [])
         self.assertEqual(document.json_format(), '{"name": "document",\n"attributes": {"text": 2}}')
 
+    def test_write_json(self):
+        """Unit tests for :py:meth:`~utl_lib.ast_node.ASTNode.write_json`."""
+        anode = ASTNode('top', {"first": "last"},
+                        [ASTNode('second', {"fred": "husband"}, []),
+                         ASTNode('third', {"wife": ASTNode('wilma', {"husband": "fred"}, [])},
+                                 [])])
+        expected = {'name': 'top',
+                    'attributes': {'first': 'last'},
+                    'children': [
+                        {'name': 'second',
+                         'attributes': {'fred': 'husband'}},
+                        {'name': 'third',
+                         'attributes': {'wife': {'name': 'wilma',
+                                                 'attributes': {'husband': 'fred'}}}}]}
+        output = io.StringIO()
+        anode.write_json(output)
+        self.assertEqual(output.getvalue(), anode.json_format())
+        self.assertDictEqual(json.loads(output.getvalue()), expected)
+        output = io.StringIO()
+        anode.write_json(output, pretty=True)
+        self.assertDictEqual(json.loads(output.getvalue()), expected)
+        self.assertIn('\n    {\n      "name": "second",', output.getvalue())
+        # frozen nodes give the same result
+        output = io.StringIO()
+        FrozenASTNode(anode).write_json(output)
+        self.assertEqual(output.getvalue(), anode.json_format())
+        # deep trees don't exceed the recursion limit
+        anode = ASTNode('leaf', {}, [])
+        for _ in range(5000):
+            anode = ASTNode('branch', {}, [anode])
+        test_out = anode.json_format()
+        self.assertTrue(test_out.startswith('{"name": "branch",\n"children": [\n'))
+        self.assertTrue(test_out.endswith('{"name": "leaf"}' + ']}' * 5000))
+
     def test_find_first(self):
         """Tests for :py:meth:`~utl_lib.ast_node.ASTNode.find_first`."""
         pebbles = self.test_nodes.find_first("pebbles")
@@ -274,6 +321,22 @@ class ASTNodeTestCase(unittest_plus.TestCasePlus):
                                   ASTNode("pebbles", {"hobby": "tormenting bam-bam"}, [])])
         barney.children = [barney.children[0]]
 
+    def test_index_symbols(self):
+        """Unit tests for :py:meth:`~utl_lib.ast_node.ASTNode.index_symbols`."""
+        item1 = self.test_nodes.copy()
+        index = item1.index_symbols()
+        self.assertSetEqual(set(index.keys()), {"fred", "barney", "bam-bam", "wilma", "pebbles"})
+        self.assertSequenceEqual(item1.find_all("wilma"), [item1.children[1]])
+        self.assertIs(item1.find_first("pebbles"), item1.children[1].children[0])
+        self.assertIsNone(item1.find_first("dino"))
+        self.assertSequenceEqual(item1.find_all("dino"), [])
+        # adding a node anywhere in the tree discards the index
+        item1.children[0].add_child(ASTNode("pebbles", {"hobby": "sweet innocent child"}, []))
+        self.assertSequenceEqual(item1.find_all("pebbles"),
+                                 [ASTNode("pebbles", {"hobby": "sweet innocent child"}, []),
+                                  ASTNode("pebbles", {"hobby": "tormenting bam-bam"}, [])])
+        self.assertNotIn("dino", item1.index_symbols())
+
     def test_walk(self):
         """Unit tests of :py:meth:`~utl_lib.ast_node.ASTNode.walk`."""
         item1 = ASTNode('fred', {}, [])
@@ -335,6 +398,40 @@ class FrozenASTNodeTestCase(unittest_plus.TestCasePlus):
         self.assertEqual(frozen1, frozen2)
         self.assertNotEqual(frozen1, frozen3)
 
+    def test_hash(self):
+        """Test that :py:class:`~utl_lib.ast_node.FrozenASTNode` hashes are consistent with
+        equality, and depend on the order of children.
+
+        """
+        source_node = ASTNode("fred", {}, [ASTNode("barney", {}, []), ASTNode("wilma", {}, [])])
+        frozen1 = FrozenASTNode(source_node)
+        frozen2 = FrozenASTNode(source_node.copy())
+        self.assertEqual(hash(frozen1), hash(frozen2))
+        self.assertEqual(len({frozen1, frozen2}), 1)
+        source_node.children.reverse()
+        frozen3 = FrozenASTNode(source_node)
+        self.assertNotEqual(frozen1, frozen3)
+
+    def test_table(self):
+        """Unit tests for :py:class:`~utl_lib.ast_node.FrozenASTNodeTable`."""
+        table = FrozenASTNodeTable()
+        source_node = ASTNode("flintstones", {},
+                              [ASTNode("fred", {"wife": "wilma"}, [ASTNode("pebbles", {}, [])]),
+                               ASTNode("fred", {"wife": "wilma"}, [ASTNode("pebbles", {}, [])]),
+                               ASTNode("barney", {"wife": "betty"}, [])])
+        frozen1 = table.freeze(source_node)
+        self.assertEqual(frozen1, FrozenASTNode(source_node))
+        self.assertIs(frozen1.children[0], frozen1.children[1])
+        self.assertIn(frozen1, table)
+        # flintstones, fred, pebbles, barney
+        self.assertEqual(len(table), 4)
+        self.assertIs(table.freeze(source_node.copy()), frozen1)
+        self.assertIs(table.freeze(source_node.children[2]), frozen1.children[2])
+        self.assertEqual(len(table), 4)
+        frozen2 = FrozenASTNode(source_node)
+        self.assertIsNot(frozen2, frozen1)
+        self.assertIs(table.intern(frozen2), frozen1)
+
     def test_str(self):
         """Test :py:class:`~utl_lib.ast_node.FrozenASTNode` conversion to
         :py:class:`str`.
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.immutable`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+# pylint: disable=too-few-public-methods
+import copy
+import gc
+
+from testplus import unittest_plus
+
+from utl_lib.immutable import FrozenDict, SmallFrozenDict, freeze
+
+
+class FrozenDictTestCase(unittest_plus.TestCasePlus):
+    """Unit tests for :py:class:`~utl_lib.immutable.FrozenDict` and
+    :py:class:`~utl_lib.immutable.SmallFrozenDict`.
+
+    """
+
+    def test_freeze(self):
+        """Unit tests for :py:func:`~utl_lib.immutable.freeze`."""
+        item1 = freeze({"start": 3, "end": 7, "file": "fred.utl", "line": 1})
+        self.assertIsInstance(item1, SmallFrozenDict)
+        self.assertDictEqual(dict(item1), {"start": 3, "end": 7, "file": "fred.utl", "line": 1})
+        item2 = freeze({str(key): key for key in range(SmallFrozenDict.MAX_SIZE + 1)})
+        self.assertIsInstance(item2, FrozenDict)
+        self.assertNotIsInstance(item2, SmallFrozenDict)
+        self.assertIs(freeze(item2), item2)
+
+    def test_equal(self):
+        """Test that equality and hashing don't depend on the class used."""
+        item1 = SmallFrozenDict({"fred": "wilma", "barney": "betty"})
+        item2 = FrozenDict({"barney": "betty", "fred": "wilma"})
+        item3 = SmallFrozenDict({"barney": "betty", "fred": "wilma"})
+        self.assertEqual(item1, item2)
+        self.assertEqual(item1, item3)
+        self.assertEqual(item2, item1)
+        self.assertEqual(item1, {"fred": "wilma", "barney": "betty"})
+        self.assertEqual(hash(item1), hash(item2))
+        self.assertEqual(hash(item1), hash(item3))
+        self.assertNotEqual(item1, SmallFrozenDict({"fred": "wilma", "barney": "rubble"}))
+        self.assertNotEqual(item1, "fred")
+        self.assertNotEqual(item1, {"fred": "wilma"})
+        self.assertNotEqual(item1, {"fred": "wilma", "dino": "betty"})
+        self.assertEqual(str(item1), str(FrozenDict(item1)))
+        self.assertEqual(repr(item1), repr(FrozenDict(item1)))
+
+    def test_lazy_hash(self):
+        """Test that unhashable values only fail when the hash is needed."""
+        item1 = SmallFrozenDict({"fred": ["wilma"]})
+        self.assertEqual(item1["fred"], ["wilma"])
+        self.assertRaises(TypeError, hash, item1)
+        item2 = FrozenDict({"fred": ["wilma"]})
+        self.assertRaises(TypeError, hash, item2)
+
+    def test_combine(self):
+        """Unit tests for :py:meth:`~utl_lib.immutable.FrozenDict.combine` and
+        :py:meth:`~utl_lib.immutable.FrozenDict.delkey`.
+
+        """
+        item1 = freeze({"fred": "wilma"})
+        item2 = item1.combine({"barney": "betty"})
+        self.assertDictEqual(dict(item1), {"fred": "wilma"})
+        self.assertDictEqual(dict(item2), {"fred": "wilma", "barney": "betty"})
+        item3 = item2.delkey("fred")
+        self.assertIsInstance(item3, SmallFrozenDict)
+        self.assertDictEqual(dict(item3), {"barney": "betty"})
+        self.assertRaises(KeyError, item3.delkey, "fred")
+        self.assertEqual(item3, freeze({"barney": "betty"}))
+        self.assertEqual(item2.delkey("fred", "barney"), {})
+
+    def test_thaw(self):
+        """Unit tests for :py:meth:`~utl_lib.immutable.FrozenDict.thaw`."""
+        pets = ("dino", )
+        children = ["pebbles"]
+        item1 = freeze({"pets": pets, "children": children, "name": "fred"})
+        thawed = item1.thaw()
+        self.assertDictEqual(thawed, {"pets": pets, "children": children, "name": "fred"})
+        self.assertIsNot(thawed["children"], children)
+        thawed["children"].append("bam-bam")
+        self.assertListEqual(item1["children"], ["pebbles"])
+
+    def test_copy(self):
+        """Test that copies are equal, and keep their class."""
+        for item1 in (SmallFrozenDict({"fred": "wilma"}), FrozenDict({"fred": "wilma"})):
+            item2 = copy.deepcopy(item1)
+            self.assertIs(type(item2), type(item1))
+            self.assertEqual(item2, item1)
+
+    def test_key_tables(self):
+        """Test that instances with the same keys share a table, and tables no instance uses
+        are dropped.
+
+        """
+        item1 = freeze({"fred": 1, "wilma": 2})
+        item2 = freeze({"fred": 3, "wilma": 4})
+        self.assertIs(item1._positions, item2._positions)  # pylint: disable=W0212
+        start = len(SmallFrozenDict._key_tables)  # pylint: disable=W0212
+        for index in range(1000):
+            self.assertEqual(freeze({"key{}".format(index): index})["key{}".format(index)],
+                             index)
+        gc.collect()
+        self.assertLessEqual(len(SmallFrozenDict._key_tables), start)  # pylint: disable=W0212
+        self.assertEqual(item1.delkey("wilma"), {"fred": 1})
+        self.assertEqual(item2, {"fred": 3, "wilma": 4})
+
+
+if __name__ == '__main__':
+    unittest_plus.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.include_scan`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+from pathlib import Path
+
+from utl_test import utl_parse_test
+from utl_lib.include_scan import IncludeScanner
+from utl_lib.handler_ast import UTLParseHandlerAST
+from utl_lib.utl_yacc import UTLParser
+
+
+class IncludeScannerTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~utl_lib.include_scan.IncludeScanner`."""
+
+    def setUp(self):
+        self.scanner = IncludeScanner()
+
+    def test_literal(self):
+        """Test finding includes of string literals."""
+        text = ("<p>include 'not_code.utl';</p>\n"
+                "[% include 'a.utl'; x = 1; include \"b/c.inc\" %]\n"
+                "[% /* include 'comment.utl'; */ if x; include 'd.utl'; end; %]\n"
+                "[% echo 'include e.utl'; include 'a.utl' %]")
+        self.assertEqual(self.scanner.scan(text), ['a.utl', 'b/c.inc', 'd.utl', 'a.utl'])
+        self.assertEqual(self.scanner.scan('[% x = 1 %]'), [])
+        self.assertEqual(self.scanner.scan("[% include 'f.utl'"), ['f.utl'])
+
+    def test_needs_parse(self):
+        """Test that anything but a literal include is left to the parser."""
+        for text in ["[% include app_macros; %]",
+                     "[% include 'a' + '.utl'; %]",
+                     "[% include ('a.utl'); %]",
+                     "[% include %]",
+                     "[% x = 1 %] %]"]:
+            self.assertIsNone(self.scanner.scan(text), text)
+        # the lexer is reset between documents
+        self.assertEqual(self.scanner.scan("[% include 'a.utl' %]"), ['a.utl'])
+
+    def test_matches_parse(self):
+        """Test that the scanner finds the same includes as the parser."""
+        text = ("[% include 'a.utl'; if x; include 'b.utl'; end; %]<p>\n"
+                "[% macro m; include 'c.utl'; end; include 'a.utl' %]")
+        tree = UTLParser([UTLParseHandlerAST()]).parse(text, filename='test.utl')
+        self.assertEqual(self.scanner.scan(text),
+                         [node.attributes["file"] for node in tree.find_all('include')])
+        # test data includes an expression, so must be parsed
+        path = Path(__file__).parent / 'test_data' / 'includes.utl'
+        self.assertIsNone(self.scanner.scan(path.read_text()))
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
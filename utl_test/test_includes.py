@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`includes`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import io
+import json
+import os
+import tempfile
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from utl_test import utl_parse_test
+from includes import FileWithIncludes, IncludeDirectoryIndex, write_dot, write_jsonl, write_text
+
+
+def make_args(utl_path, **kwargs):
+    """Returns the arguments ``includes.py`` would have, with no options set except
+    `kwargs`.
+
+    """
+    args = Namespace(site_name='richmond', utl_path=str(utl_path), utl_file=None, db=None,
+                     included_by=None, verbose=False, norepeat=False, norecurse=False,
+                     max_depth=None, nofilecheck=False, format='text', global_skin=None,
+                     skin=None, debug=False, jobs=None)
+    for name, value in kwargs.items():
+        setattr(args, name, value)
+    return args
+
+
+class IncludeDirectoryIndexTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~includes.IncludeDirectoryIndex`."""
+
+    GLOBAL = Path('richmond/global_skins/global-richmond/includes')
+    CUSTOM = Path('richmond/skins/editorial/ed-base_1.0/includes')
+    CERTIFIED = Path('certified/skins/editorial/ed-base_1.0/includes')
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.args = make_args(self.root, global_skin='global-richmond',
+                              skin='editorial/ed-base_1.0')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, path, text=''):
+        """Writes a file under the temporary directory, creating its directory."""
+        (self.root / path).parent.mkdir(parents=True, exist_ok=True)
+        with (self.root / path).open('w') as utlout:
+            utlout.write(text)
+
+    def test_precedence(self):
+        """Test that the global skin wins over the custom skin, and that over the certified
+        skin.
+
+        """
+        for directory in (self.GLOBAL, self.CUSTOM, self.CERTIFIED):
+            self.write(directory / 'all.utl')
+        self.write(self.CUSTOM / 'sub/skins.utl')
+        self.write(self.CERTIFIED / 'sub/skins.utl')
+        self.write(self.CERTIFIED / 'certified.utl')
+        index = IncludeDirectoryIndex.for_args(self.args)
+        self.assertEqual(index.lookup('all.utl'), (self.root / self.GLOBAL / 'all.utl', 'global'))
+        self.assertEqual(index.lookup('sub/skins.utl'),
+                         (self.root / self.CUSTOM / 'sub/skins.utl', 'application (custom)'))
+        self.assertEqual(index.lookup('./sub//skins.utl'), index.lookup('sub/skins.utl'))
+        self.assertEqual(index.lookup('certified.utl'),
+                         (self.root / self.CERTIFIED / 'certified.utl',
+                          'application (certified)'))
+        self.assertEqual(index.lookup('missing.utl'), (None, ''))
+        self.assertEqual(len(index), 3)
+
+    def test_refresh(self):
+        """Test that the directories are rescanned only when one has changed or appeared."""
+        self.write(self.CERTIFIED / 'sub/a.utl')
+        index = IncludeDirectoryIndex.for_args(self.args)
+        self.assertFalse(index.refresh())
+        self.write(self.CERTIFIED / 'sub/b.utl')
+        # the file system's clock may not have moved on
+        os.utime(str(self.root / self.CERTIFIED / 'sub'), ns=(0, 0))
+        self.assertEqual(index.lookup('sub/b.utl'), (None, ''))
+        self.assertTrue(index.refresh())
+        self.assertEqual(index.lookup('sub/b.utl')[1], 'application (certified)')
+        self.assertFalse(index.refresh())
+        # a skin directory that didn't exist
+        self.write(self.GLOBAL / 'sub/b.utl')
+        self.assertTrue(index.refresh())
+        self.assertEqual(index.lookup('sub/b.utl')[1], 'global')
+
+    def test_symlinks(self):
+        """Test that links are followed, but a link back to a parent directory doesn't loop."""
+        self.write(self.GLOBAL / 'sub/a.utl')
+        self.write('shared/b.utl')
+        os.symlink('..', str(self.root / self.GLOBAL / 'sub/loop'))
+        os.symlink(str(self.root / 'shared'), str(self.root / self.GLOBAL / 'shared'))
+        index = IncludeDirectoryIndex.for_args(self.args)
+        self.assertEqual(index.lookup('sub/a.utl')[1], 'global')
+        self.assertEqual(index.lookup('shared/b.utl')[1], 'global')
+        # the walk stops where it would go round again
+        self.assertEqual(index.lookup('sub/loop/sub/a.utl'), (None, ''))
+        self.assertEqual(len(index), 2)
+        self.assertFalse(index.refresh())
+
+
+class IncludeTreeTestCase(utl_parse_test.TestCaseUTL):
+    """A base class for tests on the tree in ``test_data/include_tree``."""
+
+    SKIN = 'richmond/global_skins/global-richmond'
+
+    def setUp(self):
+        self.root = Path(self.data_file('include_tree'))
+        self.args = make_args(self.root, global_skin='global-richmond')
+
+    def template(self, name):
+        """:returns FileWithIncludes: The top-level file for template `name`."""
+        return FileWithIncludes(str(self.root / self.SKIN / 'templates' / name), self.args)
+
+    @staticmethod
+    def names(entries):
+        """:returns list: `entries` from ``walk``, with the files replaced by their names, and
+        the names of expressions by ``'expression'``.
+
+        """
+        def name(utl_file):
+            """:returns str: The name to compare."""
+            return 'expression' if utl_file.is_expression else utl_file.fname.name
+        return [(depth, name(utl_file), parent and name(parent), cycle)
+                for depth, utl_file, parent, cycle in entries]
+
+
+class WalkTestCase(IncludeTreeTestCase):
+    """Unit tests for :py:meth:`~includes.FileWithIncludes.walk` and the report writers."""
+
+    def test_cycles(self):
+        """Test that an include of a file on the current path is reported once, and not
+        followed.
+
+        """
+        self.assertListEqual(self.names(self.template('cycles.utl').walk()),
+                             [(0, 'cycles.utl', None, False),
+                              (1, 'self.utl', 'cycles.utl', False),
+                              (2, 'self.utl', 'self.utl', True),
+                              (1, 'cycle_a.utl', 'cycles.utl', False),
+                              (2, 'cycle_b.utl', 'cycle_a.utl', False),
+                              (3, 'cycle_a.utl', 'cycle_b.utl', True),
+                              (3, 'common.utl', 'cycle_b.utl', False)])
+
+    def test_max_depth(self):
+        """Test that includes below `max_depth` are neither reported nor parsed."""
+        top = self.template('cycles.utl')
+        self.assertListEqual(self.names(top.walk(0)), [(0, 'cycles.utl', None, False)])
+        self.assertFalse(top.is_parsed)
+        self.assertListEqual(self.names(top.walk(1)),
+                             [(0, 'cycles.utl', None, False),
+                              (1, 'self.utl', 'cycles.utl', False),
+                              (1, 'cycle_a.utl', 'cycles.utl', False)])
+        self.assertFalse(top.registry.get('cycle_a.utl').is_parsed)
+        self.assertListEqual(self.names(top.walk(2))[-2:],
+                             [(1, 'cycle_a.utl', 'cycles.utl', False),
+                              (2, 'cycle_b.utl', 'cycle_a.utl', False)])
+        self.assertFalse(top.registry.get('cycle_b.utl').is_parsed)
+
+    def test_write_text(self):
+        """Test the indented report, from :py:func:`~includes.write_text`."""
+        top = self.template('page.utl')
+        out = io.StringIO()
+        write_text(top.walk(), self.args, out, '> ')
+        self.assertEqual(out.getvalue(),
+                         "> Included by {}:\n"
+                         ">     header.utl (global)\n"
+                         ">         common.utl (global)\n"
+                         ">     footer.utl (global)\n"
+                         ">         common.utl (global)\n"
+                         ">     missing.utl (not found)\n".format(top.fname))
+        out = io.StringIO()
+        self.args.norepeat = True
+        self.args.nofilecheck = True
+        top.display(max_depth=1, out=out)
+        self.assertEqual(out.getvalue(),
+                         "Included by {} (repeats omitted):\n"
+                         "    header.utl (global)\n"
+                         "    footer.utl (global)\n"
+                         "    missing.utl\n".format(top.fname))
+
+    def test_write_jsonl(self):
+        """Test the JSON Lines report, from :py:func:`~includes.write_jsonl`."""
+        top = self.template('page.utl')
+        out = io.StringIO()
+        write_jsonl(top.walk(), self.args, out)
+        includes = self.root / self.SKIN / 'includes'
+
+        def entry(depth, name, parent, path, source):
+            """:returns dict: A line of the report."""
+            return {"depth": depth, "file": name, "parent": parent,
+                    "path": path and str(includes / path), "source": source, "cycle": False}
+
+        self.assertListEqual([json.loads(line) for line in out.getvalue().splitlines()],
+                             [{"depth": 0, "file": str(top.fname), "parent": None,
+                               "path": str(top.fname), "source": "", "cycle": False},
+                              entry(1, 'header.utl', str(top.fname), 'header.utl', 'global'),
+                              entry(2, 'common.utl', 'header.utl', 'common.utl', 'global'),
+                              entry(1, 'footer.utl', str(top.fname), 'footer.utl', 'global'),
+                              entry(2, 'common.utl', 'footer.utl', 'common.utl', 'global'),
+                              entry(1, 'missing.utl', str(top.fname), None, '')])
+
+    def test_write_dot(self):
+        """Test the Graphviz report, from :py:func:`~includes.write_dot`: each node and edge
+        once, missing files dashed, and cycles red.
+
+        """
+        top = self.template('page.utl')
+        out = io.StringIO()
+        write_dot(top.walk(), self.args, out)
+        page = json.dumps(str(top.fname))
+        self.assertEqual(out.getvalue(),
+                         'digraph includes {{\n'
+                         '    {0};\n'
+                         '    "header.utl";\n'
+                         '    {0} -> "header.utl";\n'
+                         '    "common.utl";\n'
+                         '    "header.utl" -> "common.utl";\n'
+                         '    "footer.utl";\n'
+                         '    {0} -> "footer.utl";\n'
+                         '    "footer.utl" -> "common.utl";\n'
+                         '    "missing.utl" [style=dashed];\n'
+                         '    {0} -> "missing.utl";\n'
+                         '}}\n'.format(page))
+        out = io.StringIO()
+        write_dot(self.template('cycles.utl').walk(), self.args, out)
+        self.assertIn('    "self.utl" -> "self.utl" [color=red];\n', out.getvalue())
+        self.assertIn('    "cycle_b.utl" -> "cycle_a.utl" [color=red];\n', out.getvalue())
+        self.assertNotIn('"cycle_a.utl" -> "cycle_b.utl" [color=red]', out.getvalue())
+
+
+class IncludeRegistryTestCase(IncludeTreeTestCase):
+    """Unit tests for :py:class:`~includes.IncludeRegistry`."""
+
+    def test_shared(self):
+        """Test that a file included from several places, or by different names, is one
+        :py:class:`~includes.FileWithIncludes`, scanned or parsed once.
+
+        """
+        top = self.template('shared.utl')
+        registry = top.registry
+        with mock.patch.object(registry, 'scan', wraps=registry.scan) as scan, \
+                mock.patch.object(registry, 'parse', wraps=registry.parse) as parse:
+            entries = list(top.walk())
+        self.assertListEqual([name for _, name, _, _ in self.names(entries)],
+                             ['shared.utl', 'header.utl', 'common.utl', 'dynamic.utl',
+                              'common.utl', 'expression', 'footer.utl', 'common.utl',
+                              'dynamic.utl', 'common.utl', 'expression'])
+        common = registry.get('common.utl')
+        self.assertIs(registry.get('header.utl').included[0], common)
+        self.assertIs(registry.get('footer.utl').included[0], common)
+        self.assertIs(registry.get('dynamic.utl').included[0], common)
+        self.assertIs(registry.get('./dynamic.utl'), registry.get('dynamic.utl'))
+        self.assertIs(top.included[1], top.included[3])
+        # shared, header, footer, common and dynamic; only dynamic needs the parser
+        self.assertEqual(scan.call_count, 5)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(parse.call_args[0][1], 'dynamic.utl')
+        self.assertEqual(len(registry), 5)
+
+
+class RecordingExecutor(ProcessPoolExecutor):
+    """A process pool which records the files sent to it by
+    :py:meth:`~includes.IncludeRegistry.expand`.
+
+    """
+    sent = []
+
+    def map(self, fn, *iterables, **kwargs):  # pylint: disable=arguments-differ
+        iterables = [list(iterable) for iterable in iterables]
+        self.sent.extend(Path(path).name for path in iterables[0])
+        return super().map(fn, *iterables, **kwargs)
+
+
+class ExpandTestCase(IncludeTreeTestCase):
+    """Unit tests for :py:meth:`~includes.IncludeRegistry.expand`."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        RecordingExecutor.sent = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def expand(self, name, max_depth=None):
+        """Expands template `name` with two worker processes.
+
+        :returns FileWithIncludes: The template.
+
+        """
+        top = self.template(name)
+        with mock.patch('includes.ProcessPoolExecutor', RecordingExecutor):
+            top.registry.expand(top, 2, max_depth)
+        return top
+
+    def test_same_graph(self):
+        """Test that expanding in worker processes finds the same includes as a serial walk,
+        and leaves nothing to parse.
+
+        """
+        for name in ('page.utl', 'cycles.utl', 'shared.utl'):
+            top = self.expand(name)
+            registry = top.registry
+            with mock.patch.object(registry, 'scan') as scan, \
+                    mock.patch.object(registry, 'parse') as parse:
+                expanded = self.names(top.walk())
+            self.assertFalse(scan.called or parse.called)
+            self.assertListEqual(expanded, self.names(self.template(name).walk()), name)
+        self.assertIn('dynamic.utl', RecordingExecutor.sent)
+
+    def test_max_depth(self):
+        """Test that expansion stops at `max_depth`."""
+        top = self.expand('cycles.utl', 1)
+        self.assertTrue(top.is_parsed)
+        self.assertFalse(top.registry.get('cycle_a.utl').is_parsed)
+        self.assertListEqual(RecordingExecutor.sent, ['cycles.utl'])
+
+    def test_db(self):
+        """Test that includes found by the workers are kept in the index, and unchanged files
+        aren't sent to them again.
+
+        """
+        self.args.db = str(Path(self.tmp_dir.name) / 'index.sqlite3')
+        top = self.expand('shared.utl')
+        top.registry.index.close()
+        graph = self.names(top.walk())
+        self.assertListEqual(sorted(RecordingExecutor.sent),
+                             ['common.utl', 'dynamic.utl', 'footer.utl', 'header.utl',
+                              'shared.utl'])
+        RecordingExecutor.sent = []
+        top = self.expand('shared.utl')
+        top.registry.index.close()
+        self.assertListEqual(RecordingExecutor.sent, [])
+        self.assertListEqual(self.names(top.walk()), graph)
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
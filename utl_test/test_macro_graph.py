@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.macro_graph`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+# pylint: disable=too-few-public-methods
+from utl_test import utl_parse_test
+from utl_lib.macro_graph import MacroCallGraph, enclosing_macros
+from utl_lib.macro_xref import UTLMacro, UTLMacroXref
+from utl_lib.utl_yacc import UTLParser
+from utl_lib.handler_ast import UTLParseHandlerAST
+
+
+class MacroCallGraphTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~utl_lib.macro_graph.MacroCallGraph`."""
+
+    doc_text = """[%
+macro fred; wilma(1); end;
+macro wilma(x); pebbles(x); barney(); end;
+macro pebbles(y); fred(); end;
+macro barney; echo 'yabba'; end;
+macro dino; dino(); bamm_bamm(); end;
+fred();
+%]"""
+    other_text = "[% macro betty; barney(); end; %]"
+
+    def setUp(self):
+        parser = UTLParser([UTLParseHandlerAST()])
+        self.xref = UTLMacroXref(parser.parse(self.doc_text, filename='flintstones.utl'),
+                                 self.doc_text)
+        parser = UTLParser([UTLParseHandlerAST()])
+        self.xref.add_document('rubble.utl', parser.parse(self.other_text,
+                                                          filename='rubble.utl'),
+                               self.other_text)
+        self.graph = MacroCallGraph(self.xref)
+
+    def test_enclosing(self):
+        """Unit tests for :py:func:`~utl_lib.macro_graph.enclosing_macros`."""
+        def macro(name, start, end):
+            """Make a macro for the test."""
+            return UTLMacro({"name": name, "file": "x.utl", "start": start, "end": end,
+                             "line": 1}, "")
+
+        outer = macro("outer", 0, 100)
+        inner = macro("inner", 10, 50)
+        after = macro("a", 120, 130)
+        refs = [{"start": start} for start in (5, 20, 60, 110, 125, 140)]
+        self.assertListEqual([(macro.name, ref["start"]) for macro, ref in
+                              enclosing_macros([after, inner, outer], refs)],
+                             [("outer", 5), ("inner", 20), ("outer", 60), ("a", 125)])
+
+    def test_edges(self):
+        """Test the direct calls found."""
+        self.assertSetEqual(self.graph.calls('wilma'), {'pebbles', 'barney'})
+        self.assertSetEqual(self.graph.calls('barney'), set())
+        self.assertSetEqual(self.graph.calls('betty'), {'barney'})
+        # top-level calls aren't in the graph; undefined macros are
+        self.assertSetEqual(self.graph.names, {'fred', 'wilma', 'pebbles', 'barney', 'dino',
+                                               'bamm_bamm', 'betty'})
+
+    def test_components(self):
+        """Test strongly connected components and cycles."""
+        self.assertListEqual(self.graph.component('fred'), ['fred', 'pebbles', 'wilma'])
+        self.assertListEqual(self.graph.component('barney'), ['barney'])
+        self.assertRaises(KeyError, self.graph.component, 'bedrock')
+        self.assertListEqual(sorted(self.graph.cycles()),
+                             [['dino'], ['fred', 'pebbles', 'wilma']])
+        self.assertTrue(self.graph.is_recursive('dino'))
+        self.assertFalse(self.graph.is_recursive('betty'))
+
+    def test_reachability(self):
+        """Test transitive calls and callers."""
+        self.assertSetEqual(self.graph.reachable_from('fred'),
+                            {'fred', 'wilma', 'pebbles', 'barney'})
+        self.assertSetEqual(self.graph.reachable_from('dino'), {'dino', 'bamm_bamm'})
+        self.assertSetEqual(self.graph.reachable_from('barney'), set())
+        self.assertSetEqual(self.graph.reachable_from('bedrock'), set())
+        self.assertSetEqual(self.graph.callers_of('barney'),
+                            {'fred', 'wilma', 'pebbles', 'betty'})
+        self.assertSetEqual(self.graph.callers_of('betty'), set())
+        self.assertSetEqual(self.graph.callers_of('pebbles'), {'fred', 'wilma', 'pebbles'})
+
+    def test_long_chain(self):
+        """Test a call chain longer than the recursion limit."""
+        xref = UTLMacroXref()
+        macros = [UTLMacro({"name": "m{}".format(i), "file": "x.utl", "start": i * 10,
+                            "end": i * 10 + 9, "line": i}, "") for i in range(3000)]
+        refs = [{"file": "x.utl", "macro": "m{}".format(i + 1), "start": i * 10 + 5,
+                 "line": i} for i in range(3000)]
+        xref.add_records('x.utl', macros, refs)
+        graph = MacroCallGraph(xref)
+        self.assertEqual(len(graph.reachable_from('m0')), 3000)
+        self.assertEqual(len(graph.callers_of('m3000')), 3000)
+        self.assertListEqual(graph.cycles(), [])
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.macro_index`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+# pylint: disable=too-few-public-methods
+import io
+import shutil
+import tempfile
+from pathlib import Path, PurePath
+
+from utl_test import utl_parse_test
+from utl_lib.macro_index import MacroIndex, include_name, package_of, skin_packages
+from utl_lib.macro_xref import UTLMacroXref
+
+
+class MacroIndexTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~utl_lib.macro_index.MacroIndex`."""
+
+    COMPONENT = Path('certified/components/core_base_library_1.0/includes')
+    SKIN = Path('richmond/global_skins/global-richmond/includes')
+
+    def setUp(self):
+        """Builds a small export tree in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name) / 'exported'
+        (self.root / self.COMPONENT).mkdir(parents=True)
+        (self.root / self.SKIN).mkdir(parents=True)
+        shutil.copy(self.data_file('macros.utl'), str(self.root / self.COMPONENT))
+        shutil.copy(self.data_file('includes.utl'), str(self.root / self.SKIN))
+        self.db_file = Path(self.tmp_dir.name) / 'index.sqlite3'
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_package_of(self):
+        """Unit tests for :py:func:`~utl_lib.macro_index.package_of`."""
+        self.assertEqual(package_of(PurePath('certified/skins/editorial/ed-base_1.0/x/y.utl')),
+                         ('certified', 'certified/skins/editorial/ed-base_1.0'))
+        self.assertEqual(package_of(PurePath('richmond/blocks/some_block_1.2/y.utl')),
+                         ('richmond', 'richmond/blocks/some_block_1.2'))
+        self.assertEqual(package_of(PurePath('richmond/y.utl')), ('richmond', ''))
+        self.assertEqual(package_of(PurePath('y.utl')), ('', ''))
+
+    def test_index_tree(self):
+        """Unit tests for :py:meth:`~utl_lib.macro_index.MacroIndex.index_tree` and lookups."""
+        with MacroIndex(self.db_file) as index:
+            self.assertIsNone(index.root)
+            self.assertEqual(index.index_tree(self.root), (2, 0, 0))
+            self.assertEqual(index.root, self.root.resolve())
+            defns = index.definitions('multi_arguments')
+            self.assertEqual(len(defns), 1)
+            self.assertEqual(defns[0]["path"], (self.COMPONENT / 'macros.utl').as_posix())
+            self.assertEqual(defns[0]["line"], 26)
+            self.assertEqual(defns[0]["params"], 'arg1,arg2,arg3,arg4')
+            self.assertEqual(index.definitions('empty_but_legal')[0]["params"], None)
+            self.assertListEqual(index.definitions('no_such_macro'), [])
+            calls = index.calls('wilma')
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(calls[0]["line"], 13)
+            self.assertListEqual([row["path"] for row in index.included_by('fred.utl')],
+                                 [(self.SKIN / 'includes.utl').as_posix()])
+            self.assertListEqual(index.failed_files(), [])
+
+    def test_reindex(self):
+        """Test that only changed files are re-parsed, and deleted files are removed."""
+        with MacroIndex(self.db_file) as index:
+            index.index_tree(self.root)
+        with MacroIndex(self.db_file) as index:
+            self.assertEqual(index.index_tree(self.root), (0, 2, 0))
+            with (self.root / self.COMPONENT / 'macros.utl').open('a') as utlout:
+                utlout.write('\n[% macro added_later; end; %]\n')
+            self.assertEqual(index.index_tree(self.root), (1, 1, 0))
+            self.assertEqual(len(index.definitions('added_later')), 1)
+            self.assertEqual(len(index.definitions('multi_arguments')), 1)
+            (self.root / self.COMPONENT / 'macros.utl').unlink()
+            self.assertEqual(index.index_tree(self.root), (0, 1, 1))
+            self.assertListEqual(index.definitions('multi_arguments'), [])
+            self.assertListEqual(index.calls('wilma'), [])
+            params = index.db.execute('SELECT COUNT(*) FROM macro_params').fetchone()[0]
+            self.assertEqual(params, 0)
+
+    def test_load_xref(self):
+        """Unit tests for :py:meth:`~utl_lib.macro_index.MacroIndex.load_xref`."""
+        with MacroIndex(self.db_file) as index:
+            self.assertEqual(len(index.load_xref().macros), 0)
+            index.index_tree(self.root)
+            xref = index.load_xref()
+        path = (self.COMPONENT / 'macros.utl').as_posix()
+        self.assertIn(path, xref.files)
+        defns = xref.lookup('multi_arguments')
+        self.assertEqual(len(defns), 1)
+        self.assertEqual(defns[0].file, path)
+        self.assertTrue(defns[0].text.startswith('macro multi_arguments'))
+        calls = xref.callers('wilma')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0]["line"], 13)
+        self.assertTrue(calls[0]["call_text"].startswith('wilma'))
+
+    def test_write_jsonl(self):
+        """Unit tests for :py:meth:`~utl_lib.macro_index.MacroIndex.write_jsonl`."""
+        macro_out, ref_out = io.StringIO(), io.StringIO()
+        with MacroIndex(self.db_file) as index:
+            self.assertEqual(index.write_jsonl(macro_out, ref_out), (0, 0))
+            index.index_tree(self.root)
+            xref = index.load_xref()
+            counts = index.write_jsonl(macro_out, ref_out)
+        self.assertEqual(counts, (len(xref.macros), len(xref.references)))
+        loaded = UTLMacroXref()
+        loaded.load_jsonl(io.StringIO(macro_out.getvalue()), io.StringIO(ref_out.getvalue()))
+        self.assertListEqual(loaded.macros, xref.macros)
+        self.assertListEqual(loaded.references, xref.references)
+
+    def test_resolutions(self):
+        """Unit tests for :py:meth:`~utl_lib.macro_index.MacroIndex.resolutions`."""
+        skin = 'editorial/editorial-core-base_1.0'
+        self.assertListEqual(skin_packages('richmond', 'global-richmond', skin),
+                             ['richmond/global_skins/global-richmond',
+                              'richmond/skins/' + skin, 'certified/skins/' + skin])
+        self.assertListEqual(skin_packages('richmond', '', ''), [None, None, None])
+        # the same macros, in the certified skin, a custom skin, and the global skin
+        for tier, directory in enumerate(('richmond/global_skins/global-richmond',
+                                          'richmond/skins/' + skin,
+                                          'certified/skins/' + skin)):
+            includes = self.root / directory / 'includes'
+            includes.mkdir(parents=True, exist_ok=True)
+            with (includes / 'tier.utl').open('w') as utlout:
+                utlout.write('[% macro tier{}; end; macro shared; echo {}; end; %]'
+                             ''.format(tier, tier))
+        with MacroIndex(self.db_file) as index:
+            index.index_tree(self.root)
+            table = index.resolutions('richmond', 'global-richmond', skin)
+            self.assertEqual(table['shared']["tier"], 0)
+            self.assertEqual(table['shared']["path"],
+                             'richmond/global_skins/global-richmond/includes/tier.utl')
+            self.assertListEqual([table['tier{}'.format(tier)]["tier"] for tier in range(3)],
+                                 [0, 1, 2])
+            # macros outside the skins aren't candidates
+            self.assertNotIn('multi_arguments', table)
+            self.assertIs(index.resolutions('richmond', 'global-richmond', skin), table)
+            self.assertEqual(index.resolutions('richmond', '', skin)['shared']["tier"], 1)
+            self.assertDictEqual(index.resolutions('richmond'), {})  # no skins
+        with MacroIndex(self.db_file) as index:
+            # stored with the index
+            self.assertEqual(index.db.execute('SELECT COUNT(*) FROM resolution_tables')
+                             .fetchone()[0], 3)
+            (self.root / 'richmond/global_skins/global-richmond/includes/tier.utl').unlink()
+            index.index_tree(self.root)
+            self.assertEqual(index.db.execute('SELECT COUNT(*) FROM resolution_tables')
+                             .fetchone()[0], 0)
+            table = index.resolutions('richmond', 'global-richmond', skin)
+            self.assertEqual(table['shared']["tier"], 1)
+            self.assertNotIn('tier0', table)
+
+    def test_includes(self):
+        """Unit tests for :py:func:`~utl_lib.macro_index.include_name`,
+        :py:meth:`~utl_lib.macro_index.MacroIndex.current_includes` and
+        :py:meth:`~utl_lib.macro_index.MacroIndex.templates_including`.
+
+        """
+        self.assertEqual(include_name(PurePath('r/skins/a/b/includes/x/y.utl')), 'x/y.utl')
+        self.assertIsNone(include_name(PurePath('r/skins/a/b/templates/y.utl')))
+        self.assertIsNone(include_name(PurePath('r/includes')))
+        files = {self.SKIN / 'header.utl': "[% include 'common.utl'; %]",
+                 self.SKIN / 'common.utl': "[% include 'header.utl'; x = 1; %]",  # a cycle
+                 Path('richmond/global_skins/global-richmond/templates/page.utl'):
+                 "[% include 'header.utl'; %]",
+                 Path('richmond/global_skins/global-richmond/templates/other.utl'):
+                 "[% include 'footer.utl'; %]",
+                 Path('tulsa/global_skins/global-tulsa/templates/page.utl'):
+                 "[% include 'footer.utl'; %]"}
+        for path, text in files.items():
+            (self.root / path).parent.mkdir(parents=True, exist_ok=True)
+            with (self.root / path).open('w') as utlout:
+                utlout.write(text)
+        page = PurePath('richmond/global_skins/global-richmond/templates/page.utl')
+        with MacroIndex(self.db_file) as index:
+            self.assertIsNone(index.current_includes(self.root, page)[1])
+            index.index_tree(self.root)
+            self.assertListEqual(index.current_includes(self.root, page)[1], ['header.utl'])
+            self.assertRaises(ValueError, index.current_includes, self.root / 'richmond', page)
+            with (self.root / page).open('w') as utlout:
+                utlout.write("[% include 'header.utl'; include 'footer.utl'; %]")
+            self.assertIsNone(index.current_includes(self.root, page)[1])
+            index.index_tree(self.root)
+            self.assertListEqual(index.current_includes(self.root, page)[1],
+                                 ['header.utl', 'footer.utl'])
+            # includes of expressions keep the expression's text
+            included = index.current_includes(self.root, self.SKIN / 'includes.utl')[1]
+            self.assertListEqual(included[:2], ['fred.utl', 'expression: id: appMacros'])
+            self.assertTrue(included[2].startswith('expression: expr: '), included[2])
+            skins = ('richmond', 'global-richmond')
+            self.assertListEqual(index.templates_including('common.utl', *skins),
+                                 [page.as_posix()])
+            # only the templates of the given skins
+            self.assertListEqual(index.templates_including('footer.utl', *skins),
+                                 ['richmond/global_skins/global-richmond/templates/other.utl',
+                                  page.as_posix()])
+            self.assertListEqual(index.templates_including('footer.utl', 'tulsa', 'global-tulsa'),
+                                 ['tulsa/global_skins/global-tulsa/templates/page.utl'])
+            self.assertListEqual(index.templates_including('footer.utl', 'richmond'), [])
+            self.assertListEqual(index.templates_including('page.utl', *skins), [])
+
+    def test_store_includes(self):
+        """Unit tests for :py:meth:`~utl_lib.macro_index.MacroIndex.current_includes` and
+        :py:meth:`~utl_lib.macro_index.MacroIndex.store_includes`.
+
+        """
+        macros = self.COMPONENT / 'macros.utl'
+        with MacroIndex(self.db_file) as index:
+            digest, included = index.current_includes(self.root, macros)
+            self.assertIsNone(included)
+            self.assertEqual(index.db.execute('SELECT COUNT(*) FROM files').fetchone()[0], 0)
+            index.store_includes(self.root, [(macros, digest, ['a.utl', 'b.utl'])])
+            self.assertEqual(index.current_includes(self.root, macros),
+                             (digest, ['a.utl', 'b.utl']))
+            self.assertListEqual([tuple(row) for row in index.included_by('b.utl')],
+                                 [(macros.as_posix(), 0)])
+            self.assertListEqual(index.definitions('multi_arguments'), [])
+            # the next index_tree parses it in full
+            self.assertEqual(index.index_tree(self.root), (2, 0, 0))
+            self.assertEqual(len(index.definitions('multi_arguments')), 1)
+            self.assertListEqual(index.current_includes(self.root, macros)[1], [])
+            # a full entry is not replaced by a stored one for the same contents
+            index.store_includes(self.root, [(macros, digest, ['a.utl'])])
+            self.assertEqual(len(index.definitions('multi_arguments')), 1)
+            with (self.root / macros).open('a') as utlout:
+                utlout.write("[% include 'c.utl' %]")
+            digest, included = index.current_includes(self.root, macros)
+            self.assertIsNone(included)
+            index.resolutions('certified')
+            index.store_includes(self.root, [(macros, digest, ['c.utl'])])
+            self.assertEqual(index.current_includes(self.root, macros)[1], ['c.utl'])
+            self.assertEqual(
+                index.db.execute('SELECT COUNT(*) FROM resolution_tables').fetchone()[0], 0)
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.macro_search`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+# pylint: disable=too-few-public-methods
+from utl_test import utl_parse_test
+from utl_lib.macro_search import MacroNameIndex, edit_distance, name_keys
+
+
+class MacroNameIndexTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~utl_lib.macro_search.MacroNameIndex`."""
+
+    NAMES = ['core_base_library.asset_image_url', 'core_base_library.asset_is_video',
+             'core_base_library.url_encode', 'asset_image_url', 'site_header', 'fred']
+
+    def test_helpers(self):
+        """Unit tests for :py:func:`~utl_lib.macro_search.name_keys` and
+        :py:func:`~utl_lib.macro_search.edit_distance`.
+
+        """
+        self.assertListEqual(name_keys('A.B_c.d'), ['a.b_c.d', 'b_c.d', 'd'])
+        self.assertListEqual(name_keys('fred'), ['fred'])
+        self.assertEqual(edit_distance('kitten', 'sitting', 5), 3)
+        self.assertEqual(edit_distance('kitten', 'sitting', 2), 3)
+        self.assertEqual(edit_distance('fred', 'fred', 0), 0)
+        self.assertEqual(edit_distance('', 'abc', 3), 3)
+
+    def test_prefix(self):
+        """Test searches by name or segment prefix."""
+        index = MacroNameIndex(self.NAMES)
+        self.assertEqual(len(index), 6)
+        self.assertListEqual(index.prefix('core_base_library.asset'),
+                             ['core_base_library.asset_image_url',
+                              'core_base_library.asset_is_video'])
+        self.assertListEqual(index.prefix('Asset_Im'),
+                             ['asset_image_url', 'core_base_library.asset_image_url'])
+        self.assertListEqual(index.prefix('url'), ['core_base_library.url_encode'])
+        self.assertListEqual(index.prefix('asset', limit=1), ['asset_image_url'])
+        self.assertListEqual(index.prefix('wilma'), [])
+        self.assertEqual(len(index.prefix('')), 6)
+
+    def test_fuzzy(self):
+        """Test searches allowing for typos."""
+        index = MacroNameIndex(self.NAMES)
+        self.assertListEqual(index.fuzzy('site_heder'), ['site_header'])
+        self.assertListEqual(index.fuzzy('aset_imag_url'),
+                             ['asset_image_url', 'core_base_library.asset_image_url'])
+        self.assertListEqual(index.fuzzy('core_base_libary.url_encod'),
+                             ['core_base_library.url_encode'])
+        self.assertListEqual(index.fuzzy('frd'), ['fred'])
+        self.assertListEqual(index.fuzzy('frd', max_distance=0), [])
+        self.assertListEqual(index.fuzzy('barney_rubble'), [])
+        self.assertListEqual(index.search('site_'), ['site_header'])
+        self.assertListEqual(index.search('fredd'), ['fred'])
+
+    def test_update(self):
+        """Test adding and removing names."""
+        index = MacroNameIndex(self.NAMES)
+        index.add('fred')
+        self.assertEqual(len(index), 6)
+        index.remove('core_base_library.asset_image_url')
+        self.assertNotIn('core_base_library.asset_image_url', index)
+        self.assertListEqual(index.prefix('asset_im'), ['asset_image_url'])
+        self.assertListEqual(index.fuzzy('core_base_library.aset_image_url'), [])
+        index.add('core_base_library.asset_image_url')
+        self.assertListEqual(index.prefix('asset_im'),
+                             ['asset_image_url', 'core_base_library.asset_image_url'])
+        self.assertRaises(KeyError, index.remove, 'wilma')
+        for name in self.NAMES:
+            index.remove(name)
+        self.assertEqual(len(index), 0)
+        self.assertListEqual(index.prefix(''), [])
+        self.assertDictEqual(dict(index._grams), {})  # pylint: disable=protected-access
+        self.assertDictEqual(dict(index._lengths), {})  # pylint: disable=protected-access
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
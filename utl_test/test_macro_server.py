@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.macro_server`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+# pylint: disable=too-few-public-methods,protected-access
+import json
+import threading
+from urllib.request import urlopen
+from urllib.error import HTTPError
+
+from utl_test import utl_parse_test
+from utl_lib.macro_server import MacroLookupServer
+from utl_lib.macro_xref import UTLMacroXref
+from utl_lib.utl_yacc import UTLParser
+from utl_lib.handler_ast import UTLParseHandlerAST
+
+
+class MacroLookupServerTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~utl_lib.macro_server.MacroLookupServer`."""
+
+    doc_text = """[% macro fred;
+  wilma(8);
+end;
+fred(); %]"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Starts a server on a free port."""
+        parsed = UTLParser([UTLParseHandlerAST()]).parse(cls.doc_text, filename='macros.utl')
+        cls.server = MacroLookupServer(('localhost', 0), UTLMacroXref(parsed, cls.doc_text),
+                                       quiet=True)
+        cls.url = 'http://localhost:{}'.format(cls.server.server_address[1])
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stops the server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+
+    def get(self, path):
+        """:returns: The decoded JSON response to a request for `path`."""
+        with urlopen(self.url + path) as response:
+            self.assertEqual(response.headers['Content-Type'], 'application/json; charset=utf-8')
+            return json.loads(response.read().decode('utf-8'))
+
+    def test_macro(self):
+        """Test a request for definitions and calls."""
+        result = self.get('/macro/fred')
+        self.assertEqual(result["name"], "fred")
+        self.assertEqual(len(result["definitions"]), 1)
+        definition = result["definitions"][0]
+        self.assertEqual(definition["file"], "macros.utl")
+        self.assertEqual(definition["line"], 1)
+        self.assertEqual(definition["text"],
+                         self.doc_text[definition["start"]:definition["end"]])
+        self.assertTrue(definition["text"].startswith("macro fred;"))
+        self.assertListEqual(result["calls"],
+                             [{"file": "macros.utl", "line": 4, "start": 32,
+                               "call_text": "fred()"}])
+        # cached response is the same
+        self.assertDictEqual(self.get('/macro/fred'), result)
+
+    def test_definitions_calls(self):
+        """Test requests for only definitions, or only calls."""
+        self.assertListEqual(self.get('/definitions/wilma'), [])
+        self.assertListEqual([call["line"] for call in self.get('/calls/wilma')], [2])
+        self.assertEqual(len(self.get('/definitions/fred')), 1)
+
+    def test_search(self):
+        """Test a search for macro names."""
+        self.assertListEqual(self.get('/search/fr'), ['fred'])
+        self.assertListEqual(self.get('/search/frad'), ['fred'])
+        self.assertListEqual(self.get('/search/barney'), [])
+
+    def test_errors(self):
+        """Test responses to bad requests."""
+        for path, status in (('/macro/barney', 404), ('/fred', 400), ('/macro/', 400)):
+            with self.assertRaises(HTTPError) as context:
+                urlopen(self.url + path)
+            self.assertEqual(context.exception.code, status)
+            context.exception.close()
+
+    def test_cache(self):
+        """Test that the response cache is bounded, and doesn't keep misses."""
+        self.server.cache_size = 2
+        try:
+            self.assertIsNone(self.server.response('macro', 'barney'))
+            self.assertEqual(self.server.response('definitions', 'barney'), b'[]')
+            self.assertNotIn(('macro', 'barney'), self.server._responses)
+            self.assertNotIn(('definitions', 'barney'), self.server._responses)
+            for text in ('a', 'b', 'c', 'd'):
+                self.server.response('search', text)
+            self.assertEqual(len(self.server._responses), 2)
+            self.assertIn(('search', 'd'), self.server._responses)
+        finally:
+            self.server.cache_size = 1024
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -9,12 +9,14 @@
 
 """
 # pylint: disable=too-few-public-methods
+import io
 import json
 import re
 from collections import defaultdict
 
 from utl_test import utl_parse_test
-from utl_lib.macro_xref import UTLMacro, UTLMacroXref
+from utl_lib.macro_xref import (UTLMacro, UTLMacroXref, read_macros_jsonl, read_refs_jsonl,
+                                write_macros_jsonl)
 from utl_lib.ast_node import ASTNode
 from utl_lib.utl_yacc import UTLParser
 from utl_lib.handler_ast import UTLParseHandlerAST
@@ -272,6 +274,74 @@ end; %]"""
                                         'macro': 'fred'}]
         self.assertEqual(themacro.references, expected_refs)
 
+    def test_lookup(self):
+        """Unit tests for :py:meth:`~utl_lib.macro_xref.UTLMacroXref.lookup` and
+        :py:meth:`~utl_lib.macro_xref.UTLMacroXref.callers`.
+
+        """
+        doc_text = self.doc_text_1 + "\n[% macro fred(x); wilma(x); end; %]"
+        p = UTLParser([UTLParseHandlerAST()])
+        parsed = p.parse(doc_text, filename='macros.utl')
+        item1 = UTLMacroXref(parsed, doc_text)
+        freds = item1.lookup("fred")
+        self.assertEqual(len(freds), 2)
+        self.assertListEqual([macro.line for macro in freds], [1, 8])
+        self.assertListEqual(item1.lookup("wilma"), [])
+        self.assertListEqual([ref["line"] for ref in item1.callers("wilma")], [6, 8])
+        self.assertListEqual([ref["line"] for ref in item1.callers("fred")], [5])
+        self.assertListEqual(item1.callers("barney"), [])
+        # both definitions get the call
+        for macro in freds:
+            self.assertEqual(len(macro.references["macros.utl"]), 1)
+
+    def test_documents(self):
+        """Unit tests for :py:meth:`~utl_lib.macro_xref.UTLMacroXref.add_document`,
+        :py:meth:`~utl_lib.macro_xref.UTLMacroXref.remove_document`, and
+        :py:meth:`~utl_lib.macro_xref.UTLMacroXref.replace_document`.
+
+        """
+        other_text = "[% wilma(1); fred(2); macro wilma(x); echo x; end; %]"
+        p = UTLParser([UTLParseHandlerAST()])
+        parsed1 = p.parse(self.doc_text_1, filename='macros.utl')
+        parsed2 = UTLParser([UTLParseHandlerAST()]).parse(other_text, filename='other.utl')
+        item1 = UTLMacroXref()
+        self.assertListEqual(item1.files, [])
+        item1.add_document('macros.utl', parsed1, self.doc_text_1)
+        item1.add_document('other.utl', parsed2, other_text)
+        self.assertListEqual(item1.files, ['macros.utl', 'other.utl'])
+        self.assertListEqual(item1.topnodes, [parsed1, parsed2])
+        self.assertEqual(item1.texts['other.utl'], other_text)
+        self.assertRaises(ValueError, item1.add_document, 'other.utl', parsed2, other_text)
+        fred = item1.lookup("fred")[0]
+        wilma = item1.lookup("wilma")[0]
+        self.assertSetEqual(set(fred.references.keys()), {'macros.utl', 'other.utl'})
+        # call in macros.utl was added before the definition in other.utl
+        self.assertSetEqual(set(wilma.references.keys()), {'macros.utl', 'other.utl'})
+        self.assertEqual(len(item1.macros), 2)
+        self.assertEqual(len(item1.references), 4)
+        self.assertListEqual(list(item1.names), ['fred', 'wilma'])
+
+        item1.remove_document('other.utl')
+        self.assertListEqual(item1.files, ['macros.utl'])
+        self.assertListEqual(item1.topnodes, [parsed1])
+        self.assertNotIn('other.utl', item1.texts)
+        self.assertListEqual(item1.lookup("wilma"), [])
+        self.assertListEqual(item1.macros, [fred])
+        self.assertListEqual(list(fred.references.keys()), ['macros.utl'])
+        self.assertListEqual([ref["file"] for ref in item1.callers("wilma")], ['macros.utl'])
+        self.assertEqual(len(item1.references), 2)
+        self.assertRaises(KeyError, item1.remove_document, 'other.utl')
+        self.assertListEqual(item1.names.search('wilm'), [])
+
+        # the same as building from scratch
+        item1.replace_document('other.utl', parsed2, other_text)
+        parsed2 = UTLParser([UTLParseHandlerAST()]).parse(other_text, filename='other.utl')
+        item1.replace_document('other.utl', parsed2, other_text)
+        item2 = UTLMacroXref(parsed1, self.doc_text_1)
+        item2.add_document('other.utl', parsed2, other_text)
+        self.assertListEqual(item1.macros, item2.macros)
+        self.assertListEqual(item1.references, item2.references)
+
     def test_json(self):
         """unit tests for :py:meth:`~utl_lib.macro_xref.UTLMacroXref.json`."""
         p = UTLParser([UTLParseHandlerAST()])
@@ -300,9 +370,7 @@ end; %]"""
         self.assertTrue(json_str.startswith('[{'))
         self.assertTrue(json_str.endswith('}]'))
         # handle case where there are no macros found
-        item1.macros = []
-        json_str = item1.json()
-        self.assertEqual(json_str, '[]')
+        self.assertEqual(UTLMacroXref().json(), '[]')
 
     def test_refs_json(self):
         """unit tests for :py:meth:`~utl_lib.macro_xref.UTLMacroXref.refs_json`."""
@@ -315,6 +383,39 @@ end; %]"""
         self.assertIn('"file": "macros.utl"', json_str)
         self.assertIn('"macro": "fred"', json_str)
 
+    def test_jsonl(self):
+        """Unit tests for JSON Lines export and import."""
+        other_text = "[% wilma(1); fred(2); macro wilma(x); echo x; end; %]"
+        item1 = UTLMacroXref(UTLParser([UTLParseHandlerAST()]).parse(self.doc_text_1,
+                                                                     filename='macros.utl'),
+                             self.doc_text_1)
+        item1.add_document('other.utl',
+                           UTLParser([UTLParseHandlerAST()]).parse(other_text,
+                                                                   filename='other.utl'),
+                           other_text)
+        macro_out, ref_out = io.StringIO(), io.StringIO()
+        item1.write_jsonl(macro_out, ref_out)
+        lines = macro_out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertNotIn("references", json.loads(lines[0]))
+        self.assertEqual(len(ref_out.getvalue().splitlines()), 4)
+
+        item2 = UTLMacroXref()
+        item2.load_jsonl(io.StringIO(macro_out.getvalue() + '\n'),
+                         io.StringIO(ref_out.getvalue()))
+        self.assertListEqual(item2.files, ['macros.utl', 'other.utl'])
+        self.assertListEqual(item2.macros, item1.macros)
+        self.assertListEqual(item2.references, item1.references)
+        self.assertRaises(ValueError, item2.load_jsonl, io.StringIO(macro_out.getvalue()),
+                          io.StringIO())
+
+        # readers and writers work one item at a time
+        macros = read_macros_jsonl(io.StringIO(macro_out.getvalue()))
+        self.assertEqual(next(macros).name, 'fred')
+        self.assertEqual(write_macros_jsonl(iter([]), io.StringIO()), 0)
+        self.assertEqual(next(read_refs_jsonl(io.StringIO(ref_out.getvalue())))["call_text"],
+                         'fred(7)')
+
 
 if __name__ == '__main__':
     utl_parse_test.main()
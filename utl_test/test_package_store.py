@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.package_store`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+from utl_test import utl_parse_test
+from utl_lib.package_store import PackageStore, zip_entries
+
+
+class PackageStoreTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~utl_lib.package_store.PackageStore`."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.top = Path(self.tmp_dir.name)
+        self.store = PackageStore(self.top / 'store')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_zip(self, name, files):
+        """Writes a ZIP file holding `files` (a dictionary of contents by name)."""
+        path = self.top / name
+        with zipfile.ZipFile(str(path), 'w', zipfile.ZIP_DEFLATED) as zipout:
+            for file_name, contents in files.items():
+                zipout.writestr(file_name, contents)
+        return zipfile.ZipFile(str(path))
+
+    def test_install(self):
+        """Test that shared contents are stored once, and packages are hard links to them."""
+        files = {'info.json': '{"name": "pkg"}', 'includes/a.utl': "[% a = 1 %]",
+                 'includes/b.utl': "[% a = 1 %]"}
+        with self.make_zip('one.zip', files) as archive:
+            self.assertTrue(self.store.install(archive, Path('certified/blocks/pkg_1.0'),
+                                               self.top / 'one'))
+        for name, contents in files.items():
+            self.assertEqual((self.top / 'one' / name).read_text(), contents)
+        self.assertEqual(os.stat(str(self.top / 'one/includes/a.utl')).st_ino,
+                         os.stat(str(self.top / 'one/includes/b.utl')).st_ino)
+        stored = list(self.store.objects.rglob('*'))
+        self.assertEqual(len([path for path in stored if path.is_file()]), 2)
+
+        # same package again: linked from the manifest without reading the ZIP contents
+        with self.make_zip('two.zip', files) as archive:
+            self.assertFalse(self.store.install(archive, Path('certified/blocks/pkg_1.0'),
+                                                self.top / 'two'))
+        self.assertEqual((self.top / 'two/includes/a.utl').read_text(), "[% a = 1 %]")
+
+        # changed contents are stored, and the manifest replaced
+        files['includes/a.utl'] = "[% a = 2 %]"
+        with self.make_zip('three.zip', files) as archive:
+            self.assertTrue(self.store.install(archive, Path('certified/blocks/pkg_1.0'),
+                                               self.top / 'three'))
+            self.assertTrue(self.store.matches(
+                self.store.load_manifest(Path('certified/blocks/pkg_1.0')), archive))
+        self.assertEqual((self.top / 'three/includes/a.utl').read_text(), "[% a = 2 %]")
+        self.assertEqual((self.top / 'one/includes/a.utl').read_text(), "[% a = 1 %]")
+        self.assertIsNone(self.store.load_manifest(Path('certified/blocks/other_1.0')))
+
+    def test_unsafe_names(self):
+        """Test that ZIP files with names outside the package are refused."""
+        with self.make_zip('bad.zip', {'../escape.utl': 'x'}) as archive:
+            self.assertRaises(ValueError, zip_entries, archive)
+            self.assertRaises(ValueError, self.store.install, archive, Path('pkg'),
+                              self.top / 'bad')
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`utl_lib.source_store`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+# pylint: disable=too-few-public-methods,protected-access
+import tempfile
+import threading
+from pathlib import Path
+
+from utl_test import utl_parse_test
+from utl_lib import source_store
+from utl_lib.source_store import SourceStore
+
+
+class SourceStoreTestCase(utl_parse_test.TestCaseUTL):
+    """Unit tests for :py:class:`~utl_lib.source_store.SourceStore`."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_size = source_store.CHECKPOINT_SIZE
+
+    def tearDown(self):
+        source_store.CHECKPOINT_SIZE = self.checkpoint_size
+        self.tmp_dir.cleanup()
+
+    def write(self, name, contents):
+        """Writes a file in the temporary directory, returns its path."""
+        path = Path(self.tmp_dir.name) / name
+        with path.open('wb') as binout:
+            binout.write(contents)
+        return path
+
+    def test_text(self):
+        """Test documents added from memory."""
+        text = "[% macro fred; echo 'hi'; end; %]"
+        with SourceStore() as store:
+            file_id = store.add_text('fred.utl', text)
+            self.assertIn(file_id, store)
+            self.assertEqual(store.name(file_id), 'fred.utl')
+            self.assertIs(store.text(file_id), text)
+            self.assertDictEqual(store.texts, {'fred.utl': text})
+            self.assertEqual(store.snippet(file_id, 3, 13), 'macro fred')
+            store.remove(file_id)
+            self.assertEqual(len(store), 0)
+            self.assertDictEqual(store.texts, {})
+            self.assertRaises(KeyError, store.remove, file_id)
+
+    def test_ascii_file(self):
+        """Test snippets from an ASCII file."""
+        with open(self.data_file('macros.utl'), 'r') as utlin:
+            text = utlin.read()
+        with SourceStore() as store:
+            file_id = store.add_file('macros.utl', self.data_file('macros.utl'))
+            self.assertEqual(store.snippet(file_id, 10, 50), text[10:50])
+            self.assertIsNone(store._checkpoints[file_id])
+            self.assertEqual(store.text(file_id), text)
+            self.assertDictEqual(store.texts, {})
+
+    def test_unicode_file(self):
+        """Test snippets from a file with multi-byte characters and undecodable bytes."""
+        source_store.CHECKPOINT_SIZE = 16
+        contents = ("[% echo 'café — naïve'; %]\n" * 20).encode('utf-8') + \
+            b"[% echo '\xff\xfe'; macro fred; end; %]\n"
+        text = contents.decode('utf-8', errors='replace')
+        with SourceStore() as store:
+            file_id = store.add_file('unicode.utl', self.write('unicode.utl', contents))
+            self.assertEqual(store.text(file_id), text)
+            self.assertIsNotNone(store._checkpoints[file_id])
+            for start in range(0, len(text), 7):
+                for length in (1, 5, 40):
+                    self.assertEqual(store.snippet(file_id, start, start + length),
+                                     text[start:start + length])
+
+    def test_open_files(self):
+        """Test that only `max_open` files are kept mapped, and empty files work."""
+        with SourceStore(max_open=2) as store:
+            file_ids = [store.add_file('f{}.utl'.format(i),
+                                       self.write('f{}.utl'.format(i),
+                                                  '[% fred({}); %]'.format(i).encode()))
+                        for i in range(4)]
+            for i, file_id in enumerate(file_ids):
+                self.assertEqual(store.snippet(file_id, 3, 10), 'fred({})'.format(i))
+            self.assertListEqual(list(store._maps), file_ids[2:])
+            self.assertEqual(store.text(file_ids[0]), '[% fred(0); %]')
+            self.assertListEqual(list(store._maps), [file_ids[3], file_ids[0]])
+            empty = store.add_file('empty.utl', self.write('empty.utl', b''))
+            self.assertEqual(store.snippet(empty, 0, 10), '')
+        self.assertEqual(len(store._maps), 0)
+
+    def test_threads(self):
+        """Test that threads sharing a store never see a map closed under them."""
+        store = SourceStore(cache_size=0, max_open=4)
+        file_ids = [store.add_file('f{}.utl'.format(i),
+                                   self.write('f{}.utl'.format(i),
+                                              '[% fred({:03}); %]'.format(i).encode()))
+                    for i in range(200)]
+        errors = []
+
+        def fetch(offset):
+            """Fetches a snippet from every file, starting at a different one per thread."""
+            try:
+                for pos in range(len(file_ids) * 3):
+                    i = (pos + offset * 25) % len(file_ids)
+                    if store.snippet(file_ids[i], 3, 12) != 'fred({:03})'.format(i):
+                        errors.append('wrong text in f{}.utl'.format(i))
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(err)
+
+        threads = [threading.Thread(target=fetch, args=(offset, )) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.close()
+        self.assertListEqual(errors, [])
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End:
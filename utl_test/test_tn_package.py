@@ -9,6 +9,9 @@
 
 """
 # pylint: disable=too-few-public-methods
+import os
+import tempfile
+import zipfile
 from pathlib import Path
 from warnings import simplefilter
 
@@ -208,6 +211,47 @@ class TNPackageTestCase(unittest_plus.TestCasePlus):
         self.assertIsInstance(the_pkg, TNPackage)
         self.assertRaises(ValueError, lambda: the_pkg.install_dir)
 
+    def zip_dir(self, pkg_dir, zip_path):
+        """Writes the contents of `pkg_dir` to a new ZIP file at `zip_path`."""
+        with zipfile.ZipFile(str(zip_path), 'w') as zipout:
+            for dir_name, _, file_names in os.walk(str(pkg_dir)):
+                for file_name in file_names:
+                    path = Path(dir_name, file_name)
+                    zipout.write(str(path), str(path.relative_to(pkg_dir)))
+
+    def test_load_from_zip(self):
+        """Unit test for :py:meth:`utl_lib.tn_package.TNPackage.load_from_zip`: a package read
+        from a ZIP file is the same as one read from the unzipped directory.
+
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for pkg_dir, zip_name, site in (
+                    ('editorial-core-mobile-1.54', 'skin_editorial_core-mobile-1.54.0.0.zip',
+                     None),
+                    ('core-asset-index-gallery_showcase',
+                     'block_core-asset-index-gallery_showcase_1.41.0.1.zip', None),
+                    ('components/kh_core_base_library_1.0',
+                     'component_kh_core_base_library_1.0.zip', 'kearneyhub.com')):
+                zip_path = Path(tmp_dir) / zip_name
+                self.zip_dir(self.TEST_DATA / pkg_dir, zip_path)
+                from_dir = TNPackage.load_from(self.TEST_DATA / pkg_dir, zip_path, site)
+                from_zip = TNPackage.load_from_zip(zip_path, site)
+                self.assertEqual(from_zip.properties, from_dir.properties)
+                self.assertEqual(from_zip.deps, from_dir.deps)
+                self.assertEqual(from_zip.is_certified, from_dir.is_certified)
+                self.assertEqual(from_zip.zipfile, zip_path)
+                simplefilter("ignore")  # skip UserWarning about inconsistent name
+                try:
+                    self.assertEqual(from_zip.install_dir, from_dir.install_dir)
+                finally:
+                    simplefilter("default")
+                with zipfile.ZipFile(str(zip_path)) as archive:
+                    self.assertEqual(TNPackage.load_from_zip(archive, site).properties,
+                                     from_dir.properties)
+            not_zip = Path(tmp_dir) / 'block_not_a_zip.zip'
+            not_zip.write_text('hello')
+            self.assertRaises(PackageError, TNPackage.load_from_zip, not_zip)
+
 
 if __name__ == '__main__':
     unittest_plus.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""Unit tests for :py:mod:`unpack_zip_files`.
+
+| Copyright: 2016 BH Media Group, Inc.
+| Organization: BH Media Group Digital Development
+
+.. codeauthor:: A. Lloyd Flanagan <aflanagan@bhmginc.com>
+
+"""
+import io
+import json
+import os
+import tempfile
+import zipfile
+from contextlib import redirect_stderr
+from pathlib import Path
+from shutil import rmtree
+from unittest import mock
+
+from utl_test import utl_parse_test
+from unpack_zip_files import extract_package, unpack_sites
+
+
+class UnpackTestCase(utl_parse_test.TestCaseUTL):
+    """A base class for tests which unpack export files built in a temporary directory."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.top = Path(self.tmp_dir.name)
+        self.dest = self.top / 'exported'
+        self.dest.mkdir()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_zip(self, site, zip_name, name, version, files, certified=False):
+        """Writes an export file for a package to the ZIP directory for `site`.
+
+        :returns Path: The file.
+
+        """
+        path = self.top / 'zips' / site / zip_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(str(path), 'w', zipfile.ZIP_DEFLATED) as zipout:
+            zipout.writestr('info.json', json.dumps({"name": name, "version": version}))
+            zipout.writestr('.metadata/.meta.json', '{}')
+            if certified:
+                zipout.writestr('.certification', '')
+            for file_name, contents in files.items():
+                zipout.writestr(file_name, contents)
+        return path
+
+    def unpack(self, sites, dest=None, **kwargs):
+        """Unpacks the ZIP directories of `sites` to `dest` (by default, :py:attr:`dest`)."""
+        unpack_sites([(site, self.top / 'zips' / site) for site in sites],
+                     dest or self.dest, **kwargs)
+
+    def site_meta(self, site, dest=None):
+        """:returns dict: The contents of the site metadata for `site`."""
+        with ((dest or self.dest) / site / 'site_meta.json').open('r') as metain:
+            return json.load(metain)
+
+
+class UnchangedTestCase(UnpackTestCase):
+    """Unit tests for skipping export files which haven't changed since they were unpacked."""
+
+    def setUp(self):
+        super().setUp()
+        self.zip_file = self.make_zip('richmond', 'block_custom.zip', 'custom', '1.0',
+                                      {'block.utl': "[% x = 1 %]"})
+        self.package = self.dest / 'richmond/blocks/custom_1.0'
+        self.unpack(['richmond'])
+        self.fingerprint = self.site_meta('richmond')["custom"]["fingerprint"]
+        # anything unpacked again is deleted first, so this shows what was skipped
+        (self.package / 'marker').touch()
+
+    def assertUnpacked(self, unpacked):  # pylint: disable=invalid-name
+        """Asserts the package was or wasn't unpacked again."""
+        self.assertEqual(not (self.package / 'marker').exists(), unpacked)
+        self.assertTrue((self.package / 'block.utl').exists())
+
+    def test_same_size_and_mtime(self):
+        """Test that a file with the recorded size and mtime is skipped."""
+        self.unpack(['richmond'], overwrite=True)
+        self.assertUnpacked(False)
+        self.assertEqual(self.fingerprint["size"], self.zip_file.stat().st_size)
+        self.assertEqual(self.site_meta('richmond')["custom"]["fingerprint"], self.fingerprint)
+
+    def test_touched(self):
+        """Test that a file with a new mtime, but the same central directory, is skipped, and
+        its new mtime recorded.
+
+        """
+        os.utime(str(self.zip_file), ns=(0, self.fingerprint["mtime"] + 10 ** 9))
+        self.unpack(['richmond'], overwrite=True)
+        self.assertUnpacked(False)
+        self.assertEqual(self.site_meta('richmond')["custom"]["fingerprint"],
+                         dict(self.fingerprint, mtime=self.fingerprint["mtime"] + 10 ** 9))
+
+    def test_changed(self):
+        """Test that a file with different contents is unpacked again."""
+        self.make_zip('richmond', 'block_custom.zip', 'custom', '1.0',
+                      {'block.utl': "[% x = 2; y = 3 %]"})
+        self.unpack(['richmond'], overwrite=True)
+        self.assertUnpacked(True)
+        with (self.package / 'block.utl').open('r') as utlin:
+            self.assertEqual(utlin.read(), "[% x = 2; y = 3 %]")
+        fingerprint = self.site_meta('richmond')["custom"]["fingerprint"]
+        self.assertNotEqual(fingerprint["crc"], self.fingerprint["crc"])
+        self.assertEqual(fingerprint["size"], self.zip_file.stat().st_size)
+
+    def test_missing_directory(self):
+        """Test that a file is unpacked again if its package directory is gone."""
+        rmtree(str(self.package))
+        self.unpack(['richmond'])
+        self.assertTrue((self.package / 'block.utl').exists())
+        self.assertEqual(self.site_meta('richmond')["custom"]["fingerprint"], self.fingerprint)
+
+    def test_force(self):
+        """Test that ``force`` unpacks unchanged files."""
+        self.unpack(['richmond'], overwrite=True, force=True)
+        self.assertUnpacked(True)
+        self.assertEqual(self.site_meta('richmond')["custom"]["fingerprint"], self.fingerprint)
+
+
+class UnpackSitesTestCase(UnpackTestCase):
+    """Unit tests for unpacking the exports of several sites at once."""
+
+    SHARED = Path('certified/components/shared_2.0')
+
+    def setUp(self):
+        super().setUp()
+        shared = {'includes/shared.utl': "[% x = 1 %]"}
+        self.make_zip('richmond', 'block_custom.zip', 'custom', '1.0', {'block.utl': "a"})
+        self.make_zip('richmond', 'component_shared.zip', 'shared', '2.0', shared, True)
+        self.make_zip('richmond', 'global_richmond.zip', 'richmond', '', {'includes/g.utl': "g"})
+        self.make_zip('richmond', 'skin_editorial_ed-base.zip', 'ed-base', '1.0',
+                      {'templates/index.html.utl': "i"}, True)
+        self.make_zip('tulsa', 'block_other.zip', 'other', '1.1', {'block.utl': "b"})
+        self.make_zip('tulsa', 'component_shared.zip', 'shared', '2.0', shared, True)
+        self.make_zip('tulsa', 'global_tulsa.zip', 'tulsa', '', {'includes/g.utl': "t"})
+        # nothing of its own to unpack
+        self.make_zip('austin', 'component_shared.zip', 'shared', '2.0', shared, True)
+
+    def files(self, dest):
+        """:returns list: The files under `dest`, but not in the package store."""
+        return sorted(path.relative_to(dest).as_posix() for path in dest.rglob('*')
+                      if path.is_file() and '.package_store' not in path.parts)
+
+    def test_deterministic(self):
+        """Test that the results are the same however many threads do the work."""
+        other = self.top / 'exported4'
+        other.mkdir()
+        self.unpack(['richmond', 'tulsa'], jobs=1)
+        self.unpack(['richmond', 'tulsa'], dest=other, jobs=4)
+        for site in ('richmond', 'tulsa'):
+            with (self.dest / site / 'site_meta.json').open('r') as metain, \
+                    (other / site / 'site_meta.json').open('r') as other_in:
+                self.assertEqual(metain.read(), other_in.read())
+        self.assertListEqual(self.files(self.dest), self.files(other))
+        self.assertListEqual(sorted(self.site_meta('richmond')),
+                             ['custom', 'ed-base', 'richmond', 'shared'])
+
+    def test_shared_certified(self):
+        """Test that a certified package in two sites' exports is extracted once, and recorded
+        for both; and that one already extracted is recorded without extracting it again.
+
+        """
+        with mock.patch('unpack_zip_files.extract_package', wraps=extract_package) as extract:
+            self.unpack(['richmond', 'tulsa', 'austin'], jobs=4)
+        self.assertEqual([call[0][0].parent.name for call in extract.call_args_list
+                          if call[0][2] == self.SHARED], ['richmond'])
+        for site in ('richmond', 'tulsa', 'austin'):
+            self.assertEqual(self.site_meta(site)["shared"]["install_dir"],
+                             self.SHARED.as_posix())
+
+        other = self.top / 'exported2'
+        other.mkdir()
+        self.unpack(['richmond'], dest=other)
+        with mock.patch('unpack_zip_files.extract_package', wraps=extract_package) as extract:
+            self.unpack(['tulsa'], dest=other)
+        self.assertNotIn(self.SHARED, [call[0][2] for call in extract.call_args_list])
+        self.assertEqual(self.site_meta('tulsa', other)["shared"]["certified"], "Y")
+
+    def test_wont_overwrite(self):
+        """Test that a package directory already there is left alone, and the package not
+        recorded, unless ``overwrite`` is given.
+
+        """
+        existing = self.dest / 'richmond/blocks/custom_1.0'
+        existing.mkdir(parents=True)
+        (existing / 'block.utl').write_text('old')
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            self.unpack(['richmond'])
+        self.assertIn("Won't overwrite existing directory '{}'".format(existing),
+                      stderr.getvalue())
+        self.assertEqual((existing / 'block.utl').read_text(), 'old')
+        self.assertNotIn('custom', self.site_meta('richmond'))
+        self.assertIn('shared', self.site_meta('richmond'))
+        self.unpack(['richmond'], overwrite=True)
+        self.assertEqual((existing / 'block.utl').read_text(), 'a')
+        self.assertEqual(self.site_meta('richmond')["custom"]["version"], '1.0')
+
+    def test_failure(self):
+        """Test that the first failure is raised after every package has been tried, and those
+        unpacked are recorded.
+
+        """
+        def extract(zip_file, *args):
+            """Fails for one file."""
+            if zip_file.name == 'block_custom.zip':
+                raise OSError("disk full")
+            extract_package(zip_file, *args)
+
+        with mock.patch('unpack_zip_files.extract_package', side_effect=extract):
+            with self.assertRaises(OSError):
+                self.unpack(['richmond', 'tulsa'], jobs=4)
+        self.assertListEqual(sorted(self.site_meta('richmond')), ['ed-base', 'richmond', 'shared'])
+        self.assertListEqual(sorted(self.site_meta('tulsa')), ['other', 'shared', 'tulsa'])
+
+
+if __name__ == '__main__':
+    utl_parse_test.main()
+
+# Local Variables:
+# python-indent-offset: 4
+# fill-column: 100
+# indent-tabs-mode: nil
+# End: